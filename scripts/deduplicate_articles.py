@@ -93,22 +93,28 @@ def deduplicate_group(group: Dict[str, Any], dry_run: bool = False) -> int:
         logger.info(f"[DRY RUN] {len(delete_articles)}개 기사 삭제 예정")
         return len(delete_articles)
 
-    deleted_count = 0
+    delete_ids = [article["id"] for article in delete_articles]
 
-    for article in delete_articles:
-        try:
-            result = client.client.table("articles").delete().eq("id", article["id"]).execute()
+    try:
+        # 그룹 내 삭제 대상을 한 번의 DELETE로 처리하고, 삭제된 행 대신 건수만 반환받음
+        result = (
+            client.client.table("articles")
+            .delete(count="exact", returning="minimal")
+            .in_("id", delete_ids)
+            .execute()
+        )
+        deleted_count = result.count or 0
 
-            if result.data:
-                deleted_count += 1
-                logger.debug(f"기사 삭제 완료: {article['id']}")
-            else:
-                logger.warning(f"기사 삭제 실패: {article['id']}")
+        if deleted_count < len(delete_ids):
+            logger.warning(f"일부 기사 삭제 실패: {deleted_count}/{len(delete_ids)}개 삭제")
+        else:
+            logger.debug("기사 삭제 완료: %s", delete_ids)
 
-        except Exception as e:
-            logger.error(f"기사 삭제 오류 [{article['id']}]: {e}")
+        return deleted_count
 
-    return deleted_count
+    except Exception as e:
+        logger.error(f"기사 삭제 오류 {delete_ids}: {e}")
+        return 0
 
 
 def main():
@@ -13,6 +13,8 @@ class Settings:
 
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+    # Supabase HTTP 커넥션 풀 최대 연결 수 (keep-alive 연결은 절반까지 유지)
+    SUPABASE_POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", "64"))
 
     NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
     NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
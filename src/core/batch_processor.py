@@ -13,6 +13,12 @@ from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 배치 요청 생성(PromptGenerator)에 필요한 기사 컬럼
+PENDING_ARTICLE_COLUMNS = "id, title, content"
+
+# 배치 조회 시 사용하는 컬럼 (idx_batch_in_progress_covering 인덱스에 포함된 컬럼)
+BATCH_COLUMNS = "id, batch_id, status, article_count, created_at"
+
 
 class BatchProcessor:
     """배치 처리 핵심 로직"""
@@ -44,7 +50,7 @@ class BatchProcessor:
         try:
             response = (
                 self.supabase.client.table("batch")
-                .select("*")
+                .select(BATCH_COLUMNS)
                 .eq("status", "in_progress")
                 .order("created_at", desc=False)
                 .execute()
@@ -128,7 +134,7 @@ class BatchProcessor:
         try:
             response = (
                 self.supabase.client.table("batch")
-                .select("*")
+                .select(BATCH_COLUMNS)
                 .eq("status", "in_progress")
                 .order("created_at", desc=False)
                 .execute()
@@ -161,7 +167,7 @@ class BatchProcessor:
         try:
             response = (
                 self.supabase.client.table("articles")
-                .select("*")
+                .select(PENDING_ARTICLE_COLUMNS)
                 .is_("clickbait_score", "null")
                 .order("created_at", desc=False)
                 .limit(limit)
@@ -377,7 +383,7 @@ class BatchProcessor:
                         "clickbait_explanation": validated_data["clickbait_explanation"],
                     }
                     updates.append(update)
-                    logger.debug(f"Result {i} (article {article_id}): Successfully parsed")
+                    logger.debug("Result %d (article %s): Successfully parsed", i, article_id)
                 else:
                     error_msg = f"Result {i} (article {article_id}): Invalid response data - validation failed"
                     logger.error(error_msg)
@@ -483,7 +489,7 @@ class BatchProcessor:
                 logger.warning("This indicates a race condition was caught by database constraints")
 
                 try:
-                    existing = self.supabase.client.table("batch").select("*").eq("batch_id", batch_id).execute()
+                    existing = self.supabase.client.table("batch").select(BATCH_COLUMNS).eq("batch_id", batch_id).execute()
 
                     if existing.data:
                         logger.info("Found existing batch created by concurrent instance")
@@ -580,7 +586,7 @@ class BatchProcessor:
         is_valid = new_status in allowed_next_statuses
 
         if not is_valid:
-            logger.debug(f"Status transition validation: {current_status} -> {new_status} = {is_valid}")
+            logger.debug("Status transition validation: %s -> %s = %s", current_status, new_status, is_valid)
 
         return is_valid
 
@@ -596,7 +602,7 @@ class BatchProcessor:
         """
         try:
             batch = self.openai_client.get_batch_status(batch_id)
-            logger.debug(f"Batch {batch_id} status: {batch.status}")
+            logger.debug("Batch %s status: %s", batch_id, batch.status)
             return batch.status
 
         except Exception as e:
@@ -614,7 +620,7 @@ class BatchProcessor:
             배치 정보 또는 None
         """
         try:
-            response = self.supabase.client.table("batch").select("*").eq("batch_id", batch_id).execute()
+            response = self.supabase.client.table("batch").select(BATCH_COLUMNS).eq("batch_id", batch_id).execute()
 
             if response.data:
                 return response.data[0]
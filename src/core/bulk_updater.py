@@ -2,13 +2,16 @@
 벌크 업데이트 모듈
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from src.utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# 기사 점수 일괄 업데이트 RPC (supabase/migrations 참고)
+BULK_UPDATE_RPC = "bulk_update_article_scores"
+
 
 class BulkUpdater:
     """벌크 업데이트 처리기"""
@@ -22,14 +25,17 @@ class BulkUpdater:
 
     def bulk_update_articles(self, updates: List[Dict[str, Any]], batch_size: int = 500) -> bool:
         """
-        Article 테이블 벌크 업데이트 (개별 UPDATE 방식, 멱등성 보장)
+        Article 테이블 벌크 업데이트 (청크 단위 RPC 일괄 UPDATE, 멱등성 보장)
+
+        bulk_update_article_scores RPC로 청크마다 한 번의 요청으로 업데이트하고,
+        RPC 호출이 실패한 청크는 개별 UPDATE로 폴백합니다.
 
         Args:
             updates: 업데이트할 데이터 리스트 (id, clickbait_score, clickbait_explanation 포함)
             batch_size: 한 번에 처리할 배치 크기
 
         Returns:
-            성공 여부
+            성공 여부 (모든 업데이트가 오류로 실패한 경우 False)
         """
         if not updates:
             logger.warning("No updates to process")
@@ -49,52 +55,86 @@ class BulkUpdater:
                 skipped_count = len(updates) - len(filtered_updates)
                 logger.info(f"Idempotency check: skipped {skipped_count} already processed articles")
 
-            # 개별 업데이트 방식으로 처리 (upsert 대신 update 사용)
-            total_processed = 0
-
-            # updated_at 필드 추가
-            current_time = datetime.now().isoformat()
-            for update in filtered_updates:
-                update["updated_at"] = current_time
-
-            # 개별 업데이트 수행
+            # 특정 필드만 업데이트 (기존 데이터 보존)
+            rows = []
             for i, update in enumerate(filtered_updates, 1):
-                try:
-                    article_id = update.get("id")
-                    if not article_id:
-                        logger.warning(f"Update item {i} missing ID, skipping")
-                        continue
-
-                    # 특정 필드만 업데이트 (기존 데이터 보존)
-                    update_data = {
+                if not update.get("id"):
+                    logger.warning(f"Update item {i} missing ID, skipping")
+                    continue
+                rows.append(
+                    {
+                        "id": update["id"],
                         "clickbait_score": update.get("clickbait_score"),
                         "clickbait_explanation": update.get("clickbait_explanation"),
-                        "updated_at": update.get("updated_at"),
                     }
+                )
 
-                    response = self.supabase.client.table("articles").update(update_data).eq("id", article_id).execute()
+            total_processed = 0
+            total_failed = 0
+            total_chunks = (len(rows) + batch_size - 1) // batch_size
 
-                    if response.data:
-                        total_processed += 1
-                        if i % 50 == 0:  # 50개마다 진행상황 로깅
-                            logger.info(f"Progress: {i}/{len(filtered_updates)} articles updated")
-                    else:
-                        logger.warning(f"No article found with ID: {article_id}")
+            for i in range(0, len(rows), batch_size):
+                chunk = rows[i : i + batch_size]
+                chunk_no = i // batch_size + 1
+
+                try:
+                    response = self.supabase.client.rpc(BULK_UPDATE_RPC, {"p_updates": chunk}).execute()
+                    updated_count = response.data if isinstance(response.data, int) else len(chunk)
+                    total_processed += updated_count
+                    logger.info(f"Progress: chunk {chunk_no}/{total_chunks} updated {updated_count} articles")
 
                 except Exception as e:
-                    logger.error(f"Failed to update article {article_id}: {e}")
-                    continue
+                    logger.warning(f"Bulk update RPC failed for chunk {chunk_no}/{total_chunks}, falling back: {e}")
+                    processed, failed = self._update_articles_individually(chunk)
+                    total_processed += processed
+                    total_failed += failed
 
             logger.info(f"Bulk update completed: {total_processed}/{len(filtered_updates)} articles updated")
             logger.info(
                 f"Total operation: {total_processed} new updates, {len(updates) - len(filtered_updates)} skipped (idempotent)"
             )
-            return total_processed > 0 or len(updates) > 0  # 성공 조건 수정: 스킵된 것도 성공으로 간주
+            # 스킵/미존재 기사는 성공으로 간주하되, 모든 업데이트가 오류로 실패하면 실패 처리
+            return not rows or total_failed < len(rows)
 
         except Exception as e:
             logger.error(f"Bulk update failed: {e}")
             return False
 
+    def _update_articles_individually(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        기사별 개별 UPDATE (RPC 실패 시 폴백)
+
+        Args:
+            rows: id, clickbait_score, clickbait_explanation을 포함한 업데이트 행 리스트
+
+        Returns:
+            (업데이트 성공 수, 오류 수) 튜플
+        """
+        processed = 0
+        failed = 0
+        current_time = datetime.now().isoformat()
+
+        for row in rows:
+            article_id = row["id"]
+            try:
+                update_data = {
+                    "clickbait_score": row["clickbait_score"],
+                    "clickbait_explanation": row["clickbait_explanation"],
+                    "updated_at": current_time,
+                }
+                response = self.supabase.client.table("articles").update(update_data).eq("id", article_id).execute()
+
+                if response.data:
+                    processed += 1
+                else:
+                    logger.warning(f"No article found with ID: {article_id}")
+
+            except Exception as e:
+                failed += 1
+                logger.error(f"Failed to update article {article_id}: {e}")
+
+        return processed, failed
+
     def _filter_already_processed_articles(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         이미 처리된 기사들을 필터링 (멱등성 보장)
@@ -116,7 +156,7 @@ class BulkUpdater:
                 logger.warning("No valid article IDs in updates")
                 return []
 
-            logger.debug(f"Checking processing status for {len(article_ids)} articles")
+            logger.debug("Checking processing status for %d articles", len(article_ids))
 
             # 이미 clickbait_score가 있는 기사들 조회
             response = (
@@ -132,12 +172,12 @@ class BulkUpdater:
 
             if processed_ids:
                 logger.info(f"Found {len(processed_ids)} already processed articles")
-                logger.debug(f"Already processed IDs: {list(processed_ids)[:10]}...")  # 처음 10개만 로깅
+                logger.debug("Already processed IDs: %s...", list(processed_ids)[:10])  # 처음 10개만 로깅
 
             # 아직 처리되지 않은 기사들만 필터링
             filtered_updates = [update for update in updates if update.get("id") and update["id"] not in processed_ids]
 
-            logger.debug(f"Filtered result: {len(filtered_updates)} articles need processing")
+            logger.debug("Filtered result: %d articles need processing", len(filtered_updates))
             return filtered_updates
 
         except Exception as e:
@@ -155,7 +195,7 @@ class BulkUpdater:
         Returns:
             검증된 업데이트 데이터
         """
-        logger.debug(f"Validating {len(updates)} update items")
+        logger.debug("Validating %d update items", len(updates))
 
         valid_updates = []
 
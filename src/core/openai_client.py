@@ -2,11 +2,9 @@
 OpenAI 클라이언트 모듈
 """
 
-import json
-import tempfile
-from typing import List, Dict, Any, Optional
-from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional
 
+import orjson
 from openai import OpenAI
 from openai.types import Batch
 
@@ -37,32 +35,21 @@ class OpenAIClient:
         """
         logger.info(f"Creating batch with {len(batch_requests)} requests")
 
-        # JSONL 파일 생성
-        jsonl_content = "\n".join(json.dumps(req) for req in batch_requests)
+        # JSONL 파일 생성 (orjson으로 바이트 직렬화)
+        jsonl_content = b"\n".join(orjson.dumps(req) for req in batch_requests)
 
-        # 임시 파일로 JSONL 저장
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
-            f.write(jsonl_content)
-            temp_file_path = f.name
+        # 임시 파일을 거치지 않고 메모리의 JSONL 바이트를 바로 업로드
+        uploaded_file = self.client.files.create(file=("batch_requests.jsonl", jsonl_content), purpose="batch")
 
-        try:
-            # 파일 업로드
-            with open(temp_file_path, "rb") as file:
-                uploaded_file = self.client.files.create(file=file, purpose="batch")
+        logger.info(f"File uploaded successfully: {uploaded_file.id}")
 
-            logger.info(f"File uploaded successfully: {uploaded_file.id}")
+        # 배치 생성
+        batch = self.client.batches.create(
+            input_file_id=uploaded_file.id, endpoint="/v1/chat/completions", completion_window="24h"
+        )
 
-            # 배치 생성
-            batch = self.client.batches.create(
-                input_file_id=uploaded_file.id, endpoint="/v1/chat/completions", completion_window="24h"
-            )
-
-            logger.info(f"Batch created successfully: {batch.id}")
-            return batch
-
-        finally:
-            # 임시 파일 정리
-            Path(temp_file_path).unlink(missing_ok=True)
+        logger.info(f"Batch created successfully: {batch.id}")
+        return batch
 
     def get_batch_status(self, batch_id: str) -> Batch:
         """
@@ -74,7 +61,7 @@ class OpenAIClient:
         Returns:
             배치 객체
         """
-        logger.debug(f"Retrieving batch status: {batch_id}")
+        logger.debug("Retrieving batch status: %s", batch_id)
         return self.client.batches.retrieve(batch_id)
 
     def get_batch_results(self, batch_id: str) -> List[Dict[str, Any]]:
@@ -87,6 +74,20 @@ class OpenAIClient:
         Returns:
             파싱된 결과 리스트
         """
+        results = list(self.iter_batch_results(batch_id))
+        logger.info(f"Downloaded and parsed {len(results)} results")
+        return results
+
+    def iter_batch_results(self, batch_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        배치 결과를 스트리밍으로 다운로드하며 한 줄씩 파싱 (결과 파일 전체를 메모리에 올리지 않음)
+
+        Args:
+            batch_id: 배치 ID
+
+        Yields:
+            파싱된 결과
+        """
         logger.info(f"Downloading batch results: {batch_id}")
 
         # 배치 상태 확인
@@ -98,22 +99,15 @@ class OpenAIClient:
         if not batch.output_file_id:
             raise ValueError("No output file available for this batch")
 
-        # 결과 파일 다운로드
-        result_content = self.client.files.content(batch.output_file_id)
-
-        # JSONL 파싱
-        results = []
-        for line in result_content.content.decode("utf-8").strip().split("\n"):
-            if line.strip():
-                try:
-                    result = json.loads(line)
-                    results.append(result)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse result line: {line[:100]}... Error: {e}")
-                    continue
-
-        logger.info(f"Downloaded and parsed {len(results)} results")
-        return results
+        # 결과 파일 스트리밍 다운로드 및 JSONL 파싱
+        with self.client.files.with_streaming_response.content(batch.output_file_id) as response:
+            for line in response.iter_lines():
+                if line.strip():
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"Failed to parse result line: {line[:100]}... Error: {e}")
+                        continue
 
     def cancel_batch(self, batch_id: str) -> Batch:
         """
@@ -138,7 +132,7 @@ class OpenAIClient:
         Returns:
             배치 리스트
         """
-        logger.debug(f"Listing batches (limit: {limit})")
+        logger.debug("Listing batches (limit: %s)", limit)
 
         batches = []
         for batch in self.client.batches.list(limit=limit):
@@ -2,7 +2,7 @@
 프롬프트 생성 모듈
 """
 
-import json
+import orjson
 from typing import List, Dict, Any
 
 from src.utils.logging_utils import get_logger
@@ -20,6 +20,25 @@ CLICKBAIT_EVALUATION_SCHEMA = {
     "additionalProperties": False,
 }
 
+# 배치 요청에 사용하는 모델
+BATCH_MODEL = "gpt-4o-mini"
+
+# 모든 배치 요청이 공유하는 시스템 메시지 (기사마다 새로 만들지 않도록 모듈 상수로 유지)
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "당신은 뉴스의 제목과 내용을 분석하여 클릭베이트 여부를 판단하는 전문가입니다. 주어진 뉴스 제목과 본문 내용을 분석하여 해당 기사의 제목이 클릭베이트인지 여부를 판단하고, 그 정도를 0에서 100 사이의 정수로 평가해주세요. 객관적이고 일관된 기준으로 평가해주세요.",
+}
+
+# 모든 배치 요청이 공유하는 구조화 출력 형식
+CLICKBAIT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "clickbait_evaluation",
+        "strict": True,
+        "schema": CLICKBAIT_EVALUATION_SCHEMA,
+    },
+}
+
 
 class PromptGenerator:
     """OpenAI API 프롬프트 생성기"""
@@ -113,22 +132,9 @@ class PromptGenerator:
                 "method": "POST",
                 "url": "/v1/chat/completions",
                 "body": {
-                    "model": "gpt-4o-mini",
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "당신은 뉴스의 제목과 내용을 분석하여 클릭베이트 여부를 판단하는 전문가입니다. 주어진 뉴스 제목과 본문 내용을 분석하여 해당 기사의 제목이 클릭베이트인지 여부를 판단하고, 그 정도를 0에서 100 사이의 정수로 평가해주세요. 객관적이고 일관된 기준으로 평가해주세요.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    "response_format": {
-                        "type": "json_schema",
-                        "json_schema": {
-                            "name": "clickbait_evaluation",
-                            "strict": True,
-                            "schema": CLICKBAIT_EVALUATION_SCHEMA,
-                        },
-                    },
+                    "model": BATCH_MODEL,
+                    "messages": [SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                    "response_format": CLICKBAIT_RESPONSE_FORMAT,
                 },
             }
 
@@ -148,7 +154,7 @@ class PromptGenerator:
             검증된 클릭베이트 데이터 또는 None
         """
         try:
-            data = json.loads(response_content)
+            data = orjson.loads(response_content)
 
             # 필수 필드 확인
             if "clickbait_score" not in data or "clickbait_explanation" not in data:
@@ -172,7 +178,7 @@ class PromptGenerator:
                 "clickbait_explanation": explanation.strip(),
             }
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"JSON decode error: {e}, content: {response_content}")
             return None
         except Exception as e:
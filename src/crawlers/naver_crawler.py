@@ -4,20 +4,82 @@
 
 import re
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from dateutil import parser as date_parser
 
 from src.models.article import Article
 from src.database.operations import DatabaseOperations
 from src.utils.logging_utils import get_logger
+from src.utils.ratelimit import TokenBucket
 from src.utils.text_utils import normalize_journalist_info, normalize_naver_url
 
 logger = get_logger(__name__)
 
+# 기사마다 타임존 객체를 다시 조회하지 않도록 모듈 로드 시 한 번만 생성
+KST = ZoneInfo("Asia/Seoul")
+
+# 네이버 검색 API pubDate 형식 (예: "Mon, 15 Jan 2024 10:30:00 +0900")
+NAVER_PUB_DATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+
+
+@lru_cache(maxsize=4096)
+def parse_pub_date(pub_date_str: str) -> datetime:
+    """
+    네이버 API 발행시간 문자열을 한국 시간 datetime으로 변환
+
+    같은 발행시간이 여러 기사에 반복되므로 결과를 캐시하고,
+    고정 형식은 strptime으로 먼저 파싱한 뒤 실패 시에만 dateutil로 처리합니다.
+
+    Args:
+        pub_date_str: 발행시간 문자열
+
+    Returns:
+        한국 시간 기준 발행시간
+    """
+    try:
+        pub_date = datetime.strptime(pub_date_str, NAVER_PUB_DATE_FORMAT)
+    except ValueError:
+        pub_date = date_parser.parse(pub_date_str)
+
+    return pub_date.astimezone(KST)
+
+
+# 바이라인 정리 패턴
+# 패턴 1: 공백 뒤에 오는 이메일 주소 제거
+BYLINE_TRAILING_EMAIL_PATTERN = re.compile(r"\s+\S+@\S+\.\S+$")
+# 패턴 2: 괄호 안의 이메일 주소와 괄호 제거
+BYLINE_PAREN_EMAIL_PATTERN = re.compile(r"\s*\(\S+@\S+\.\S+\)")
+# 패턴 3: 맨 뒤의 직함 제거
+BYLINE_TITLE_PATTERN = re.compile(r"\s+(기자|인턴기자|인턴|캐스터|기상캐스터|PD|리포터|편집장|외신캐스터)$")
+
+# API 응답의 HTML 엔티티/태그 및 본문의 연속 줄바꿈 패턴
+HTML_ENTITY_PATTERN = re.compile(r"&[^;]+;")
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+MULTI_NEWLINE_PATTERN = re.compile(r"\n{2,}")
+
+# 저장하는 본문 최대 길이
+MAX_CONTENT_LENGTH = 700
+
+# 검색 결과 한 페이지의 기사 본문을 동시에 가져올 최대 스레드 수
+ARTICLE_FETCH_WORKERS = 8
+
+# 기사 페이지 요청 속도 제한 (동시 요청을 써도 네이버 뉴스에 초당 요청 수가 몰리지 않도록 제한)
+ARTICLE_FETCH_RATE_PER_SECOND = 10.0
+ARTICLE_FETCH_BURST = ARTICLE_FETCH_WORKERS
+
+# 세션이 keep-alive 연결을 유지할 호스트 수 (검색 API, 뉴스, 연예 뉴스 등)
+SESSION_POOL_HOSTS = 4
+
+# 모든 크롤러 인스턴스와 선요청 스레드가 공유하는 기사 페이지 요청 속도 제한기
+_article_fetch_bucket = TokenBucket(ARTICLE_FETCH_RATE_PER_SECOND, ARTICLE_FETCH_BURST)
+
 
 class NaverNewsCrawler:
     """네이버 뉴스 크롤러"""
@@ -34,8 +96,15 @@ class NaverNewsCrawler:
         self.client_secret = client_secret
         self.db_ops = DatabaseOperations()
         self.session = requests.Session()
+        # 호스트별 연결 풀을 동시 요청 수만큼 유지해 검색 API·기사 요청 간 TCP/TLS 연결 재사용
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=SESSION_POOL_HOSTS, pool_maxsize=ARTICLE_FETCH_WORKERS)
+        )
         self.session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"})
 
+        # 미리 동시에 받아 둔 기사 페이지 본문 (정규화된 URL → 응답 바이트)
+        self._prefetched_pages: Dict[str, bytes] = {}
+
         # API 설정
         self.api_url = "https://openapi.naver.com/v1/search/news.json"
         self.api_headers = {"X-Naver-Client-Id": self.client_id, "X-Naver-Client-Secret": self.client_secret}
@@ -139,19 +208,10 @@ class NaverNewsCrawler:
         if bylines:
             reporter = bylines[0].text
 
-            # 패턴 1: 공백 뒤에 오는 이메일 주소 제거
-            pattern1 = r"\s+\S+@\S+\.\S+$"
-
-            # 패턴 2: 괄호 안의 이메일 주소와 괄호 제거
-            pattern2 = r"\s*\(\S+@\S+\.\S+\)"
-
-            # 패턴 3: 맨 뒤의 직함 제거
-            pattern3 = r"\s+(기자|인턴기자|인턴|캐스터|기상캐스터|PD|리포터|편집장|외신캐스터)$"
-
             # 패턴 순차적으로 적용
-            reporter = re.sub(pattern1, "", reporter)
-            reporter = re.sub(pattern2, "", reporter)
-            reporter = re.sub(pattern3, "", reporter)
+            reporter = BYLINE_TRAILING_EMAIL_PATTERN.sub("", reporter)
+            reporter = BYLINE_PAREN_EMAIL_PATTERN.sub("", reporter)
+            reporter = BYLINE_TITLE_PATTERN.sub("", reporter)
 
             return reporter.strip()
 
@@ -170,17 +230,17 @@ class NaverNewsCrawler:
         # 일반적인 네이버 뉴스 본문 요소 시도
         article = soup.find("article", class_="_article_content")
         if article:
-            return self.clean_content(article.text)
+            return self.clean_content_strings(article.strings)
 
         # 다른 본문 요소 타입 시도
         article = soup.find("div", id="newsct_article")
         if article:
-            return self.clean_content(article.text)
+            return self.clean_content_strings(article.strings)
 
         # 스포츠 뉴스 본문 요소 시도
         article = soup.find("div", id="newsEndContents")
         if article:
-            return self.clean_content(article.text)
+            return self.clean_content_strings(article.strings)
 
         # 기존 방식들도 시도
         content_selectors = [
@@ -198,8 +258,7 @@ class NaverNewsCrawler:
                 for unwanted in content_elem.find_all(["script", "style"]):
                     unwanted.decompose()
 
-                content = content_elem.get_text(strip=True)
-                return self.clean_content(content)
+                return self.clean_content_strings(content_elem.stripped_strings)
 
         return ""
 
@@ -214,16 +273,45 @@ class NaverNewsCrawler:
             정리된 텍스트
         """
         # 연속된 줄바꿈을 하나로 통합
-        text = re.sub(r"\n{2,}", "\n", text)
+        text = MULTI_NEWLINE_PATTERN.sub("\n", text)
         # 앞뒤 공백 제거
         text = text.strip()
 
         # 최대 700자로 제한
-        if len(text) > 700:
-            text = text[:700]
+        if len(text) > MAX_CONTENT_LENGTH:
+            text = text[:MAX_CONTENT_LENGTH]
 
         return text
 
+    def clean_content_strings(self, strings: Iterable[str]) -> str:
+        """
+        텍스트 조각을 필요한 만큼만 모아 본문 정리 (clean_content와 동일한 결과)
+
+        본문 전체 문자열을 만들지 않고, 정리된 앞부분이 최대 길이를 넘는 순간 순회를 멈춥니다.
+
+        Args:
+            strings: 본문 요소의 텍스트 조각 (예: Tag.strings)
+
+        Returns:
+            정리된 텍스트
+        """
+        chunks = []
+        collected = 0
+        check_at = MAX_CONTENT_LENGTH + 1
+
+        for piece in strings:
+            chunks.append(piece)
+            collected += len(piece)
+
+            if collected >= check_at:
+                # 앞부분만 정리해도 최대 길이 이후에 공백이 아닌 문자가 있으면 결과가 확정됨
+                text = MULTI_NEWLINE_PATTERN.sub("\n", "".join(chunks)).lstrip()
+                if len(text.rstrip()) > MAX_CONTENT_LENGTH:
+                    return text[:MAX_CONTENT_LENGTH]
+                check_at = collected * 2
+
+        return self.clean_content("".join(chunks))
+
     def extract_article_content(self, naver_url: str) -> Optional[Article]:
         """
         네이버 뉴스에서 제목, 기자명, 출판사명, 본문 추출
@@ -235,10 +323,12 @@ class NaverNewsCrawler:
             크롤링 결과 객체 또는 None
         """
         try:
-            response = self.session.get(naver_url, timeout=30)
-            response.raise_for_status()
+            page_content = self._prefetched_pages.pop(naver_url, None)
+            if page_content is None:
+                page_content = self._fetch_page(naver_url)
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            # C 기반 lxml 파서 사용 (순수 파이썬 html.parser 대비 파싱 비용 절감)
+            soup = BeautifulSoup(page_content, "lxml")
 
             title = self.get_title(soup)
             content = self.get_content(soup)
@@ -264,6 +354,69 @@ class NaverNewsCrawler:
             logger.error(f"본문 추출 실패 {naver_url}: {e}")
             return None
 
+    def _fetch_page(self, naver_url: str) -> bytes:
+        """
+        기사 페이지 HTML 요청
+
+        Args:
+            naver_url: 네이버 뉴스 URL
+
+        Returns:
+            응답 본문 바이트
+        """
+        _article_fetch_bucket.acquire()
+        response = self.session.get(naver_url, timeout=30)
+        response.raise_for_status()
+        return response.content
+
+    def prefetch_article_pages(self, items: List[Dict[str, Any]], target_date: Optional[datetime] = None) -> int:
+        """
+        검색 결과 아이템들의 기사 페이지를 동시에 받아 두어 parse_api_item의 순차 요청 대기를 없앰
+
+        Args:
+            items: API 검색 결과 아이템 리스트
+            target_date: 특정 날짜 필터링 (해당 날짜 기사만 미리 요청)
+
+        Returns:
+            미리 받아 둔 페이지 수
+        """
+        urls = []
+        for item in items:
+            link = item.get("link", "")
+            if "news.naver.com" not in link:
+                continue
+
+            # 날짜 필터에서 걸러질 기사는 요청하지 않음
+            if target_date and item.get("pubDate"):
+                try:
+                    if parse_pub_date(item["pubDate"]).date() != target_date.date():
+                        continue
+                except (ValueError, OverflowError):
+                    pass
+
+            url = normalize_naver_url(link)
+            if url not in self._prefetched_pages:
+                urls.append(url)
+
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return 0
+
+        def fetch(url: str) -> Optional[bytes]:
+            try:
+                return self._fetch_page(url)
+            except Exception as e:
+                # 실패한 페이지는 parse_api_item에서 다시 요청하고 오류를 기록함
+                logger.debug("기사 페이지 선요청 실패 %s: %s", url, e)
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_WORKERS, len(urls))) as executor:
+            for url, page_content in zip(urls, executor.map(fetch, urls)):
+                if page_content is not None:
+                    self._prefetched_pages[url] = page_content
+
+        return len(self._prefetched_pages)
+
     def parse_api_item(self, item: Dict[str, Any]) -> Optional[Article]:
         """
         API 검색 결과 아이템을 Article 객체로 변환
@@ -275,9 +428,9 @@ class NaverNewsCrawler:
             Article 객체 또는 None
         """
         try:
-            # HTML 엔티티 디코딩 후 태그 제거
-            api_title = BeautifulSoup(re.sub(r"&[^;]+;", "", item["title"]), "html.parser").get_text()
-            description = BeautifulSoup(re.sub(r"&[^;]+;", "", item["description"]), "html.parser").get_text()
+            # HTML 엔티티 제거 후 태그 제거 (검색 결과 스니펫은 <b> 강조 태그뿐이므로 파서 없이 처리)
+            api_title = HTML_TAG_PATTERN.sub("", HTML_ENTITY_PATTERN.sub("", item["title"]))
+            description = HTML_TAG_PATTERN.sub("", HTML_ENTITY_PATTERN.sub("", item["description"]))
 
             # 네이버 뉴스 URL인지 확인
             # 원문 링크는 사용하지 않음 (네이버 URL 기준으로 처리)
@@ -286,7 +439,7 @@ class NaverNewsCrawler:
 
             naver_url = link if "news.naver.com" in link else None
             if not naver_url:
-                logger.debug(f"네이버 뉴스 링크가 아님: {link}")
+                logger.debug("네이버 뉴스 링크가 아님: %s", link)
                 return None
 
             # URL 정규화 (쿼리 파라미터/프래그먼트 제거 및 mnews→article 통일)
@@ -313,7 +466,7 @@ class NaverNewsCrawler:
 
             # 기사 제목이 9자 미만이면 None 반환
             if len(title.strip()) < 9:
-                logger.debug(f"제목이 너무 짧음(9자 미만): {title}")
+                logger.debug("제목이 너무 짧음(9자 미만): %s", title)
                 return None
 
             # 내용 길이 체크 및 제한
@@ -326,13 +479,8 @@ class NaverNewsCrawler:
                     logger.warning(f"내용이 너무 짧습니다: {title[:50]}...")
                     return None
 
-            # 발행시간 파싱
-            pub_date_str = item["pubDate"]
-            pub_date = date_parser.parse(pub_date_str)
-
-            # 한국 시간으로 변환
-            kst = pytz.timezone("Asia/Seoul")
-            pub_date = pub_date.astimezone(kst)
+            # 발행시간 파싱 (한국 시간으로 변환)
+            pub_date = parse_pub_date(item["pubDate"])
 
             article = Article(
                 title=title,
@@ -367,6 +515,8 @@ class NaverNewsCrawler:
             크롤링된 기사 리스트
         """
         all_articles = []
+        # 키워드 간에 겹치는 검색 결과를 다시 요청/파싱하지 않도록 이미 처리한 링크 기록
+        seen_links = set()
 
         for keyword in keywords:
             logger.info(f"키워드 크롤링 시작: {keyword}")
@@ -391,6 +541,24 @@ class NaverNewsCrawler:
                     current_batch_articles = []
                     should_stop = False
 
+                    # 이번 크롤링에서 이미 처리한 링크 제외 (링크가 없는 아이템은 그대로 처리)
+                    unseen_items = []
+                    for item in items:
+                        link = item.get("link")
+                        if link:
+                            link = normalize_naver_url(link)
+                            if link in seen_links:
+                                continue
+                            seen_links.add(link)
+                        unseen_items.append(item)
+
+                    if len(unseen_items) < len(items):
+                        logger.info(f"이전 키워드와 중복된 검색 결과 제외: {len(items) - len(unseen_items)}개")
+                    items = unseen_items
+
+                    # 기사 페이지를 동시에 미리 받아 두어 아이템별 순차 요청 대기를 제거
+                    self.prefetch_article_pages(items, target_date)
+
                     # 1단계: 기사 파싱 및 날짜 필터링
                     parsed_articles = []
                     for item in items:
@@ -416,32 +584,14 @@ class NaverNewsCrawler:
                                 continue
 
                         parsed_articles.append(article)
-                        # Rate limiting
-                        time.sleep(0.1)
 
-                        # 2단계: 배치 중복 체크
+                    # 중단 등으로 사용되지 않은 선요청 페이지 정리
+                    self._prefetched_pages.clear()
+
+                    # 2단계: 배치 중복 체크
                     if check_duplicates and parsed_articles:
                         # 2-1단계: 배치 내 중복 제거
-                        deduplicated_articles = []
-                        seen_urls = set()
-                        seen_content = set()
-
-                        for article in parsed_articles:
-                            is_duplicate = False
-
-                            if article.naver_url in seen_urls:
-                                is_duplicate = True
-                                logger.debug(f"배치 내 URL 중복 제거: {article.title[:50]}...")
-                            else:
-                                content_key = article.get_content_key()
-                                if content_key in seen_content:
-                                    is_duplicate = True
-                                    logger.debug(f"배치 내 내용 중복 제거: {article.title[:50]}...")
-
-                            if not is_duplicate:
-                                deduplicated_articles.append(article)
-                                seen_urls.add(article.naver_url)
-                                seen_content.add(article.get_content_key())
+                        deduplicated_articles = Article.dedupe(parsed_articles)
 
                         if len(deduplicated_articles) < len(parsed_articles):
                             logger.info(f"배치 내 중복 제거: {len(parsed_articles)}개 → {len(deduplicated_articles)}개")
@@ -452,7 +602,7 @@ class NaverNewsCrawler:
 
                         for article in deduplicated_articles:
                             if duplicate_map.get(normalize_naver_url(article.naver_url), False):
-                                logger.debug(f"DB 중복 스킵: {article.title[:50]}...")
+                                logger.debug("DB 중복 스킵: %.50s...", article.title)
                                 continue
                             current_batch_articles.extend([article])
                     else:
@@ -2,7 +2,10 @@
 데이터베이스 운영 모듈
 """
 
-from typing import List, Dict, Any, Optional
+import heapq
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
 
 from .supabase_client import get_supabase_client
@@ -12,12 +15,60 @@ from src.utils.text_utils import normalize_journalist_info, normalize_naver_url
 
 logger = get_logger(__name__)
 
+# 기자 평균 낚시 점수 산정에 사용하는 상위 기사 수 (journalist_article_stats 뷰와 동일)
+TOP_SCORES_FOR_AVG = 10
+
+# 통계 불일치 점검에 필요한 컬럼만 조회 (select("*") 대비 전송량 절감)
+JOURNALIST_STATS_COLUMNS = "id, name, publisher, article_count, avg_clickbait_score, max_score"
+JOURNALIST_ARTICLE_STATS_COLUMNS = "journalist_id, article_count, avg_clickbait_score, max_score"
+
+# 배치 청크 실패 시 개별 삽입을 동시에 실행할 최대 스레드 수
+INDIVIDUAL_INSERT_WORKERS = 8
+
+# 기자 일괄 조회/생성 RPC (supabase/migrations/20250801000700_get_or_create_journalists.sql)
+GET_OR_CREATE_JOURNALISTS_RPC = "get_or_create_journalists"
+# RPC 한 번에 전달할 최대 기자 수 (요청 본문으로 전달되므로 URL 길이 제한 없음)
+JOURNALIST_RPC_CHUNK_SIZE = 500
+
 
 class DatabaseOperations:
     """데이터베이스 연산 클래스"""
 
+    ANONYMOUS_JOURNALIST_PREFIX = "익명기자_"
+
     def __init__(self):
         self.client = get_supabase_client()
+        # 언론사별 익명 기자 정보 (첫 익명 기자 조회 시 일괄 로드)
+        self._anonymous_journalists: Optional[Dict[str, Dict[str, Any]]] = None
+        # 조회/생성한 기자 정보 ((name, publisher) -> 기자 정보, 같은 기자 재조회 시 DB 왕복 생략)
+        self._journalist_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _get_anonymous_journalists(self) -> Dict[str, Dict[str, Any]]:
+        """
+        언론사별 익명 기자 정보 맵 조회 (최초 1회만 DB 조회)
+
+        Returns:
+            {publisher: 익명 기자 정보} 딕셔너리
+        """
+        if self._anonymous_journalists is None:
+            try:
+                # LIKE에서 "_"는 임의의 한 글자이므로 이스케이프해 접두사를 그대로 일치시킴
+                prefix_pattern = self.ANONYMOUS_JOURNALIST_PREFIX.replace("_", r"\_")
+                result = (
+                    self.client.client.table("journalists").select("*").like("name", f"{prefix_pattern}%").execute()
+                )
+                # 해당 언론사의 익명 기자명("익명기자_{언론사}")과 정확히 일치하는 행만 사용
+                self._anonymous_journalists = {
+                    row["publisher"]: row
+                    for row in result.data
+                    if row["name"] == f"{self.ANONYMOUS_JOURNALIST_PREFIX}{row['publisher']}"
+                }
+                logger.debug("익명 기자 맵 로드 완료: %d개 언론사", len(self._anonymous_journalists))
+            except Exception as e:
+                logger.warning(f"익명 기자 맵 로드 실패 - 개별 조회로 진행합니다: {e}")
+                self._anonymous_journalists = {}
+
+        return self._anonymous_journalists
 
     # -----------------------------
     # Duplicates Checking Utilities
@@ -32,8 +83,14 @@ class DatabaseOperations:
         """
         try:
             nurl = normalize_naver_url(naver_url)
-            result = self.client.client.table("articles").select("id").eq("naver_url", nurl).execute()
-            return bool(result.data)
+            # 행 데이터 없이 개수만 조회 (HEAD 요청)
+            result = (
+                self.client.client.table("articles")
+                .select("id", count="exact", head=True)
+                .eq("naver_url", nurl)
+                .execute()
+            )
+            return bool(result.count)
         except Exception as e:
             logger.error(f"중복 체크 실패 [{naver_url}]: {e}")
             # 에러 시 보수적으로 신규로 간주하여 진행
@@ -50,12 +107,19 @@ class DatabaseOperations:
             return {}
 
         try:
-            # 중복 제거 및 정규화하여 효율화
-            unique_urls = list({normalize_naver_url(u) for u in naver_urls})
-            result = self.client.client.table("articles").select("naver_url").in_("naver_url", unique_urls).execute()
-
-            existing = {row["naver_url"] for row in result.data}
-            return {url: (url in existing) for url in naver_urls}
+            # 중복 제거 및 정규화하여 효율화 (입력 순서 유지)
+            normalized = {url: normalize_naver_url(url) for url in naver_urls}
+            unique_urls = list(dict.fromkeys(normalized.values()))
+
+            # URL 길이 제한을 피하기 위해 청크로 나누어 조회
+            CHUNK_SIZE = 100
+            existing = set()
+            for i in range(0, len(unique_urls), CHUNK_SIZE):
+                chunk = unique_urls[i : i + CHUNK_SIZE]
+                result = self.client.client.table("articles").select("naver_url").in_("naver_url", chunk).execute()
+                existing.update(row["naver_url"] for row in result.data)
+
+            return {url: (normalized[url] in existing) for url in naver_urls}
         except Exception as e:
             logger.error(f"배치 중복 체크 실패: {e}")
             # 에러 시 모두 신규로 간주
@@ -76,7 +140,18 @@ class DatabaseOperations:
         try:
             # 기자명과 언론사명 정규화
             name, publisher = normalize_journalist_info(name, publisher)
-            logger.debug(f"기자명 정규화 완료: {name} ({publisher})")
+            logger.debug("기자명 정규화 완료: %s (%s)", name, publisher)
+
+            # 익명 기자는 미리 로드한 맵에서 조회 (DB 왕복 생략)
+            is_anonymous = name == f"{self.ANONYMOUS_JOURNALIST_PREFIX}{publisher}"
+            if is_anonymous:
+                anonymous_journalist = self._get_anonymous_journalists().get(publisher)
+                if anonymous_journalist:
+                    return anonymous_journalist
+
+            cached_journalist = self._journalist_cache.get((name, publisher))
+            if cached_journalist:
+                return cached_journalist
 
             # 기존 기자 조회
             existing = (
@@ -89,7 +164,10 @@ class DatabaseOperations:
 
             if existing.data:
                 journalist_info = existing.data[0]
-                logger.debug(f"기존 기자 조회: {name} ({publisher}) - ID: {journalist_info['id']}")
+                logger.debug("기존 기자 조회: %s (%s) - ID: %s", name, publisher, journalist_info["id"])
+                if is_anonymous:
+                    self._get_anonymous_journalists()[publisher] = journalist_info
+                self._journalist_cache[(name, publisher)] = journalist_info
                 return journalist_info
 
             journalist = Journalist(name=name, publisher=publisher, naver_uuid=naver_uuid)
@@ -100,6 +178,9 @@ class DatabaseOperations:
             if result.data:
                 new_journalist = result.data[0]
                 logger.info(f"새 기자 생성: {name} ({publisher}) - ID: {new_journalist['id']}")
+                if is_anonymous:
+                    self._get_anonymous_journalists()[publisher] = new_journalist
+                self._journalist_cache[(name, publisher)] = new_journalist
                 return new_journalist
             else:
                 raise Exception("기자 생성 실패 - 응답 데이터 없음")
@@ -108,7 +189,9 @@ class DatabaseOperations:
             logger.error(f"기자 조회/생성 오류 [{name}, {publisher}]: {e}")
             raise
 
-    def get_or_create_journalists_batch(self, journalist_specs: List[tuple]) -> Dict[str, Dict[str, Any]]:
+    def get_or_create_journalists_batch(
+        self, journalist_specs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Dict[str, Any]]:
         """
         기자들을 배치로 조회/생성 (성능 최적화)
 
@@ -116,7 +199,7 @@ class DatabaseOperations:
             journalist_specs: (name, publisher) 튜플 리스트
 
         Returns:
-            키가 "name_publisher" 형태인 기자 정보 딕셔너리
+            키가 (name, publisher) 튜플인 기자 정보 딕셔너리
         """
         try:
             if not journalist_specs:
@@ -128,11 +211,9 @@ class DatabaseOperations:
 
             for name, publisher in journalist_specs:
                 # 기자명과 언론사명 정규화
-                name, publisher = normalize_journalist_info(name, publisher)
-
-                journalist_key = f"{name}_{publisher}"
+                journalist_key = normalize_journalist_info(name, publisher)
                 if journalist_key not in unique_keys:
-                    normalized_specs.append((name, publisher))
+                    normalized_specs.append(journalist_key)
                     unique_keys.add(journalist_key)
 
             if not normalized_specs:
@@ -140,6 +221,12 @@ class DatabaseOperations:
 
             logger.info(f"배치 기자 처리 시작: {len(normalized_specs)}명")
 
+            # RPC로 청크마다 한 번의 요청으로 조회/생성하고, 사용할 수 없으면 조회 후 생성 방식으로 폴백
+            journalists = self._get_or_create_journalists_rpc(normalized_specs)
+            if journalists is not None:
+                logger.info(f"배치 기자 처리 완료: 총 {len(journalists)}명")
+                return journalists
+
             # 2단계: 기존 기자들 일괄 조회 (진짜 배치 처리)
             existing_journalists = {}
             if normalized_specs:
@@ -175,10 +262,9 @@ class DatabaseOperations:
                         # 클라이언트에서 정확한 (name, publisher) 조합 필터링
                         chunk_combinations = set(chunk)
                         for journalist in result.data:
-                            journalist_combo = (journalist["name"], journalist["publisher"])
-                            if journalist_combo in chunk_combinations:
-                                key = f"{journalist['name']}_{journalist['publisher']}"
-                                existing_journalists[key] = journalist
+                            journalist_key = (journalist["name"], journalist["publisher"])
+                            if journalist_key in chunk_combinations:
+                                existing_journalists[journalist_key] = journalist
 
                     except Exception as e:
                         logger.error(f"배치 기자 조회 청크 실패: {e}")
@@ -195,8 +281,7 @@ class DatabaseOperations:
                                 )
 
                                 for journalist in result.data:
-                                    key = f"{journalist['name']}_{journalist['publisher']}"
-                                    existing_journalists[key] = journalist
+                                    existing_journalists[(journalist["name"], journalist["publisher"])] = journalist
 
                             except Exception as individual_e:
                                 logger.warning(f"개별 기자 조회 실패 [{name}, {publisher}]: {individual_e}")
@@ -205,22 +290,11 @@ class DatabaseOperations:
                 logger.info(f"기존 기자 조회 완료: {len(existing_journalists)}명")
 
             # 3단계: 새로 생성할 기자들 식별
-            new_journalists_data = []
-            for name, publisher in normalized_specs:
-                journalist_key = f"{name}_{publisher}"
-                if journalist_key not in existing_journalists:
-                    try:
-                        journalist = Journalist(name=name, publisher=publisher)
-                    except Exception as validation_error:
-                        # 방어 로직: 비정상 이름은 익명 기자로 대체
-                        safe_name = f"익명기자_{publisher}"
-                        logger.warning(
-                            f"무효 기자명 감지로 익명 처리: [{name}, {publisher}] -> {safe_name} ({validation_error})"
-                        )
-                        journalist = Journalist(name=safe_name, publisher=publisher)
-                        journalist_key = f"{safe_name}_{publisher}"
-
-                    new_journalists_data.append(journalist.to_dict())
+            new_journalists_data = [
+                self._build_journalist_row(name, publisher)
+                for name, publisher in normalized_specs
+                if (name, publisher) not in existing_journalists
+            ]
 
             # 4단계: 새 기자들 배치 생성
             if new_journalists_data:
@@ -240,10 +314,12 @@ class DatabaseOperations:
                         if result.data:
                             # 새로 생성된 기자들을 기존 기자 딕셔너리에 추가
                             for journalist in result.data:
-                                key = f"{journalist['name']}_{journalist['publisher']}"
-                                existing_journalists[key] = journalist
+                                existing_journalists[(journalist["name"], journalist["publisher"])] = journalist
                                 logger.debug(
-                                    f"새 기자 생성: {journalist['name']} ({journalist['publisher']}) - ID: {journalist['id']}"
+                                    "새 기자 생성: %s (%s) - ID: %s",
+                                    journalist["name"],
+                                    journalist["publisher"],
+                                    journalist["id"],
                                 )
                         else:
                             logger.error(f"배치 기자 생성 청크 {i // CHUNK_SIZE + 1} 실패 - 응답 데이터 없음")
@@ -259,9 +335,8 @@ class DatabaseOperations:
                                 )
                                 if individual_result.data:
                                     journalist = individual_result.data[0]
-                                    key = f"{journalist['name']}_{journalist['publisher']}"
-                                    existing_journalists[key] = journalist
-                                    logger.info(f"개별 기자 생성: {journalist['name']} ({journalist['publisher']})")
+                                    existing_journalists[(journalist["name"], journalist["publisher"])] = journalist
+                                    logger.info("개별 기자 생성: %s (%s)", journalist["name"], journalist["publisher"])
                             except Exception as individual_e:
                                 logger.error(
                                     f"개별 기자 생성 실패 [{journalist_data['name']}, {journalist_data['publisher']}]: {individual_e}"
@@ -275,6 +350,56 @@ class DatabaseOperations:
             logger.error(f"배치 기자 처리 오류: {e}")
             return {}
 
+    def _get_or_create_journalists_rpc(
+        self, journalist_specs: List[Tuple[str, str]]
+    ) -> Optional[Dict[Tuple[str, str], Dict[str, Any]]]:
+        """
+        get_or_create_journalists RPC로 기자 일괄 조회/생성
+
+        Args:
+            journalist_specs: 정규화된 (name, publisher) 튜플 리스트
+
+        Returns:
+            키가 (name, publisher) 튜플인 기자 정보 딕셔너리 (RPC 실패 시 None)
+        """
+        rows = [self._build_journalist_row(name, publisher) for name, publisher in journalist_specs]
+        journalists = {}
+
+        try:
+            for i in range(0, len(rows), JOURNALIST_RPC_CHUNK_SIZE):
+                result = self.client.client.rpc(
+                    GET_OR_CREATE_JOURNALISTS_RPC, {"p_journalists": rows[i : i + JOURNALIST_RPC_CHUNK_SIZE]}
+                ).execute()
+                for journalist in result.data:
+                    journalists[(journalist["name"], journalist["publisher"])] = journalist
+        except Exception as e:
+            logger.warning(f"기자 일괄 조회/생성 RPC 실패 - 조회 후 생성 방식으로 폴백합니다: {e}")
+            return None
+
+        return journalists
+
+    @staticmethod
+    def _build_journalist_row(name: str, publisher: str) -> Dict[str, Any]:
+        """
+        신규 기자 생성용 딕셔너리 생성 (검증 실패 시 익명 기자로 대체)
+
+        Args:
+            name: 정규화된 기자명
+            publisher: 정규화된 언론사
+
+        Returns:
+            기자 딕셔너리
+        """
+        try:
+            journalist = Journalist(name=name, publisher=publisher)
+        except Exception as validation_error:
+            # 방어 로직: 비정상 이름은 익명 기자로 대체
+            safe_name = f"익명기자_{publisher}"
+            logger.warning(f"무효 기자명 감지로 익명 처리: [{name}, {publisher}] -> {safe_name} ({validation_error})")
+            journalist = Journalist(name=safe_name, publisher=publisher)
+
+        return journalist.to_dict()
+
     def insert_article(self, article: Article) -> Dict[str, Any]:
         """
         기사 삽입
@@ -322,6 +447,8 @@ class DatabaseOperations:
 
         logger.info(f"배치 삽입 시작: {len(articles)}개 기사")
 
+        journalist_cache = {}
+
         try:
             # 1단계: 모든 기자 정보를 배치로 처리
             unique_journalists = []
@@ -339,80 +466,157 @@ class DatabaseOperations:
             # 배치로 기자 조회/생성
             journalist_cache = self.get_or_create_journalists_batch(unique_journalists)
 
-            # 2단계: 기사 데이터 준비 (배치 삽입용)
-            articles_data = []
-            skipped_count = 0
+            # 2단계: 배치 결과에 없는 기자만 개별 조회/생성으로 폴백
+            article_keys = [normalize_journalist_info(a.journalist_name, a.publisher) for a in articles]
+            failed_keys = set()
 
-            for article in articles:
-                # 기자명과 언론사명 정규화하여 캐시 키 생성
-                normalized_name, normalized_publisher = normalize_journalist_info(
-                    article.journalist_name, article.publisher
-                )
-                journalist_key = f"{normalized_name}_{normalized_publisher}"
-
-                # 캐시에 없으면 개별 조회/생성 폴백
-                if journalist_key not in journalist_cache:
-                    try:
-                        journalist_info = self.get_or_create_journalist(article.journalist_name, article.publisher)
-                        if journalist_info and journalist_info.get("id"):
-                            journalist_cache[journalist_key] = journalist_info
-                            logger.info(
-                                f"기자 캐시 폴백 성공: {journalist_info['name']} ({journalist_info['publisher']})"
-                            )
-                        else:
-                            raise ValueError("개별 기자 조회 결과가 비어있습니다")
-                    except Exception as e:
-                        logger.warning(
-                            f"기자 정보가 없어 기사 제외: {article.title[:50]}... (기자: {article.journalist_name}, 언론사: {article.publisher}, 오류: {e})"
+            for article, journalist_key in zip(articles, article_keys):
+                if journalist_key in journalist_cache or journalist_key in failed_keys:
+                    continue
+                try:
+                    journalist_info = self.get_or_create_journalist(article.journalist_name, article.publisher)
+                    if journalist_info and journalist_info.get("id"):
+                        journalist_cache[journalist_key] = journalist_info
+                        logger.info(
+                            "기자 캐시 폴백 성공: %s (%s)", journalist_info["name"], journalist_info["publisher"]
                         )
-                        skipped_count += 1
-                        continue
+                    else:
+                        raise ValueError("개별 기자 조회 결과가 비어있습니다")
+                except Exception as e:
+                    failed_keys.add(journalist_key)
+                    logger.warning(
+                        f"기자 정보가 없어 기사 제외: {article.title[:50]}... (기자: {article.journalist_name}, 언론사: {article.publisher}, 오류: {e})"
+                    )
 
-                # 기사에 기자 ID 설정
-                article.journalist_id = journalist_cache[journalist_key]["id"]
-                # URL 정규화 적용 (중복 삽입 방지)
-                article.naver_url = normalize_naver_url(article.naver_url)
-                article_data = article.to_dict()
-                articles_data.append(article_data)
+            # 3단계: 기사 데이터 준비 (배치 삽입용)
+            articles_data = [
+                self._prepare_article_row(article, journalist_cache[journalist_key]["id"])
+                for article, journalist_key in zip(articles, article_keys)
+                if journalist_key in journalist_cache
+            ]
+            skipped_count = len(articles) - len(articles_data)
+
+            # 배치 내 중복 URL 제거 (DB에 이미 있는 기사는 삽입 시 ON CONFLICT DO NOTHING으로 스킵)
+            unique_rows = {}
+            for article_data in articles_data:
+                unique_rows.setdefault(article_data["naver_url"], article_data)
+
+            duplicate_count = len(articles_data) - len(unique_rows)
+            articles_data = list(unique_rows.values())
 
             if not articles_data:
                 logger.warning("삽입할 수 있는 기사가 없습니다")
                 return []
 
-            logger.info(f"배치 삽입 준비 완료: {len(articles_data)}개 기사 (제외: {skipped_count}개)")
+            logger.info(
+                f"배치 삽입 준비 완료: {len(articles_data)}개 기사 (제외: {skipped_count}개, 중복: {duplicate_count}개)"
+            )
 
-            # 3단계: Supabase 배치 삽입 실행
-            result = self.client.client.table("articles").insert(articles_data).execute()
+            # 4단계: Supabase 배치 삽입 실행
+            # PostgREST 요청 크기 제한을 넘지 않도록 청크로 나누어 삽입하고,
+            # naver_url 유니크 인덱스로 이미 저장된 기사는 DB에서 원자적으로 스킵
+            CHUNK_SIZE = 500
+            total_chunks = (len(articles_data) + CHUNK_SIZE - 1) // CHUNK_SIZE
+            inserted_articles = []
 
-            if result.data:
-                inserted_count = len(result.data)
-                logger.info(f"배치 삽입 완료: {inserted_count}개 기사 성공")
+            for i in range(0, len(articles_data), CHUNK_SIZE):
+                chunk = articles_data[i : i + CHUNK_SIZE]
+                chunk_no = i // CHUNK_SIZE + 1
 
-                # 처리된 기자 정보 로깅
-                logger.info(f"처리된 기자 수: {len(journalist_cache)}명")
-                for journalist_key, journalist_info in journalist_cache.items():
-                    name, publisher = journalist_key.split("_", 1)
-                    logger.info(f"  - {name} ({publisher}): ID {journalist_info['id']}")
+                try:
+                    result = (
+                        self.client.client.table("articles")
+                        .upsert(chunk, on_conflict="naver_url", ignore_duplicates=True)
+                        .execute()
+                    )
 
-                return result.data
-            else:
-                logger.error("배치 삽입 실패 - 응답 데이터 없음")
-                return []
+                    inserted_articles.extend(result.data)
+                    logger.info(
+                        f"배치 삽입 청크 {chunk_no}/{total_chunks} 완료: {len(result.data)}개 기사 "
+                        f"(기존 기사 스킵: {len(chunk) - len(result.data)}개)"
+                    )
+
+                except Exception as e:
+                    error_msg = str(e)
+                    logger.error(f"배치 삽입 청크 {chunk_no}/{total_chunks} 실행 오류: {e}")
+
+                    # unique constraint 위반 오류인지 확인
+                    if "23505" in error_msg or "duplicate key value" in error_msg:
+                        logger.warning("배치 삽입 중 중복 키 오류 발생 - 개별 삽입으로 중복 항목 스킵")
+
+                    # 실패한 청크만 개별 삽입으로 폴백 (이미 변환된 행을 재사용해 기사 재변환/기자 재조회 생략)
+                    logger.info(f"청크 {chunk_no} 개별 삽입으로 폴백 시작...")
+                    inserted_articles.extend(self._insert_rows_individually(chunk))
+
+            logger.info(f"배치 삽입 완료: {len(inserted_articles)}/{len(articles_data)}개 기사 성공")
+
+            # 처리된 기자 정보 로깅
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("처리된 기자 수: %d명", len(journalist_cache))
+                for (name, publisher), journalist_info in journalist_cache.items():
+                    logger.info("  - %s (%s): ID %s", name, publisher, journalist_info["id"])
+
+            return inserted_articles
 
         except Exception as e:
-            error_msg = str(e)
             logger.error(f"배치 삽입 실행 오류: {e}")
 
-            # unique constraint 위반 오류인지 확인
-            if "23505" in error_msg or "duplicate key value" in error_msg:
-                logger.warning("배치 삽입 중 중복 키 오류 발생 - 개별 삽입으로 중복 항목 스킵")
-
             # 오류 발생 시 개별 삽입으로 폴백
             logger.info("개별 삽입으로 폴백 시작...")
             return self._fallback_individual_insert(articles, journalist_cache)
 
+    @staticmethod
+    def _prepare_article_row(article: Article, journalist_id: str) -> Dict[str, Any]:
+        """
+        기자 ID와 정규화된 URL을 설정한 뒤 삽입용 딕셔너리로 변환
+
+        Args:
+            article: 기사 객체
+            journalist_id: 기자 ID
+
+        Returns:
+            삽입용 기사 딕셔너리
+        """
+        article.journalist_id = journalist_id
+        # URL 정규화 적용 (중복 삽입 방지)
+        article.naver_url = normalize_naver_url(article.naver_url)
+        return article.to_dict()
+
+    def _insert_rows_individually(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        삽입용으로 변환된 기사 행을 한 건씩 삽입 (배치 청크 실패 시 폴백)
+
+        Args:
+            rows: _prepare_article_row로 변환된 기사 딕셔너리 리스트
+
+        Returns:
+            삽입된 기사 정보 리스트
+        """
+        if not rows:
+            return []
+
+        def insert_one(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                result = self.client.client.table("articles").insert(row).execute()
+
+                if result.data:
+                    logger.debug("기사 삽입 완료: %s...", row["title"][:50])
+                    return result.data[0]
+
+                logger.warning(f"기사 삽입 실패: {row['title'][:50]}... - 결과가 비어있습니다")
+            except Exception as e:
+                logger.error(f"기사 삽입 실패: {row['title'][:50]}... - {e}")
+            return None
+
+        # 서로 독립적인 단건 삽입이므로 동시에 실행해 왕복 지연을 겹침 (결과는 입력 순서 유지)
+        with ThreadPoolExecutor(max_workers=min(INDIVIDUAL_INSERT_WORKERS, len(rows))) as executor:
+            inserted_articles = [article for article in executor.map(insert_one, rows) if article is not None]
+
+        logger.info(f"개별 삽입 완료: {len(inserted_articles)}/{len(rows)}개 기사")
+        return inserted_articles
+
     def _fallback_individual_insert(
-        self, articles: List[Article], journalist_cache: Dict[str, Dict[str, Any]]
+        self, articles: List[Article], journalist_cache: Dict[Tuple[str, str], Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
         배치 삽입 실패 시 개별 삽입으로 폴백
@@ -431,8 +635,8 @@ class DatabaseOperations:
 
         for i, article in enumerate(articles, 1):
             try:
-                # 기자 캐시 키 생성 (이름 + 언론사)
-                journalist_key = f"{article.journalist_name}_{article.publisher}"
+                # 기자 캐시 키 생성 (정규화된 이름 + 언론사)
+                journalist_key = normalize_journalist_info(article.journalist_name, article.publisher)
 
                 # 캐시에서 기자 정보 조회 (이미 배치로 처리된 캐시 사용)
                 if journalist_key not in journalist_cache:
@@ -454,7 +658,7 @@ class DatabaseOperations:
 
                 if result.data:
                     inserted_articles.append(result.data[0])
-                    logger.debug(f"기사 삽입 완료 ({i}/{len(articles)}): {article.title[:50]}...")
+                    logger.debug("기사 삽입 완료 (%d/%d): %s...", i, len(articles), article.title[:50])
                 else:
                     error_msg = str(result.error) if result.error else "알 수 없는 오류"
                     logger.warning(f"기사 삽입 실패 ({i}/{len(articles)}): {article.title[:50]}... - {error_msg}")
@@ -466,20 +670,22 @@ class DatabaseOperations:
         logger.info(f"개별 삽입 완료: {len(inserted_articles)}/{len(articles)}개 기사")
         return inserted_articles
 
-    def get_unprocessed_articles(self, limit: int = 1000) -> List[Dict[str, Any]]:
+    def get_unprocessed_articles(self, limit: int = 1000, after_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        미처리 기사 조회 (clickbait_score가 null인 기사)
+        미처리 기사 조회 (clickbait_score가 null인 기사, id 순 키셋 페이지네이션)
 
         Args:
             limit: 조회 제한 수
+            after_id: 이전 페이지의 마지막 기사 ID (지정 시 그 다음 기사부터 조회)
 
         Returns:
             미처리 기사 리스트
         """
         try:
-            result = (
-                self.client.client.table("articles").select("*").is_("clickbait_score", "null").limit(limit).execute()
-            )
+            query = self.client.client.table("articles").select("*").is_("clickbait_score", "null").order("id")
+            if after_id is not None:
+                query = query.gt("id", after_id)
+            result = query.limit(limit).execute()
 
             logger.info(f"미처리 기사 조회: {len(result.data)}개")
             return result.data
@@ -488,6 +694,45 @@ class DatabaseOperations:
             logger.error(f"미처리 기사 조회 오류: {e}")
             return []
 
+    def iter_unprocessed_articles(
+        self, batch_size: int = 256, columns: str = "id, title, content"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        미처리 기사를 키셋 페이지네이션으로 순회 (메모리 사용량을 batch_size 행으로 제한)
+
+        Args:
+            batch_size: 한 번에 조회할 기사 수
+            columns: 조회할 컬럼 (키셋 페이지네이션을 위해 id 포함 필수, 기본값은 점수 산정에 필요한 컬럼만)
+
+        Yields:
+            미처리 기사 딕셔너리
+        """
+        last_id = None
+        while True:
+            try:
+                query = (
+                    self.client.client.table("articles")
+                    .select(columns)
+                    .is_("clickbait_score", "null")
+                    .order("id")
+                    .limit(batch_size)
+                )
+                if last_id is not None:
+                    query = query.gt("id", last_id)
+                rows = query.execute().data
+            except Exception as e:
+                logger.error(f"미처리 기사 페이지 조회 오류 (last_id={last_id}): {e}")
+                return
+
+            if not rows:
+                return
+
+            yield from rows
+
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]["id"]
+
     def update_article_score(self, article_id: str, clickbait_score: int, clickbait_explanation: str) -> bool:
         """
         기사 낚시 점수 업데이트
@@ -524,12 +769,32 @@ class DatabaseOperations:
             logger.error(f"기사 점수 업데이트 오류: {e}")
             return False
 
-    def update_journalist_stats_manual(self, journalist_id: str) -> bool:
+    @staticmethod
+    def _compute_journalist_stats(scores: List[Optional[int]]) -> Tuple[int, float, int]:
+        """
+        기사 점수 목록으로 기자 통계 계산 (journalist_article_stats 뷰와 동일한 기준)
+
+        Args:
+            scores: 기자의 전체 기사 clickbait_score 리스트 (미처리 기사는 None)
+
+        Returns:
+            (기사 수, 상위 10개 기사 평균 점수, 최고 점수) 튜플
+        """
+        # clickbait_score가 높은 상위 10개 기사의 평균 (전체 기사 수가 10개 미만이면 전체)
+        # 전체 정렬 없이 상위 10개만 선택 (내림차순이므로 첫 번째가 최고 점수)
+        top_scores = heapq.nlargest(TOP_SCORES_FOR_AVG, (score for score in scores if score is not None))
+        if not top_scores:
+            return len(scores), 0.0, 0
+
+        return len(scores), round(sum(top_scores) / len(top_scores), 2), top_scores[0]
+
+    def update_journalist_stats_manual(self, journalist_id: str, updated_at: Optional[str] = None) -> bool:
         """
         특정 기자의 통계 수동 업데이트
 
         Args:
             journalist_id: 기자 ID
+            updated_at: 갱신 시각 (일괄 처리 시 호출자가 한 번 계산해 전달, 없으면 현재 시각)
 
         Returns:
             업데이트 성공 여부
@@ -548,19 +813,9 @@ class DatabaseOperations:
                 return False
 
             # 통계 계산
-            total_articles = len(result.data)
-            scored_articles = [article for article in result.data if article["clickbait_score"] is not None]
-
-            if scored_articles:
-                scores = [article["clickbait_score"] for article in scored_articles]
-                # clickbait_score가 높은 상위 10개 기사의 평균 계산
-                sorted_scores = sorted(scores, reverse=True)
-                top_scores = sorted_scores[:10]  # 상위 10개 (또는 전체 기사 수가 10개 미만이면 전체)
-                avg_score = sum(top_scores) / len(top_scores)
-                max_score = max(scores)
-            else:
-                avg_score = 0.0
-                max_score = 0
+            total_articles, avg_score, max_score = self._compute_journalist_stats(
+                [article["clickbait_score"] for article in result.data]
+            )
 
             # 기자 통계 업데이트
             update_result = (
@@ -568,9 +823,9 @@ class DatabaseOperations:
                 .update(
                     {
                         "article_count": total_articles,
-                        "avg_clickbait_score": round(avg_score, 2),
+                        "avg_clickbait_score": avg_score,
                         "max_score": max_score,
-                        "updated_at": datetime.now().isoformat(),
+                        "updated_at": updated_at or datetime.now().isoformat(),
                     }
                 )
                 .eq("id", journalist_id)
@@ -593,6 +848,9 @@ class DatabaseOperations:
         """
         모든 기자의 통계 일괄 업데이트
 
+        기자 통계는 articles 문장 단위 트리거(trigger_journalist_stats_after_*)가 기사 변경 시 갱신하므로,
+        이 메서드는 트리거 적용 이전 데이터 보정 등 전체 재계산이 필요할 때만 사용합니다.
+
         Returns:
             업데이트 결과 딕셔너리
         """
@@ -610,9 +868,12 @@ class DatabaseOperations:
 
             logger.info(f"총 {total_count}명의 기자 통계 업데이트 시작")
 
+            # 모든 기자에 동일한 갱신 시각 사용
+            updated_at = datetime.now().isoformat()
+
             for journalist in journalists_result.data:
                 try:
-                    if self.update_journalist_stats_manual(journalist["id"]):
+                    if self.update_journalist_stats_manual(journalist["id"], updated_at):
                         success_count += 1
                     else:
                         failed_count += 1
@@ -634,41 +895,57 @@ class DatabaseOperations:
         """
         기자 통계 요약 정보 조회
 
+        journalist_stats_summary RPC로 모든 카운트를 한 번에 조회하고,
+        RPC를 사용할 수 없으면 개별 카운트 쿼리로 폴백합니다.
+
         Returns:
             통계 요약 딕셔너리
         """
         try:
-            # 기자 총 수
-            journalists_result = self.client.client.table("journalists").select("id", count="exact").execute()
-            total_journalists = journalists_result.count
+            result = self.client.client.rpc("journalist_stats_summary").execute()
+            summary = result.data
+            if isinstance(summary, list):
+                summary = summary[0] if summary else None
 
-            # 기사가 있는 기자 수
-            active_journalists_result = (
-                self.client.client.table("journalists").select("id", count="exact").gt("article_count", 0).execute()
-            )
-            active_journalists = active_journalists_result.count
+            if summary:
+                summary = dict(summary)
+                summary.setdefault("pending_articles", summary["total_articles"] - summary["scored_articles"])
+                return summary
 
-            # 평균 점수가 있는 기자 수 (AI 분석 완료된 기사가 있는 기자)
-            scored_journalists_result = (
-                self.client.client.table("journalists")
-                .select("id", count="exact")
-                .gt("avg_clickbait_score", 0)
-                .execute()
-            )
-            scored_journalists = scored_journalists_result.count
+            logger.warning("통계 요약 RPC 응답 없음 - 개별 카운트 쿼리로 폴백합니다")
+        except Exception as e:
+            logger.warning(f"통계 요약 RPC 실패 - 개별 카운트 쿼리로 폴백합니다: {e}")
 
-            # 전체 기사 수
-            articles_result = self.client.client.table("articles").select("id", count="exact").execute()
-            total_articles = articles_result.count
+        return self._get_journalist_stats_summary_by_counts()
 
-            # AI 분석 완료된 기사 수
-            scored_articles_result = (
-                self.client.client.table("articles")
-                .select("id", count="exact")
-                .not_.is_("clickbait_score", "null")
-                .execute()
-            )
-            scored_articles = scored_articles_result.count
+    def _get_journalist_stats_summary_by_counts(self) -> Dict[str, Any]:
+        """
+        개별 카운트 쿼리로 기자 통계 요약 조회 (RPC 폴백용)
+
+        Returns:
+            통계 요약 딕셔너리
+        """
+        try:
+            journalists = self.client.client.table("journalists")
+            articles = self.client.client.table("articles")
+            count_queries = [
+                # 기자 총 수
+                journalists.select("id", count="exact", head=True),
+                # 기사가 있는 기자 수
+                journalists.select("id", count="exact", head=True).gt("article_count", 0),
+                # 평균 점수가 있는 기자 수 (AI 분석 완료된 기사가 있는 기자)
+                journalists.select("id", count="exact", head=True).gt("avg_clickbait_score", 0),
+                # 전체 기사 수
+                articles.select("id", count="exact", head=True),
+                # AI 분석 완료된 기사 수
+                articles.select("id", count="exact", head=True).not_.is_("clickbait_score", "null"),
+            ]
+
+            # 서로 독립적인 카운트 쿼리이므로 동시에 실행해 왕복 지연을 겹침
+            with ThreadPoolExecutor(max_workers=len(count_queries)) as executor:
+                counts = list(executor.map(lambda query: query.execute().count, count_queries))
+
+            total_journalists, active_journalists, scored_journalists, total_articles, scored_articles = counts
 
             return {
                 "total_journalists": total_journalists,
@@ -687,6 +964,8 @@ class DatabaseOperations:
         """
         통계 불일치 감지 및 수정 (Supabase 호환 방식)
 
+        트리거로 유지되는 기자 통계를 점검하는 감사(audit) 용도입니다.
+
         Returns:
             수정 결과 딕셔너리
         """
@@ -694,11 +973,14 @@ class DatabaseOperations:
             logger.info("통계 불일치 감지를 시작합니다...")
 
             # 모든 기자 정보 조회
-            journalists_result = self.client.client.table("journalists").select("*").execute()
+            journalists_result = self.client.client.table("journalists").select(JOURNALIST_STATS_COLUMNS).execute()
             if not journalists_result.data:
                 logger.info("기자가 없습니다")
                 return {"fixed": 0, "total_checked": 0}
 
+            # 기자별 실제 통계를 한 번의 GROUP BY 조회로 가져옴 (실패 시 기자별 개별 조회)
+            actual_stats = self._get_actual_journalist_stats()
+
             inconsistent_journalists = []
             total_checked = 0
 
@@ -709,27 +991,22 @@ class DatabaseOperations:
                 stored_avg = journalist.get("avg_clickbait_score", 0.0)
                 stored_max = journalist.get("max_score", 0)
 
-                # 해당 기자의 실제 기사 통계 계산
-                articles_result = (
-                    self.client.client.table("articles")
-                    .select("clickbait_score")
-                    .eq("journalist_id", journalist_id)
-                    .execute()
-                )
-
-                # 실제 값 계산
-                actual_count = len(articles_result.data)
-                scored_articles = [
-                    article for article in articles_result.data if article["clickbait_score"] is not None
-                ]
-
-                if scored_articles:
-                    scores = [article["clickbait_score"] for article in scored_articles]
-                    actual_avg = sum(scores) / len(scores)
-                    actual_max = max(scores)
+                # 해당 기자의 실제 기사 통계
+                if actual_stats is not None:
+                    stats = actual_stats.get(journalist_id, {})
+                    actual_count = stats.get("article_count", 0)
+                    actual_avg = stats.get("avg_clickbait_score", 0.0)
+                    actual_max = stats.get("max_score", 0)
                 else:
-                    actual_avg = 0.0
-                    actual_max = 0
+                    articles_result = (
+                        self.client.client.table("articles")
+                        .select("clickbait_score")
+                        .eq("journalist_id", journalist_id)
+                        .execute()
+                    )
+                    actual_count, actual_avg, actual_max = self._compute_journalist_stats(
+                        [article["clickbait_score"] for article in articles_result.data]
+                    )
 
                 # 불일치 감지 (소수점 2자리까지 비교)
                 count_mismatch = stored_count != actual_count
@@ -763,11 +1040,12 @@ class DatabaseOperations:
 
             # 불일치 수정
             fixed_count = 0
+            updated_at = datetime.now().isoformat()
             for journalist in inconsistent_journalists:
                 try:
-                    if self.update_journalist_stats_manual(journalist["id"]):
+                    if self.update_journalist_stats_manual(journalist["id"], updated_at):
                         fixed_count += 1
-                        logger.info(f"수정 완료: {journalist['name']} ({journalist['publisher']})")
+                        logger.info("수정 완료: %s (%s)", journalist["name"], journalist["publisher"])
                     else:
                         logger.error(f"수정 실패: {journalist['name']} ({journalist['publisher']})")
                 except Exception as e:
@@ -785,3 +1063,19 @@ class DatabaseOperations:
         except Exception as e:
             logger.error(f"통계 불일치 수정 오류: {e}")
             return {"fixed": 0, "total_checked": 0, "error": str(e)}
+
+    def _get_actual_journalist_stats(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        journalist_article_stats 뷰에서 기자별 실제 기사 통계 일괄 조회
+
+        Returns:
+            기자 ID를 키로 하는 통계 딕셔너리 (조회 실패 시 None)
+        """
+        try:
+            result = (
+                self.client.client.table("journalist_article_stats").select(JOURNALIST_ARTICLE_STATS_COLUMNS).execute()
+            )
+            return {row["journalist_id"]: row for row in result.data}
+        except Exception as e:
+            logger.warning(f"기자별 통계 뷰 조회 실패 - 기자별 개별 조회로 폴백합니다: {e}")
+            return None
@@ -3,9 +3,31 @@ Supabase 클라이언트 설정
 """
 
 import os
+import threading
 from typing import Optional
+import httpx
+import orjson
 from supabase import create_client, Client
-from dotenv import load_dotenv
+
+from src.config.settings import settings
+
+# supabase-py 기본 PostgREST 타임아웃과 동일하게 유지
+POSTGREST_TIMEOUT_SECONDS = 120
+
+
+class OrjsonHttpClient(httpx.Client):
+    """JSON 요청 본문을 orjson으로 직렬화하는 httpx 클라이언트"""
+
+    def build_request(self, method, url, *, json=None, headers=None, **kwargs) -> httpx.Request:
+        if json is None:
+            return super().build_request(method, url, headers=headers, **kwargs)
+
+        # 대량 기사 삽입 시 stdlib json 대신 orjson으로 본문을 바로 bytes로 직렬화
+        # (httpx.Client.request는 content=None을 항상 함께 넘기므로 제거 후 직렬화 결과로 대체)
+        kwargs.pop("content", None)
+        headers = httpx.Headers(headers)
+        headers.setdefault("Content-Type", "application/json")
+        return super().build_request(method, url, content=orjson.dumps(json), headers=headers, **kwargs)
 
 
 class SupabaseClient:
@@ -19,8 +41,7 @@ class SupabaseClient:
             url: Supabase URL (환경변수에서 가져옴)
             key: Supabase 서비스 키 (환경변수에서 가져옴)
         """
-        load_dotenv()
-
+        # .env는 src.config.settings 임포트 시 한 번만 로드됨
         self.url = url or os.environ.get("SUPABASE_URL")
         self.key = key or os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
 
@@ -28,14 +49,61 @@ class SupabaseClient:
             raise ValueError("SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY 환경변수가 필요합니다")
 
         self._client: Optional[Client] = None
+        self._lock = threading.Lock()
 
     @property
     def client(self) -> Client:
         """Supabase 클라이언트 반환 (지연 초기화)"""
         if self._client is None:
-            self._client = create_client(self.url, self.key)
+            # 여러 스레드가 동시에 접근해도 클라이언트(HTTP 커넥션 풀)는 하나만 생성
+            with self._lock:
+                if self._client is None:
+                    client = create_client(self.url, self.key)
+                    self._attach_postgrest_session(client)
+                    self._client = client
         return self._client
 
+    @classmethod
+    def _attach_postgrest_session(cls, client: Client) -> None:
+        """
+        PostgREST 클라이언트의 HTTP 세션만 커넥션 풀을 조정한 클라이언트로 교체
+
+        ClientOptions(httpx_client=...)로 넘기면 postgrest/storage/functions가 같은 인스턴스를
+        공유하면서 각자 base_url과 헤더를 덮어쓰므로, PostgREST 세션에만 적용합니다.
+
+        Args:
+            client: Supabase 클라이언트
+        """
+        postgrest = client.postgrest
+        default_session = postgrest.session
+        postgrest.session = cls._create_http_client(base_url=default_session.base_url, headers=default_session.headers)
+        default_session.close()
+
+    @staticmethod
+    def _create_http_client(base_url: httpx.URL, headers: httpx.Headers) -> httpx.Client:
+        """
+        커넥션 풀 크기를 조정한 HTTP 클라이언트 생성
+
+        크롤링/배치 처리 중 발생하는 다수의 요청이 keep-alive 연결과 HTTP/2 멀티플렉싱으로
+        TLS 핸드셰이크 없이 재사용되도록 하고, 요청 본문은 orjson으로 직렬화합니다.
+
+        Args:
+            base_url: PostgREST 기본 URL
+            headers: PostgREST 기본 헤더 (apikey, 인증, 스키마 헤더 포함)
+
+        Returns:
+            httpx 클라이언트
+        """
+        pool_size = settings.SUPABASE_POOL_SIZE
+        return OrjsonHttpClient(
+            base_url=base_url,
+            headers=headers,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=max(1, pool_size // 2)),
+            timeout=POSTGREST_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            http2=True,
+        )
+
     def test_connection(self) -> bool:
         """연결 테스트"""
         try:
@@ -46,11 +114,14 @@ class SupabaseClient:
 
 
 _supabase_client = None
+_supabase_client_lock = threading.Lock()
 
 
 def get_supabase_client() -> SupabaseClient:
-    """Supabase 클라이언트 싱글톤 인스턴스 반환"""
+    """Supabase 클라이언트 싱글톤 인스턴스 반환 (스레드 안전)"""
     global _supabase_client
     if _supabase_client is None:
-        _supabase_client = SupabaseClient()
+        with _supabase_client_lock:
+            if _supabase_client is None:
+                _supabase_client = SupabaseClient()
     return _supabase_client
@@ -4,10 +4,13 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+# 허용하는 네이버 뉴스 URL 접두사 (기사 생성마다 튜플을 새로 만들지 않도록 모듈 상수로 유지)
+VALID_NAVER_URL_PREFIXES = ("https://n.news.naver.com", "https://m.entertain.naver.com")
 
-@dataclass
+
+@dataclass(slots=True)
 class Article:
     """기사 데이터 모델"""
 
@@ -36,9 +39,7 @@ class Article:
         if len(content_stripped) < 100:
             raise ValueError(f"내용은 최소 100자 이상이어야 합니다 (길이={len(content_stripped)})")
 
-        if not isinstance(self.naver_url, str) or not self.naver_url.startswith(
-            ("https://n.news.naver.com", "https://m.entertain.naver.com")
-        ):
+        if not isinstance(self.naver_url, str) or not self.naver_url.startswith(VALID_NAVER_URL_PREFIXES):
             raise ValueError(f"유효하지 않은 네이버 뉴스 URL입니다 (url='{self.naver_url}')")
 
         if self.clickbait_score is not None and not (0 <= self.clickbait_score <= 100):
@@ -99,8 +100,39 @@ class Article:
         return self.is_duplicate_of(other)
 
     def __hash__(self) -> int:
-        """해시값 생성"""
-        return hash(self.get_duplicate_key())
+        """해시값 생성 (URL이 같으면 동등하므로 naver_url 기준)"""
+        return hash(self.naver_url)
+
+    @staticmethod
+    def dedupe(articles: List["Article"]) -> List["Article"]:
+        """
+        중복 기사 제거 (is_duplicate_of 기준, 먼저 나온 기사 유지)
+
+        기사 쌍을 모두 비교하지 않고 URL 집합과 내용 키 집합으로 한 번만 순회합니다.
+
+        Args:
+            articles: 기사 리스트
+
+        Returns:
+            중복이 제거된 기사 리스트 (원래 순서 유지)
+        """
+        seen_urls = set()
+        seen_content = set()
+        unique_articles = []
+
+        for article in articles:
+            if article.naver_url in seen_urls:
+                continue
+
+            content_key = article.get_content_key()
+            if content_key in seen_content:
+                continue
+
+            seen_urls.add(article.naver_url)
+            seen_content.add(content_key)
+            unique_articles.append(article)
+
+        return unique_articles
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
@@ -138,7 +170,7 @@ class NaverNewsCrawlerResult:
     publisher: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Journalist:
     """기자 데이터 모델"""
 
@@ -2,12 +2,21 @@
 키워드 관련 상수 및 함수 모듈
 """
 
+import json
+import orjson
 import os
 import requests
 import re
-from typing import List
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from src.utils.logging_utils import log_func, get_logger
+from src.utils.ratelimit import TokenBucket
 from src.config.settings import settings
 
 logger = get_logger(__name__)
@@ -15,19 +24,98 @@ logger = get_logger(__name__)
 # SerpApi Google Trends API URL
 SERPAPI_TRENDS_URL = "https://serpapi.com/search"
 
+# SerpApi 호출 속도 제한 (초당 요청 수, 버스트 크기)
+SERPAPI_RATE_PER_SECOND = 1.0
+SERPAPI_BURST = 1
+
+# SerpApi 재시도 설정 (429/5xx 응답 시 지수 백오프, Retry-After 헤더 존중)
+SERPAPI_MAX_RETRIES = 5
+SERPAPI_RETRY_BACKOFF_FACTOR = 0.5
+SERPAPI_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 # 한국어와 영어 문자 패턴 (한글, 영문자, 숫자, 공백, 일반적인 기호만 허용)
 VALID_CHARS_PATTERN = re.compile(r"^[가-힣a-zA-Z0-9\s\.\,\'\"\-\+\?\!\/\(\)\[\]\{\}\:\;\&\%\@\#\*\^\$\_\=\~\`\\]+$")
 
 # 사용할 최대 키워드 수
 MAX_KEYWORDS = 5
 
+# Google Trends 결과 디스크 캐시 경로 및 유효 시간 (실행마다 API를 호출하지 않도록 재사용)
+TRENDS_CACHE_PATH = Path.home() / ".cache" / "clickmaster" / "trends_KR.json"
+TRENDS_CACHE_TTL_SECONDS = 30 * 60
+
+# SerpApi 호출용 공유 세션과 속도 제한기 (TCP/TLS 연결 재사용)
+_serpapi_bucket = TokenBucket(SERPAPI_RATE_PER_SECOND, SERPAPI_BURST)
+_serpapi_session = requests.Session()
+_serpapi_session.mount(
+    "https://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=SERPAPI_MAX_RETRIES,
+            allowed_methods={"GET"},
+            status_forcelist=SERPAPI_RETRY_STATUS_CODES,
+            backoff_factor=SERPAPI_RETRY_BACKOFF_FACTOR,
+            respect_retry_after_header=True,
+        )
+    ),
+)
+
+
+def _load_cached_trends_keywords() -> Optional[List[str]]:
+    """
+    디스크 캐시에서 유효 시간 내의 Google Trends 키워드를 읽어옵니다.
+
+    Returns:
+        캐시된 키워드 리스트 (캐시가 없거나 만료/손상된 경우 None)
+    """
+    try:
+        with open(TRENDS_CACHE_PATH, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+
+        if time.time() - float(cached["fetched_at"]) > TRENDS_CACHE_TTL_SECONDS:
+            return None
+
+        keywords = cached["keywords"]
+        if not isinstance(keywords, list) or not keywords:
+            return None
+        return keywords
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable Google Trends cache: {str(e)}")
+        return None
+
+
+def _save_cached_trends_keywords(keywords: List[str]) -> None:
+    """
+    Google Trends 키워드를 디스크 캐시에 원자적으로 저장합니다.
+
+    Args:
+        keywords: 저장할 키워드 리스트
+    """
+    try:
+        TRENDS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=TRENDS_CACHE_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": time.time(), "keywords": keywords}, f, ensure_ascii=False)
+            os.replace(tmp_path, TRENDS_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Failed to write Google Trends cache: {str(e)}")
+
 
 @log_func
-def get_google_trends_keywords() -> List[str]:
+def get_google_trends_keywords(force_refresh: bool = False) -> List[str]:
     """
     SerpApi의 Google Trends Trending Now API를 통해 한국의 실시간 인기 검색어를 가져옵니다.
 
     환경 변수 'SERP_API_KEY'에 API 키를 설정해야 합니다.
+    최근 30분 이내에 가져온 결과가 디스크 캐시에 있으면 API를 호출하지 않고 재사용합니다.
+
+    Args:
+        force_refresh: True이면 캐시를 무시하고 API를 다시 호출
 
     Returns:
         인기 검색어 키워드 리스트
@@ -35,6 +123,12 @@ def get_google_trends_keywords() -> List[str]:
     Raises:
         SystemExit: API 호출 실패 시 프로세스 종료
     """
+    if not force_refresh:
+        cached_keywords = _load_cached_trends_keywords()
+        if cached_keywords is not None:
+            logger.info(f"Using {len(cached_keywords)} cached Google Trends keywords")
+            return cached_keywords
+
     # SerpApi API 키 확인
     api_key = os.getenv("SERP_API_KEY")
     if not api_key:
@@ -51,15 +145,15 @@ def get_google_trends_keywords() -> List[str]:
             "hours": 48,  # 2일간의 트렌드
             "only_active": True,  # 활성 트렌드만 가져오기
             "engine": "google_trends_trending_now",
-            "no_cache": True,
         }
 
-        # API 요청
-        response = requests.get(SERPAPI_TRENDS_URL, params=params, timeout=10)
+        # API 요청 (속도 제한 후 공유 세션으로 호출, 429/5xx는 세션 어댑터에서 백오프 재시도)
+        _serpapi_bucket.acquire()
+        response = _serpapi_session.get(SERPAPI_TRENDS_URL, params=params, timeout=10)
         response.raise_for_status()
 
         # API 응답 처리
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         if "trending_searches" in response_data:
             # 검색어 추출 - 모든 트렌드 쿼리 추출
             keywords = []
@@ -79,6 +173,7 @@ def get_google_trends_keywords() -> List[str]:
             # 최대 20개의 키워드만 사용
             keywords = keywords[:MAX_KEYWORDS]
             logger.info(f"Retrieved {len(keywords)} keywords from Google Trends")
+            _save_cached_trends_keywords(keywords)
             return keywords
         else:
             logger.error("Invalid response format from SerpApi")
@@ -109,8 +204,8 @@ def get_combined_keywords() -> List[str]:
     # Google Trends 키워드 가져오기
     trends_keywords = get_google_trends_keywords()
 
-    # 기본 키워드와 결합하고 중복 제거
-    combined_keywords = list(set(trends_keywords + settings.DEFAULT_KEYWORDS))
+    # 기본 키워드와 결합하고 중복 제거 (트렌드 키워드 우선 순서 유지)
+    combined_keywords = list(dict.fromkeys(trends_keywords + settings.DEFAULT_KEYWORDS))
 
     logger.info(
         f"Combined {len(trends_keywords)} Google Trends keywords with {len(settings.DEFAULT_KEYWORDS)} default keywords"
@@ -65,13 +65,13 @@ def log_func(func: Callable) -> Callable:
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         func_name = func.__name__
-        logger.debug(f"Starting function: {func_name}")
+        logger.debug("Starting function: %s", func_name)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Function {func_name} completed successfully")
+            logger.debug("Function %s completed successfully", func_name)
             return result
         except Exception as e:
-            logger.error(f"Function {func_name} failed with error: {str(e)}")
+            logger.error("Function %s failed with error: %s", func_name, e)
             raise
 
     return wrapper
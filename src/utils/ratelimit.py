@@ -0,0 +1,49 @@
+"""
+요청 속도 제한 유틸리티 모듈
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 방식의 스레드 안전 속도 제한기"""
+
+    def __init__(self, rate_per_s: float, burst: int = 1):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate_per_s: 초당 충전되는 토큰 수
+            burst: 버킷에 쌓일 수 있는 최대 토큰 수
+        """
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s는 0보다 커야 합니다")
+        if burst < 1:
+            raise ValueError("burst는 1 이상이어야 합니다")
+
+        self.rate_per_s = rate_per_s
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate_per_s)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """
+        토큰 하나를 사용할 수 있을 때까지 대기한 뒤 소비합니다.
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate_per_s
+
+            time.sleep(wait_seconds)
@@ -2,9 +2,16 @@
 텍스트 처리 유틸리티 모듈
 """
 
+from functools import lru_cache
 from typing import Tuple
 from urllib.parse import urlparse
 
+# 익명/무효로 간주하는 기자명 (호출마다 집합을 새로 만들지 않도록 모듈 상수로 유지)
+INVALID_JOURNALIST_NAMES = frozenset({"", " ", "익명", "기자", "사용자", "-", "_"})
+
+# 정규화한 네이버 URL 캐시 크기 (크롤링마다 반복되는 URL의 urlparse 재호출 방지)
+NAVER_URL_CACHE_SIZE = 65536
+
 
 def normalize_journalist_info(name: str, publisher: str) -> Tuple[str, str]:
     """
@@ -26,8 +33,7 @@ def normalize_journalist_info(name: str, publisher: str) -> Tuple[str, str]:
         publisher = "네이버뉴스"
 
     # 익명/무효 기자명 처리 - 각 언론사별로 별도의 익명 기자 생성
-    invalid_name_tokens = {"", " ", "익명", "기자", "사용자", "-", "_"}
-    if len(name) < 2 or name in invalid_name_tokens:
+    if len(name) < 2 or name in INVALID_JOURNALIST_NAMES:
         name = f"익명기자_{publisher}"
 
     return name, publisher
@@ -51,6 +57,20 @@ def normalize_naver_url(url: str) -> str:
     if not isinstance(url, str):
         return ""
 
+    return _normalize_naver_url_cached(url)
+
+
+@lru_cache(maxsize=NAVER_URL_CACHE_SIZE)
+def _normalize_naver_url_cached(url: str) -> str:
+    """
+    normalize_naver_url의 캐시된 구현 (문자열 입력만 전달됨)
+
+    Args:
+        url: 원본 URL 문자열
+
+    Returns:
+        정규화된 URL
+    """
     # 공백 제거
     url = url.strip()
     if not url:
@@ -0,0 +1,15 @@
+-- 기자/기사 통계 요약을 한 번의 호출로 반환
+-- DatabaseOperations.get_journalist_stats_summary()에서 사용
+CREATE OR REPLACE FUNCTION journalist_stats_summary()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT jsonb_build_object(
+    'total_journalists', (SELECT COUNT(*) FROM journalists),
+    'active_journalists', (SELECT COUNT(*) FROM journalists WHERE article_count > 0),
+    'scored_journalists', (SELECT COUNT(*) FROM journalists WHERE avg_clickbait_score > 0),
+    'total_articles', (SELECT COUNT(*) FROM articles),
+    'scored_articles', (SELECT COUNT(*) FROM articles WHERE clickbait_score IS NOT NULL)
+  );
+$$;
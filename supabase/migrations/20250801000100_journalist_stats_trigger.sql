@@ -0,0 +1,54 @@
+-- 기사 삽입/점수 변경/삭제 시 해당 기자의 통계를 즉시 갱신
+-- avg_clickbait_score는 점수 상위 10개 기사의 평균 (DatabaseOperations.update_journalist_stats_manual과 동일)
+CREATE INDEX IF NOT EXISTS idx_articles_journalist_score
+  ON articles (journalist_id, clickbait_score DESC NULLS LAST);
+
+CREATE OR REPLACE FUNCTION refresh_journalist_stats(p_journalist_id UUID)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+  UPDATE journalists j
+  SET
+    article_count = s.article_count,
+    avg_clickbait_score = s.avg_clickbait_score,
+    max_score = s.max_score,
+    updated_at = NOW()
+  FROM (
+    SELECT
+      (SELECT COUNT(*) FROM articles WHERE journalist_id = p_journalist_id) AS article_count,
+      COALESCE(ROUND(AVG(t.clickbait_score)::NUMERIC, 2), 0) AS avg_clickbait_score,
+      COALESCE(MAX(t.clickbait_score), 0) AS max_score
+    FROM (
+      SELECT clickbait_score
+      FROM articles
+      WHERE journalist_id = p_journalist_id AND clickbait_score IS NOT NULL
+      ORDER BY clickbait_score DESC
+      LIMIT 10
+    ) t
+  ) s
+  WHERE j.id = p_journalist_id;
+$$;
+
+CREATE OR REPLACE FUNCTION trigger_refresh_journalist_stats()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.journalist_id IS NOT NULL THEN
+    PERFORM refresh_journalist_stats(OLD.journalist_id);
+  END IF;
+
+  IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.journalist_id IS NOT NULL
+     AND (TG_OP = 'INSERT' OR NEW.journalist_id IS DISTINCT FROM OLD.journalist_id) THEN
+    PERFORM refresh_journalist_stats(NEW.journalist_id);
+  END IF;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_update_journalist_stats ON articles;
+CREATE TRIGGER trigger_update_journalist_stats
+AFTER INSERT OR DELETE OR UPDATE OF clickbait_score, journalist_id ON articles
+FOR EACH ROW
+EXECUTE FUNCTION trigger_refresh_journalist_stats();
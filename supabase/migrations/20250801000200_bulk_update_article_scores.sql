@@ -0,0 +1,23 @@
+-- 기사 낚시 점수 일괄 업데이트 (BulkUpdater.bulk_update_articles에서 사용)
+-- p_updates: [{"id": ..., "clickbait_score": ..., "clickbait_explanation": ...}, ...]
+-- 이미 점수가 있는 기사는 건너뛰어 재처리 시에도 멱등성을 보장
+CREATE OR REPLACE FUNCTION bulk_update_article_scores(p_updates JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  updated_count INTEGER;
+BEGIN
+  UPDATE articles a
+  SET
+    clickbait_score = u.clickbait_score,
+    clickbait_explanation = u.clickbait_explanation,
+    updated_at = NOW()
+  FROM jsonb_to_recordset(p_updates) AS u(id UUID, clickbait_score INTEGER, clickbait_explanation TEXT)
+  WHERE a.id = u.id
+    AND a.clickbait_score IS NULL;
+
+  GET DIAGNOSTICS updated_count = ROW_COUNT;
+  RETURN updated_count;
+END;
+$$;
@@ -0,0 +1,24 @@
+-- journalist_stats_summary: 테이블별 서브쿼리 5회 대신 테이블당 한 번의 스캔으로 집계
+CREATE OR REPLACE FUNCTION journalist_stats_summary()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT j.stats || a.stats
+  FROM (
+    SELECT jsonb_build_object(
+      'total_journalists', COUNT(*),
+      'active_journalists', COUNT(*) FILTER (WHERE article_count > 0),
+      'scored_journalists', COUNT(*) FILTER (WHERE avg_clickbait_score > 0)
+    ) AS stats
+    FROM journalists
+  ) j,
+  (
+    SELECT jsonb_build_object(
+      'total_articles', COUNT(*),
+      'scored_articles', COUNT(clickbait_score),
+      'pending_articles', COUNT(*) - COUNT(clickbait_score)
+    ) AS stats
+    FROM articles
+  ) a;
+$$;
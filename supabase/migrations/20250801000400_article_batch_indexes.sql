@@ -0,0 +1,15 @@
+-- 미처리 기사 조회 (BatchProcessor.get_pending_articles / DatabaseOperations.get_unprocessed_articles)
+-- clickbait_score IS NULL 조건 + created_at 정렬을 작업 대상 행만 담은 부분 인덱스로 처리
+CREATE INDEX IF NOT EXISTS idx_articles_unprocessed_created_at
+  ON articles (created_at)
+  WHERE clickbait_score IS NULL;
+
+-- 중복 체크 (check_duplicate_article / check_duplicate_articles_batch)
+-- 적용 전 기존 중복 URL이 있으면 scripts/deduplicate_articles.py로 먼저 정리해야 함
+CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_naver_url_unique
+  ON articles (naver_url);
+
+-- 활성 배치 조회 (BatchProcessor.check_active_batch / get_all_active_batches)
+CREATE INDEX IF NOT EXISTS idx_batch_in_progress_created_at
+  ON batch (created_at)
+  WHERE status = 'in_progress';
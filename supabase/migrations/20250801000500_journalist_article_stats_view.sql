@@ -0,0 +1,19 @@
+-- 기자별 실제 기사 통계를 한 번의 GROUP BY로 계산하는 뷰
+-- DatabaseOperations.fix_inconsistent_stats가 기자별 개별 조회 대신 사용
+-- avg_clickbait_score는 점수 상위 10개 기사의 평균 (refresh_journalist_stats와 동일)
+CREATE OR REPLACE VIEW journalist_article_stats AS
+SELECT
+  ranked.journalist_id,
+  COUNT(*) AS article_count,
+  COALESCE(ROUND(AVG(ranked.clickbait_score) FILTER (WHERE ranked.score_rank <= 10)::NUMERIC, 2), 0)::DOUBLE PRECISION
+    AS avg_clickbait_score,
+  COALESCE(MAX(ranked.clickbait_score), 0) AS max_score
+FROM (
+  SELECT
+    journalist_id,
+    clickbait_score,
+    ROW_NUMBER() OVER (PARTITION BY journalist_id ORDER BY clickbait_score DESC NULLS LAST) AS score_rank
+  FROM articles
+  WHERE journalist_id IS NOT NULL
+) ranked
+GROUP BY ranked.journalist_id;
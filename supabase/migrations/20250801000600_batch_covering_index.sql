@@ -0,0 +1,8 @@
+-- 활성 배치 조회 (BatchProcessor.check_active_batch / get_all_active_batches)
+-- 조회 컬럼(BATCH_COLUMNS)을 INCLUDE하여 힙 접근 없이 인덱스만으로 처리
+DROP INDEX IF EXISTS idx_batch_in_progress_created_at;
+
+CREATE INDEX IF NOT EXISTS idx_batch_in_progress_covering
+  ON batch (created_at)
+  INCLUDE (id, batch_id, status, article_count)
+  WHERE status = 'in_progress';
@@ -0,0 +1,25 @@
+-- 기자 일괄 조회/생성 (DatabaseOperations.get_or_create_journalists_batch에서 사용)
+-- 기존 기자 조회 후 신규 기자 삽입하던 두 번의 요청을 한 번의 RPC로 처리
+-- 적용 전 (name, publisher)가 중복된 기자가 있으면 먼저 정리해야 함
+CREATE UNIQUE INDEX IF NOT EXISTS idx_journalists_name_publisher_unique
+  ON journalists (name, publisher);
+
+-- p_journalists: [{"name": ..., "publisher": ..., "naver_uuid": ..., "article_count": 0, ...}, ...]
+-- 이미 있는 기자는 건드리지 않아 기존 통계가 유지됨
+CREATE OR REPLACE FUNCTION get_or_create_journalists(p_journalists JSONB)
+RETURNS SETOF journalists
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  INSERT INTO journalists (name, publisher, naver_uuid, article_count, avg_clickbait_score, max_score)
+  SELECT j.name, j.publisher, j.naver_uuid, j.article_count, j.avg_clickbait_score, j.max_score
+  FROM jsonb_populate_recordset(NULL::journalists, p_journalists) AS j
+  ON CONFLICT (name, publisher) DO NOTHING;
+
+  RETURN QUERY
+  SELECT jr.*
+  FROM journalists jr
+  JOIN jsonb_to_recordset(p_journalists) AS p(name TEXT, publisher TEXT)
+    ON jr.name = p.name AND jr.publisher = p.publisher;
+END;
+$$;
@@ -0,0 +1,159 @@
+-- 기자 통계 트리거를 행 단위(FOR EACH ROW)에서 문장 단위(FOR EACH STATEMENT)로 교체
+-- 500행 청크 upsert / bulk_update_article_scores RPC 한 번에 기자별 재계산이 행 수만큼 반복되지 않도록
+-- 전이 테이블(new_rows / old_rows)의 고유 journalist_id마다 한 번만 갱신
+--
+-- article_count: 전이 테이블의 기자별 행 수만큼 증감 (기자의 전체 기사를 다시 세지 않음)
+-- avg_clickbait_score / max_score: 점수 상위 10개만 (journalist_id, clickbait_score DESC) 인덱스로 재계산
+DROP TRIGGER IF EXISTS trigger_update_journalist_stats ON articles;
+DROP FUNCTION IF EXISTS trigger_refresh_journalist_stats();
+
+-- 점수 통계만 재계산 (refresh_journalist_stats와 같은 상위 10개 기준, COUNT(*) 없음)
+CREATE OR REPLACE FUNCTION refresh_journalist_score_stats(p_journalist_id UUID)
+RETURNS VOID
+LANGUAGE sql
+AS $$
+  UPDATE journalists j
+  SET
+    avg_clickbait_score = s.avg_clickbait_score,
+    max_score = s.max_score,
+    updated_at = NOW()
+  FROM (
+    SELECT
+      COALESCE(ROUND(AVG(t.clickbait_score)::NUMERIC, 2), 0) AS avg_clickbait_score,
+      COALESCE(MAX(t.clickbait_score), 0) AS max_score
+    FROM (
+      SELECT clickbait_score
+      FROM articles
+      WHERE journalist_id = p_journalist_id AND clickbait_score IS NOT NULL
+      ORDER BY clickbait_score DESC
+      LIMIT 10
+    ) t
+  ) s
+  WHERE j.id = p_journalist_id;
+$$;
+
+CREATE OR REPLACE FUNCTION trigger_refresh_journalist_stats_on_insert()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE journalists j
+  SET article_count = j.article_count + d.row_count, updated_at = NOW()
+  FROM (
+    SELECT journalist_id, COUNT(*) AS row_count
+    FROM new_rows
+    WHERE journalist_id IS NOT NULL
+    GROUP BY journalist_id
+  ) d
+  WHERE j.id = d.journalist_id;
+
+  -- 점수 없이 삽입된 기사(크롤링 직후)는 점수 통계에 영향이 없으므로 건너뜀
+  PERFORM refresh_journalist_score_stats(t.journalist_id)
+  FROM (
+    SELECT DISTINCT journalist_id
+    FROM new_rows
+    WHERE journalist_id IS NOT NULL AND clickbait_score IS NOT NULL
+  ) t;
+
+  RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION trigger_refresh_journalist_stats_on_delete()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  UPDATE journalists j
+  SET article_count = GREATEST(j.article_count - d.row_count, 0), updated_at = NOW()
+  FROM (
+    SELECT journalist_id, COUNT(*) AS row_count
+    FROM old_rows
+    WHERE journalist_id IS NOT NULL
+    GROUP BY journalist_id
+  ) d
+  WHERE j.id = d.journalist_id;
+
+  PERFORM refresh_journalist_score_stats(t.journalist_id)
+  FROM (
+    SELECT DISTINCT journalist_id
+    FROM old_rows
+    WHERE journalist_id IS NOT NULL AND clickbait_score IS NOT NULL
+  ) t;
+
+  RETURN NULL;
+END;
+$$;
+
+-- 전이 테이블은 UPDATE OF 컬럼 목록과 함께 쓸 수 없으므로 모든 UPDATE에서 실행하고,
+-- clickbait_score / journalist_id가 바뀐 행만 골라 통계에 영향이 없는 변경(updated_at 등)은 건너뜀
+CREATE OR REPLACE FUNCTION trigger_refresh_journalist_stats_on_update()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  -- 기자가 바뀐 기사: 이전 기자 -1, 새 기자 +1
+  UPDATE journalists j
+  SET article_count = GREATEST(j.article_count + d.delta, 0), updated_at = NOW()
+  FROM (
+    SELECT m.journalist_id, SUM(m.delta) AS delta
+    FROM (
+      SELECT o.journalist_id, -1 AS delta
+      FROM old_rows o
+      JOIN new_rows n ON n.id = o.id
+      WHERE o.journalist_id IS DISTINCT FROM n.journalist_id
+      UNION ALL
+      SELECT n.journalist_id, 1 AS delta
+      FROM old_rows o
+      JOIN new_rows n ON n.id = o.id
+      WHERE o.journalist_id IS DISTINCT FROM n.journalist_id
+    ) m
+    WHERE m.journalist_id IS NOT NULL
+    GROUP BY m.journalist_id
+  ) d
+  WHERE j.id = d.journalist_id AND d.delta <> 0;
+
+  -- 점수 통계: 같은 기자 내 점수 변경, 또는 점수가 있는 기사가 다른 기자로 이동한 경우만 재계산
+  PERFORM refresh_journalist_score_stats(t.journalist_id)
+  FROM (
+    SELECT o.journalist_id
+    FROM old_rows o
+    JOIN new_rows n ON n.id = o.id
+    WHERE (o.journalist_id IS NOT DISTINCT FROM n.journalist_id
+           AND o.clickbait_score IS DISTINCT FROM n.clickbait_score)
+       OR (o.journalist_id IS DISTINCT FROM n.journalist_id AND o.clickbait_score IS NOT NULL)
+    UNION
+    SELECT n.journalist_id
+    FROM old_rows o
+    JOIN new_rows n ON n.id = o.id
+    WHERE o.journalist_id IS DISTINCT FROM n.journalist_id AND n.clickbait_score IS NOT NULL
+  ) t
+  WHERE t.journalist_id IS NOT NULL;
+
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trigger_journalist_stats_after_insert ON articles;
+CREATE TRIGGER trigger_journalist_stats_after_insert
+AFTER INSERT ON articles
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION trigger_refresh_journalist_stats_on_insert();
+
+DROP TRIGGER IF EXISTS trigger_journalist_stats_after_delete ON articles;
+CREATE TRIGGER trigger_journalist_stats_after_delete
+AFTER DELETE ON articles
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION trigger_refresh_journalist_stats_on_delete();
+
+DROP TRIGGER IF EXISTS trigger_journalist_stats_after_update ON articles;
+CREATE TRIGGER trigger_journalist_stats_after_update
+AFTER UPDATE ON articles
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION trigger_refresh_journalist_stats_on_update();
+
+-- 이후 article_count는 증감으로만 유지되므로 적용 시점에 한 번 전체 재계산해 기준값을 맞춤
+SELECT refresh_journalist_stats(id) FROM journalists;
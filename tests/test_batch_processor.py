@@ -120,7 +120,7 @@ class TestBatchProcessor:
             mock_openai_client.create_batch.assert_called_once_with(mock_batch_requests)
 
     def test_process_batch_results_handles_valid_responses(
-        self, batch_processor, mock_openai_client, mock_bulk_updater
+        self, batch_processor, mock_openai_client, mock_prompt_generator, mock_bulk_updater
     ):
         """배치 결과 처리가 올바르게 작동하는지 테스트"""
         # Given
@@ -145,19 +145,21 @@ class TestBatchProcessor:
         mock_bulk_updater.bulk_update_articles.return_value = True
 
         # PromptGenerator의 validate_clickbait_response Mock 설정
-        with patch.object(batch_processor.prompt_generator, "validate_clickbait_response") as mock_validate:
-            mock_validate.return_value = {"clickbait_score": 85, "clickbait_explanation": "과도한 호기심 유발"}
+        mock_validate = mock_prompt_generator.validate_clickbait_response
+        mock_validate.return_value = {"clickbait_score": 85, "clickbait_explanation": "과도한 호기심 유발"}
 
-            # When
-            success = batch_processor.process_batch_results(batch_id)
+        # When
+        success = batch_processor.process_batch_results(batch_id)
 
-            # Then
-            assert success is True
-            mock_openai_client.get_batch_results.assert_called_once_with(batch_id)
-            mock_bulk_updater.bulk_update_articles.assert_called_once()
-            mock_validate.assert_called_once()
+        # Then
+        assert success is True
+        mock_openai_client.get_batch_results.assert_called_once_with(batch_id)
+        mock_bulk_updater.bulk_update_articles.assert_called_once()
+        mock_validate.assert_called_once()
 
-    def test_process_batch_results_handles_invalid_json(self, batch_processor, mock_openai_client, mock_bulk_updater):
+    def test_process_batch_results_handles_invalid_json(
+        self, batch_processor, mock_openai_client, mock_prompt_generator, mock_bulk_updater
+    ):
         """배치 결과에 잘못된 JSON이 있을 때 처리하는지 테스트"""
         # Given
         batch_id = "batch_123"
@@ -170,18 +172,18 @@ class TestBatchProcessor:
         mock_openai_client.get_batch_results.return_value = mock_results
 
         # PromptGenerator의 validate_clickbait_response Mock 설정 (유효하지 않은 JSON)
-        with patch.object(batch_processor.prompt_generator, "validate_clickbait_response") as mock_validate:
-            mock_validate.return_value = None  # 유효하지 않은 응답
+        mock_validate = mock_prompt_generator.validate_clickbait_response
+        mock_validate.return_value = None  # 유효하지 않은 응답
 
-            # When
-            success = batch_processor.process_batch_results(batch_id)
+        # When
+        success = batch_processor.process_batch_results(batch_id)
 
-            # Then
-            # 잘못된 JSON만 있으면 valid updates가 없어서 False가 반환됨
-            assert success is False
-            # bulk_update_articles는 호출되지 않아야 함 (유효한 데이터가 없으므로)
-            mock_bulk_updater.bulk_update_articles.assert_not_called()
-            mock_validate.assert_called_once()
+        # Then
+        # 잘못된 JSON만 있으면 valid updates가 없어서 False가 반환됨
+        assert success is False
+        # bulk_update_articles는 호출되지 않아야 함 (유효한 데이터가 없으므로)
+        mock_bulk_updater.bulk_update_articles.assert_not_called()
+        mock_validate.assert_called_once()
 
     def test_save_batch_info_to_database(self, batch_processor, mock_supabase):
         """배치 정보 데이터베이스 저장 테스트"""
@@ -229,7 +231,7 @@ class TestBatchProcessor:
 class TestOpenAIClient:
     """OpenAI 클라이언트 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def openai_client(self):
         """OpenAI 클라이언트 인스턴스"""
         return OpenAIClient(api_key="test_key")
@@ -267,6 +269,9 @@ class TestOpenAIClient:
             # Then
             assert result.id == "batch_123"
             mock_client.files.create.assert_called_once()
+            filename, content = mock_client.files.create.call_args[1]["file"]
+            assert filename.endswith(".jsonl")
+            assert json.loads(content.decode()) == batch_requests[0]
             mock_client.batches.create.assert_called_once()
 
     def test_get_batch_status(self, openai_client):
@@ -300,8 +305,11 @@ class TestOpenAIClient:
             # JSONL 형태의 결과 데이터
             jsonl_content = '{"custom_id": "article_1", "response": {"body": {"choices": [{"message": {"content": "{\\"clickbait_score\\": 85, \\"clickbait_explanation\\": \\"test\\"}"}}]}}}\n'
             mock_response = Mock()
-            mock_response.content = jsonl_content.encode()
-            mock_client.files.content.return_value = mock_response
+            mock_response.iter_lines.return_value = iter(jsonl_content.split("\n"))
+            mock_client.files.with_streaming_response.content.return_value.__enter__ = Mock(
+                return_value=mock_response
+            )
+            mock_client.files.with_streaming_response.content.return_value.__exit__ = Mock(return_value=False)
 
             # When
             results = openai_client.get_batch_results(batch_id)
@@ -310,13 +318,13 @@ class TestOpenAIClient:
             assert len(results) == 1
             assert results[0]["custom_id"] == "article_1"
             mock_client.batches.retrieve.assert_called_once_with(batch_id)
-            mock_client.files.content.assert_called_once_with("file_456")
+            mock_client.files.with_streaming_response.content.assert_called_once_with("file_456")
 
 
 class TestPromptGenerator:
     """프롬프트 생성기 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def prompt_generator(self):
         """프롬프트 생성기 인스턴스"""
         return PromptGenerator()
@@ -421,24 +429,29 @@ class TestBulkUpdater:
             {"id": 1, "clickbait_score": 85, "clickbait_explanation": "Test 1"},
             {"id": 2, "clickbait_score": 42, "clickbait_explanation": "Test 2"},
         ]
-        mock_supabase.table.return_value.upsert.return_value.execute.return_value = {"data": updates}
+        mock_client = mock_supabase.client
+        mock_client.table.return_value.select.return_value.in_.return_value.not_.is_.return_value.execute.return_value = Mock(
+            data=[]
+        )
+        mock_client.rpc.return_value.execute.return_value = Mock(data=2)
 
         # When
         result = bulk_updater.bulk_update_articles(updates)
 
         # Then
         assert result is True
-        mock_supabase.table.assert_called_with("Article")
-        mock_supabase.table.return_value.upsert.assert_called_with(updates)
+        mock_client.rpc.assert_called_once_with("bulk_update_article_scores", {"p_updates": updates})
+        mock_client.table.return_value.update.assert_not_called()
 
     def test_bulk_update_articles_handles_errors(self, bulk_updater, mock_supabase):
         """Article 벌크 업데이트 에러 처리 테스트"""
         # Given
         updates = [{"id": 1, "clickbait_score": 85, "clickbait_explanation": "Test 1"}]
-        mock_supabase.table.return_value.upsert.return_value.execute.side_effect = Exception("Database error")
+        mock_client = mock_supabase.client
+        mock_client.rpc.return_value.execute.side_effect = Exception("Database error")
 
         # individual update도 실패하도록 설정
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.side_effect = Exception(
+        mock_client.table.return_value.update.return_value.eq.return_value.execute.side_effect = Exception(
             "Individual update error"
         )
 
@@ -448,6 +461,7 @@ class TestBulkUpdater:
         # Then
         # 모든 업데이트가 실패했으므로 False를 반환해야 함
         assert result is False
+        mock_client.table.return_value.update.assert_called_once()
 
     def test_bulk_update_splits_large_batches(self, bulk_updater, mock_supabase):
         """큰 배치를 적절히 분할하는지 테스트"""
@@ -456,7 +470,11 @@ class TestBulkUpdater:
             {"id": i, "clickbait_score": 50, "clickbait_explanation": f"Test {i}"}
             for i in range(1200)  # 배치 크기 한도 초과
         ]
-        mock_supabase.table.return_value.upsert.return_value.execute.return_value = {"data": []}
+        mock_client = mock_supabase.client
+        mock_client.table.return_value.select.return_value.in_.return_value.not_.is_.return_value.execute.return_value = Mock(
+            data=[]
+        )
+        mock_client.rpc.return_value.execute.return_value = Mock(data=500)
 
         # When
         result = bulk_updater.bulk_update_articles(large_updates, batch_size=500)
@@ -464,4 +482,4 @@ class TestBulkUpdater:
         # Then
         assert result is True
         # 1200개 데이터는 500씩 3번에 나누어 처리되어야 함
-        assert mock_supabase.table.return_value.upsert.call_count == 3
+        assert mock_client.rpc.call_count == 3
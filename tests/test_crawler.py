@@ -6,21 +6,56 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, date
 from dateutil.relativedelta import relativedelta
-import pytz
 
-from src.crawlers.naver_crawler import NaverNewsCrawler
+from src.crawlers.naver_crawler import KST, NaverNewsCrawler, parse_pub_date
 from src.models.article import Article
 
+# API 응답 description만으로 본문 최소 길이를 채우는 테스트 설명
+LONG_DESCRIPTION = "충분히 긴 설명 텍스트입니다. 100자 이상이 되도록 더 많은 내용을 추가하겠습니다. 추가 내용으로 테스트를 위한 충분한 길이를 만들어보겠습니다."
+
+# 기사 검증(100자 이상)을 통과하는 공용 테스트 본문
+LONG_CONTENT = "이것은 테스트 기사 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다."
+LONG_CONTENT_1 = "이것은 충격적인 뉴스 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다. 이제 확실히 100자가 넘었을 것입니다."
+LONG_CONTENT_2 = "이것은 두 번째 충격적인 뉴스 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다. 이제 확실히 100자가 넘었을 것입니다."
+
+# 테스트 기사 공용 발행 시각 (KST 고정)
+PUBLISHED_AT = datetime(2024, 1, 1, 9, 0, tzinfo=KST)
+
+# 크롤링 시나리오 테스트에서 사용하는 네이버 뉴스 URL
+URL_1 = "https://n.news.naver.com/article/023/0003123456"
+URL_2 = "https://n.news.naver.com/article/421/0007123456"
+
+
+def make_article(
+    title: str, naver_url: str, published_at: datetime = PUBLISHED_AT, content: str = LONG_CONTENT
+) -> Article:
+    """익명/네이버뉴스 기본값으로 테스트용 Article 생성"""
+    return Article(
+        title=title,
+        content=content,
+        journalist_name="익명",
+        publisher="네이버뉴스",
+        published_at=published_at,
+        naver_url=naver_url,
+    )
+
 
 class TestNaverNewsCrawler:
     """NaverNewsCrawler 테스트"""
 
-    @pytest.fixture
-    def crawler(self):
-        """크롤러 인스턴스 픽스처"""
+    @pytest.fixture(scope="class")
+    def shared_crawler(self):
+        """클래스 전체에서 공유하는 크롤러 인스턴스"""
         with patch("src.crawlers.naver_crawler.DatabaseOperations"):
             return NaverNewsCrawler(client_id="test-client-id", client_secret="test-client-secret")
 
+    @pytest.fixture
+    def crawler(self, shared_crawler):
+        """크롤러 인스턴스 픽스처 (테스트마다 DB Mock 호출 기록과 선요청 페이지 초기화)"""
+        shared_crawler.db_ops.reset_mock(return_value=True, side_effect=True)
+        shared_crawler._prefetched_pages.clear()
+        return shared_crawler
+
     @pytest.fixture
     def mock_api_response(self):
         """Mock API 응답 데이터"""
@@ -115,6 +150,38 @@ class TestNaverNewsCrawler:
 
         assert content is None
 
+    @patch("src.crawlers.naver_crawler._article_fetch_bucket")
+    @patch("requests.Session.get")
+    def test_prefetch_article_pages(self, mock_get, mock_bucket, crawler):
+        """기사 페이지 선요청 테스트 - 네이버 링크·대상 날짜만 요청하고 본문 추출 시 재사용"""
+        mock_response = Mock()
+        mock_response.content = b"<html><body></body></html>"
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        items = [
+            {
+                "link": "https://n.news.naver.com/mnews/article/023/0003123456?sid=100",
+                "pubDate": "Mon, 15 Jan 2024 10:30:00 +0900",
+            },
+            {"link": "https://example.com/news/1", "pubDate": "Mon, 15 Jan 2024 10:00:00 +0900"},
+            {
+                "link": "https://n.news.naver.com/article/421/0007123456",
+                "pubDate": "Sun, 14 Jan 2024 09:00:00 +0900",
+            },
+        ]
+
+        prefetched = crawler.prefetch_article_pages(items, target_date=datetime(2024, 1, 15))
+
+        assert prefetched == 1
+        mock_get.assert_called_once_with("https://n.news.naver.com/article/023/0003123456", timeout=30)
+        # 기사 페이지 요청은 공유 속도 제한기를 거침
+        mock_bucket.acquire.assert_called_once()
+
+        crawler.extract_article_content("https://n.news.naver.com/article/023/0003123456")
+
+        assert mock_get.call_count == 1
+
     @patch.object(NaverNewsCrawler, "extract_article_content")
     def test_parse_api_item_success(self, mock_extract_content, crawler):
         """API 아이템 파싱 성공 테스트"""
@@ -148,328 +215,201 @@ class TestNaverNewsCrawler:
         assert article.publisher == "테스트뉴스"  # 크롤링된 출판사명
         assert isinstance(article.published_at, datetime)
 
-    def test_parse_api_item_invalid_url(self, crawler):
-        """잘못된 URL 아이템 파싱 테스트"""
-        api_item = {
-            "title": "테스트 뉴스",
-            "description": "설명",
-            "originallink": "https://example.com/news/123",
-            "link": "https://invalid-url.com/news/123",  # 네이버 뉴스 URL이 아님
-            "pubDate": "Mon, 15 Jan 2024 10:30:00 +0900",
-        }
-
-        article = crawler.parse_api_item(api_item)
-
-        assert article is None
-
-    def test_parse_api_item_short_title(self, crawler):
-        """짧은 제목 기사 파싱 테스트 (None 반환 확인)"""
-        item = {
-            "title": "짧은제목",  # 4자 (9자 미만)
-            "description": "충분히 긴 설명 텍스트입니다. 100자 이상이 되도록 더 많은 내용을 추가하겠습니다. 추가 내용으로 테스트를 위한 충분한 길이를 만들어보겠습니다.",
-            "originallink": "https://example.com/news/123",
-            "link": "https://n.news.naver.com/mnews/article/001/0014793298",
-            "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
-        }
-
-        with patch.object(crawler, "extract_article_content", return_value=None):
-            result = crawler.parse_api_item(item)
-
-        assert result is None
-
-    def test_parse_api_item_non_naver_link(self, crawler):
-        """네이버 뉴스가 아닌 링크 파싱 테스트 (None 반환 확인)"""
-        item = {
-            "title": "충분히 긴 제목입니다 테스트용",
-            "description": "충분히 긴 설명 텍스트입니다. 100자 이상이 되도록 더 많은 내용을 추가하겠습니다. 추가 내용으로 테스트를 위한 충분한 길이를 만들어보겠습니다.",
-            "originallink": "https://example.com/news/123",
-            "link": "https://www.chosun.com/politics/politics_general/2023/12/12/test/",  # 네이버 뉴스가 아님
-            "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
-        }
-
-        result = crawler.parse_api_item(item)
-        assert result is None
-
-    def test_parse_api_item_title_exactly_9_chars(self, crawler):
-        """정확히 9자 제목 기사 파싱 테스트 (정상 처리 확인)"""
-        item = {
-            "title": "정확히아홉자제목임",  # 정확히 9자
-            "description": "충분히 긴 설명 텍스트입니다. 100자 이상이 되도록 더 많은 내용을 추가하겠습니다. 추가 내용으로 테스트를 위한 충분한 길이를 만들어보겠습니다.",
-            "originallink": "https://example.com/news/123",
-            "link": "https://n.news.naver.com/mnews/article/001/0014793298",
-            "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
-        }
-
+    @pytest.mark.parametrize(
+        "item, expected_title",
+        [
+            # 네이버 뉴스 URL이 아님
+            (
+                {
+                    "title": "테스트 뉴스",
+                    "description": "설명",
+                    "originallink": "https://example.com/news/123",
+                    "link": "https://invalid-url.com/news/123",
+                    "pubDate": "Mon, 15 Jan 2024 10:30:00 +0900",
+                },
+                None,
+            ),
+            # 짧은 제목 (4자, 9자 미만)
+            (
+                {
+                    "title": "짧은제목",
+                    "description": LONG_DESCRIPTION,
+                    "originallink": "https://example.com/news/123",
+                    "link": "https://n.news.naver.com/mnews/article/001/0014793298",
+                    "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
+                },
+                None,
+            ),
+            # 네이버 뉴스가 아닌 언론사 링크
+            (
+                {
+                    "title": "충분히 긴 제목입니다 테스트용",
+                    "description": LONG_DESCRIPTION,
+                    "originallink": "https://example.com/news/123",
+                    "link": "https://www.chosun.com/politics/politics_general/2023/12/12/test/",
+                    "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
+                },
+                None,
+            ),
+            # 정확히 9자 제목 (정상 처리)
+            (
+                {
+                    "title": "정확히아홉자제목임",
+                    "description": LONG_DESCRIPTION,
+                    "originallink": "https://example.com/news/123",
+                    "link": "https://n.news.naver.com/mnews/article/001/0014793298",
+                    "pubDate": "Tue, 12 Dec 2023 10:30:00 +0900",
+                },
+                "정확히아홉자제목임",
+            ),
+        ],
+        ids=["invalid_url", "short_title", "non_naver_link", "title_exactly_9_chars"],
+    )
+    def test_parse_api_item_variants(self, crawler, item, expected_title):
+        """API 아이템 파싱 경계 케이스 테스트 (본문 추출 실패 시 API 데이터로 처리)"""
         with patch.object(crawler, "extract_article_content", return_value=None):
             result = crawler.parse_api_item(item)
 
-        assert result is not None
-        assert result.title == "정확히아홉자제목임"
-
+        if expected_title is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result.title == expected_title
+
+    @pytest.mark.parametrize(
+        "articles, duplicate_map, crawl_kwargs, expected_titles, expected_checked_urls",
+        [
+            # 기본 크롤링: 모두 신규
+            (
+                [
+                    make_article("충격적인 뉴스 1번입니다 테스트용으로 작성됨", URL_1, content=LONG_CONTENT_1),
+                    make_article("충격적인 뉴스 2번입니다 테스트용으로 작성됨", URL_2, content=LONG_CONTENT_2),
+                ],
+                {URL_1: False, URL_2: False},
+                {},
+                ["충격적인 뉴스 1번입니다 테스트용으로 작성됨", "충격적인 뉴스 2번입니다 테스트용으로 작성됨"],
+                {URL_1, URL_2},
+            ),
+            # 날짜 필터: 대상 날짜(2024-01-15) 기사만 포함, 과거 날짜 도달 시 중단
+            (
+                [
+                    make_article(
+                        "충격적인 뉴스 1번 - 대상 날짜에 해당하는 기사",
+                        URL_1,
+                        published_at=datetime(2024, 1, 15, 10, 30, tzinfo=KST),
+                    ),
+                    make_article(
+                        "충격적인 뉴스 2번 - 미래 날짜에 해당하는 기사",
+                        URL_2,
+                        published_at=datetime(2024, 1, 16, 11, 30, tzinfo=KST),
+                    ),
+                    make_article(
+                        "충격적인 뉴스 3번 - 과거 날짜에 해당하는 기사",
+                        "https://n.news.naver.com/article/123/0008123456",
+                        published_at=datetime(2024, 1, 14, 9, 30, tzinfo=KST),
+                    ),
+                ],
+                {URL_1: False},
+                {"target_date": datetime(2024, 1, 15)},
+                ["충격적인 뉴스 1번 - 대상 날짜에 해당하는 기사"],
+                {URL_1},
+            ),
+            # 중복 체크 없이 크롤링 (dry-run 모드): DB 중복 체크를 호출하지 않음
+            (
+                [
+                    make_article("테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함", URL_1),
+                    make_article("테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함", URL_2),
+                ],
+                {},
+                {"check_duplicates": False},
+                ["테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함", "테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함"],
+                None,
+            ),
+            # 중복 체크 포함 (일반 모드): DB에 이미 있는 두 번째 기사 제외
+            (
+                [
+                    make_article("테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함", URL_1),
+                    make_article("테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함", URL_2),
+                ],
+                {URL_1: False, URL_2: True},
+                {"check_duplicates": True},
+                ["테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함"],
+                {URL_1, URL_2},
+            ),
+            # 배치 내 중복 URL 제거: 먼저 나온 기사 우선, DB 체크는 중복 제거된 URL로만
+            (
+                [
+                    make_article("테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함", URL_1),
+                    make_article("테스트 뉴스 1 중복입니다 충분히 긴 제목으로 작성함", URL_1),
+                    make_article("테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함", URL_2),
+                ],
+                {URL_1: False, URL_2: False},
+                {"check_duplicates": True},
+                ["테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함", "테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함"],
+                {URL_1, URL_2},
+            ),
+        ],
+        ids=["basic", "date_filter", "without_duplicate_check", "with_duplicate_check", "batch_duplicate_removal"],
+    )
+    @patch("src.crawlers.naver_crawler.time.sleep")
     @patch.object(NaverNewsCrawler, "search_news_api")
     @patch.object(NaverNewsCrawler, "parse_api_item")
-    def test_crawl_by_keywords(self, mock_parse_item, mock_search_api, crawler):
-        """키워드별 크롤링 테스트"""
-        # Mock API 검색 결과 - 첫 번째 호출에만 결과 반환, 두 번째 호출에는 빈 리스트 반환
-        mock_search_api.side_effect = [
-            [{"title": "충격 뉴스 1"}, {"title": "충격 뉴스 2"}],  # 첫 번째 호출
-            [],  # 두 번째 호출 (더 이상 결과 없음)
-        ]
-
-        # 100자 이상의 긴 내용으로 수정
-        long_content1 = "이것은 충격적인 뉴스 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다. 이제 확실히 100자가 넘었을 것입니다."
-        long_content2 = "이것은 두 번째 충격적인 뉴스 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다. 이제 확실히 100자가 넘었을 것입니다."
-
-        # Mock 파싱 결과
-        mock_article1 = Article(
-            title="충격적인 뉴스 1번입니다 테스트용으로 작성됨",
-            content=long_content1,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-        )
-
-        mock_article2 = Article(
-            title="충격적인 뉴스 2번입니다 테스트용으로 작성됨",
-            content=long_content2,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/421/0007123456",
-        )
-
-        mock_parse_item.side_effect = [mock_article1, mock_article2]
-
-        # Mock 배치 중복 체크 (모두 신규)
-        crawler.db_ops.check_duplicate_articles_batch.return_value = {
-            "https://n.news.naver.com/article/023/0003123456": False,
-            "https://n.news.naver.com/article/421/0007123456": False,
-        }
-
-        result = crawler.crawl_by_keywords(["충격"])
-
-        assert len(result) == 2
-        assert result[0].title == "충격적인 뉴스 1번입니다 테스트용으로 작성됨"
-        assert result[1].title == "충격적인 뉴스 2번입니다 테스트용으로 작성됨"
-
+    def test_crawl_by_keywords(
+        self,
+        mock_parse_item,
+        mock_search_api,
+        mock_sleep,
+        crawler,
+        articles,
+        duplicate_map,
+        crawl_kwargs,
+        expected_titles,
+        expected_checked_urls,
+    ):
+        """키워드별 크롤링 테스트 (날짜 필터·중복 체크 시나리오)"""
+        # 첫 번째 호출에만 결과 반환, 두 번째 호출에는 빈 리스트 반환 (더 이상 결과 없음)
+        mock_search_api.side_effect = [[{"title": article.title} for article in articles], []]
+        mock_parse_item.side_effect = articles
+        crawler.db_ops.check_duplicate_articles_batch.return_value = duplicate_map
+
+        result = crawler.crawl_by_keywords(["충격"], **crawl_kwargs)
+
+        assert [article.title for article in result] == expected_titles
+
+        if "target_date" in crawl_kwargs:
+            assert all(article.published_at.date() == crawl_kwargs["target_date"].date() for article in result)
+
+        if expected_checked_urls is None:
+            crawler.db_ops.check_duplicate_articles_batch.assert_not_called()
+        else:
+            crawler.db_ops.check_duplicate_articles_batch.assert_called_once()
+            checked_urls = crawler.db_ops.check_duplicate_articles_batch.call_args[0][0]
+            assert len(checked_urls) == len(expected_checked_urls)
+            assert set(checked_urls) == expected_checked_urls
+
+    @patch("src.crawlers.naver_crawler.time.sleep")
     @patch.object(NaverNewsCrawler, "search_news_api")
     @patch.object(NaverNewsCrawler, "parse_api_item")
-    def test_crawl_by_keywords_with_date_filter(self, mock_parse_item, mock_search_api, crawler):
-        """날짜 필터링을 적용한 키워드별 크롤링 테스트"""
-        target_date = datetime(2024, 1, 15)
-
-        # Mock API 검색 결과 - 첫 번째 호출에만 결과 반환
+    def test_crawl_by_keywords_skips_links_seen_in_previous_keyword(
+        self, mock_parse_item, mock_search_api, mock_sleep, crawler
+    ):
+        """키워드 간 중복 검색 결과는 한 번만 파싱하는지 테스트"""
         mock_search_api.side_effect = [
-            [{"title": "충격 뉴스 1"}, {"title": "충격 뉴스 2"}, {"title": "충격 뉴스 3"}],
-            [],  # 두 번째 호출에는 빈 리스트
-        ]
-
-        long_content = "이것은 테스트 기사 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다."
-
-        # Mock 파싱 결과 - 날짜가 다른 기사들
-        mock_article1 = Article(
-            title="충격적인 뉴스 1번 - 대상 날짜에 해당하는 기사",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime(2024, 1, 15, 10, 30, tzinfo=pytz.timezone("Asia/Seoul")),  # 대상 날짜
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-        )
-
-        mock_article2 = Article(
-            title="충격적인 뉴스 2번 - 미래 날짜에 해당하는 기사",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime(2024, 1, 16, 11, 30, tzinfo=pytz.timezone("Asia/Seoul")),  # 미래 날짜
-            naver_url="https://n.news.naver.com/article/421/0007123456",
-        )
-
-        mock_article3 = Article(
-            title="충격적인 뉴스 3번 - 과거 날짜에 해당하는 기사",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime(2024, 1, 14, 9, 30, tzinfo=pytz.timezone("Asia/Seoul")),  # 과거 날짜
-            naver_url="https://n.news.naver.com/article/123/0008123456",
-        )
-
-        mock_parse_item.side_effect = [mock_article1, mock_article2, mock_article3]
-
-        # Mock 배치 중복 체크 (날짜 필터링된 기사들만)
-        crawler.db_ops.check_duplicate_articles_batch.return_value = {
-            "https://n.news.naver.com/article/023/0003123456": False,  # 대상 날짜 기사
-        }
-
-        result = crawler.crawl_by_keywords(["충격"], target_date=target_date)
-
-        # 대상 날짜(2024-01-15)의 기사만 포함되어야 함
-        assert len(result) == 1
-        assert result[0].title == "충격적인 뉴스 1번 - 대상 날짜에 해당하는 기사"
-        assert result[0].published_at.date() == target_date.date()
-
-    @patch.object(NaverNewsCrawler, "search_news_api")
-    @patch.object(NaverNewsCrawler, "parse_api_item")
-    def test_crawl_by_keywords_without_duplicate_check(self, mock_parse_item, mock_search_api, crawler):
-        """중복 체크 없이 크롤링 테스트 (dry-run 모드 시뮬레이션)"""
-        # Mock API 검색 결과
-        mock_search_api.side_effect = [
-            [{"title": "테스트 뉴스 1"}, {"title": "테스트 뉴스 2"}],
-            [],  # 두 번째 호출에는 빈 리스트
-        ]
-
-        long_content = "이것은 테스트 기사 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다."
-
-        # Mock 파싱 결과
-        mock_article1 = Article(
-            title="테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-        )
-
-        mock_article2 = Article(
-            title="테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/421/0007123456",
-        )
-
-        mock_parse_item.side_effect = [mock_article1, mock_article2]
-
-        # check_duplicates=False로 호출 (dry-run 모드)
-        result = crawler.crawl_by_keywords(["테스트"], check_duplicates=False)
-
-        # 중복 체크를 하지 않았으므로 배치 중복 체크 메서드가 호출되지 않아야 함
-        crawler.db_ops.check_duplicate_articles_batch.assert_not_called()
-
-        # 모든 기사가 포함되어야 함
-        assert len(result) == 2
-        assert result[0].title == "테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함"
-        assert result[1].title == "테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함"
-
-    @patch.object(NaverNewsCrawler, "search_news_api")
-    @patch.object(NaverNewsCrawler, "parse_api_item")
-    def test_crawl_by_keywords_with_duplicate_check(self, mock_parse_item, mock_search_api, crawler):
-        """중복 체크 포함 크롤링 테스트 (일반 모드 시뮬레이션)"""
-        # Mock API 검색 결과
-        mock_search_api.side_effect = [
-            [{"title": "테스트 뉴스 1"}, {"title": "테스트 뉴스 2"}],
+            [{"title": "충격 뉴스", "link": "https://n.news.naver.com/article/023/0003123456"}],
             [],
-        ]
-
-        long_content = "이것은 테스트 기사 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다."
-
-        # Mock 파싱 결과
-        mock_article1 = Article(
-            title="테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-        )
-
-        mock_article2 = Article(
-            title="테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/421/0007123456",
-        )
-
-        mock_parse_item.side_effect = [mock_article1, mock_article2]
-
-        # 배치 중복 체크 설정: 첫 번째는 신규, 두 번째는 중복
-        crawler.db_ops.check_duplicate_articles_batch.return_value = {
-            "https://n.news.naver.com/article/023/0003123456": False,  # 첫 번째 기사: 신규
-            "https://n.news.naver.com/article/421/0007123456": True,  # 두 번째 기사: 중복
-        }
-
-        # check_duplicates=True로 호출 (기본값)
-        result = crawler.crawl_by_keywords(["테스트"], check_duplicates=True)
-
-        # 배치 중복 체크가 한 번 호출되어야 함
-        assert crawler.db_ops.check_duplicate_articles_batch.call_count == 1
-
-        # 중복이 아닌 첫 번째 기사만 포함되어야 함
-        assert len(result) == 1
-        assert result[0].title == "테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함"
-
-    @patch.object(NaverNewsCrawler, "search_news_api")
-    @patch.object(NaverNewsCrawler, "parse_api_item")
-    def test_crawl_by_keywords_batch_duplicate_removal(self, mock_parse_item, mock_search_api, crawler):
-        """배치 내 중복 URL 제거 테스트"""
-        # Mock API 검색 결과
-        mock_search_api.side_effect = [
-            [{"title": "테스트 뉴스 1"}, {"title": "테스트 뉴스 1 중복"}, {"title": "테스트 뉴스 2"}],
+            [{"title": "충격 뉴스", "link": "https://n.news.naver.com/mnews/article/023/0003123456?sid=100"}],
             [],
         ]
 
-        long_content = "이것은 테스트 기사 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다."
-
-        # Mock 파싱 결과 - 첫 번째와 두 번째가 같은 URL
-        mock_article1 = Article(
-            title="테스트 뉴스 1번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/023/0003123456",  # 같은 URL
-        )
-
-        mock_article2 = Article(
-            title="테스트 뉴스 1 중복입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/023/0003123456",  # 같은 URL (중복)
+        mock_parse_item.return_value = make_article(
+            "충격적인 뉴스 1번입니다 테스트용으로 작성됨", "https://n.news.naver.com/article/023/0003123456"
         )
 
-        mock_article3 = Article(
-            title="테스트 뉴스 2번입니다 충분히 긴 제목으로 작성함",
-            content=long_content,
-            journalist_name="익명",
-            publisher="네이버뉴스",
-            published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-            naver_url="https://n.news.naver.com/article/421/0007123456",  # 다른 URL
-        )
-
-        mock_parse_item.side_effect = [mock_article1, mock_article2, mock_article3]
-
-        # 배치 중복 체크 설정: 모든 기사가 신규 (배치 내 중복 제거 후)
-        crawler.db_ops.check_duplicate_articles_batch.return_value = {
-            "https://n.news.naver.com/article/023/0003123456": False,
-            "https://n.news.naver.com/article/421/0007123456": False,
-        }
+        with patch.object(crawler, "prefetch_article_pages", return_value=0):
+            result = crawler.crawl_by_keywords(["충격", "경악"], check_duplicates=False)
 
-        result = crawler.crawl_by_keywords(["테스트"], check_duplicates=True)
-
-        # 배치 내 중복이 제거되어 2개 기사만 반환되어야 함
-        assert len(result) == 2
-
-        # URL이 유니크한지 확인
-        urls = [article.naver_url for article in result]
-        assert len(set(urls)) == 2
-
-        # 첫 번째 기사가 우선 선택되었는지 확인
-        assert "https://n.news.naver.com/article/023/0003123456" in urls
-        assert "https://n.news.naver.com/article/421/0007123456" in urls
-
-        # 배치 중복 체크가 중복 제거된 URL들로만 호출되었는지 확인
-        call_args = crawler.db_ops.check_duplicate_articles_batch.call_args[0][0]
-        assert len(call_args) == 2
-        assert set(call_args) == {
-            "https://n.news.naver.com/article/023/0003123456",
-            "https://n.news.naver.com/article/421/0007123456",
-        }
+        assert len(result) == 1
+        mock_parse_item.assert_called_once()
 
     @patch.object(NaverNewsCrawler, "crawl_by_keywords")
     def test_crawl_and_save_success(self, mock_crawl, crawler):
@@ -479,13 +419,10 @@ class TestNaverNewsCrawler:
 
         # Mock 크롤링 결과
         mock_articles = [
-            Article(
-                title="테스트 기사 1번입니다 충분히 긴 제목으로 작성함",
+            make_article(
+                "테스트 기사 1번입니다 충분히 긴 제목으로 작성함",
+                "https://n.news.naver.com/article/023/0003123456",
                 content=long_content,
-                journalist_name="익명",
-                publisher="네이버뉴스",
-                published_at=datetime.now(pytz.timezone("Asia/Seoul")),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
             )
         ]
         mock_crawl.return_value = mock_articles
@@ -506,13 +443,11 @@ class TestNaverNewsCrawler:
         long_content = "이것은 테스트 기사의 내용입니다. 충분히 긴 내용이 포함되어 있습니다. 100자 이상이 되도록 더 많은 내용을 추가했습니다. 확실히 100자를 넘기기 위해 추가적인 텍스트를 더 넣어보겠습니다. 이제 확실히 100자가 넘었을 것입니다."
 
         mock_articles = [
-            Article(
-                title="테스트 기사 1번입니다 날짜 필터링 테스트용",
+            make_article(
+                "테스트 기사 1번입니다 날짜 필터링 테스트용",
+                "https://n.news.naver.com/article/023/0003123456",
+                published_at=datetime(2024, 1, 15, 10, 30, tzinfo=KST),
                 content=long_content,
-                journalist_name="익명",
-                publisher="네이버뉴스",
-                published_at=datetime(2024, 1, 15, 10, 30, tzinfo=pytz.timezone("Asia/Seoul")),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
             )
         ]
         mock_crawl.return_value = mock_articles
@@ -534,24 +469,69 @@ class TestNaverNewsCrawler:
 
     def test_session_cleanup(self, crawler):
         """세션 정리 테스트"""
+        original_session = crawler.session
         mock_session = Mock()
         crawler.session = mock_session
 
-        # __del__ 메서드 직접 호출
-        crawler.__del__()
+        try:
+            # __del__ 메서드 직접 호출
+            crawler.__del__()
+
+            mock_session.close.assert_called_once()
+        finally:
+            # 공유 크롤러의 실제 세션 복원
+            crawler.session = original_session
+
+    def test_clean_content_strings_matches_clean_content(self, crawler):
+        """텍스트 조각 기반 본문 정리가 전체 문자열 정리와 같은 결과인지 테스트"""
+        short_pieces = ["\n\n  첫 문단입니다.", "\n\n\n", "둘째 문단입니다.  \n"]
+        long_pieces = ["문단입니다.\n\n"] * 200
+
+        for pieces in (short_pieces, long_pieces):
+            assert crawler.clean_content_strings(iter(pieces)) == crawler.clean_content("".join(pieces))
 
-        mock_session.close.assert_called_once()
+        assert len(crawler.clean_content_strings(iter(long_pieces))) == 700
+
+    def test_parse_pub_date(self):
+        """발행시간 파싱 테스트 (고정 형식 및 dateutil 폴백)"""
+        result = parse_pub_date("Mon, 15 Jan 2024 10:30:00 +0900")
+        assert result == datetime(2024, 1, 15, 10, 30, tzinfo=KST)
+        assert result.utcoffset().total_seconds() == 9 * 3600
+
+        # 형식이 다른 경우 dateutil로 파싱
+        fallback = parse_pub_date("2024-01-15T01:30:00+00:00")
+        assert fallback == result
+
+        # 같은 입력은 캐시된 결과 재사용
+        assert parse_pub_date("Mon, 15 Jan 2024 10:30:00 +0900") is result
+
+
+class _FrozenDatetime(datetime):
+    """now()가 고정 시각을 반환하는 datetime (월 경계·자정 부근에서도 결과가 일정하도록)"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2024, 6, 15, 12, 0, 0, tzinfo=tz)
+
+
+# TestDateValidation에서 사용하는 고정 현재 시각
+FROZEN_NOW = datetime(2024, 6, 15, 12, 0, 0)
 
 
 class TestDateValidation:
     """날짜 검증 테스트 클래스"""
 
+    @pytest.fixture(autouse=True)
+    def freeze_now(self, monkeypatch):
+        """validate_date_format의 현재 시각 고정"""
+        monkeypatch.setattr("scripts.crawl_news.datetime", _FrozenDatetime)
+
     def test_valid_date_format(self):
         """올바른 날짜 형식 테스트"""
         from scripts.crawl_news import validate_date_format
 
         # 최근 날짜로 테스트 (오늘에서 1개월 전)
-        recent_date = (datetime.now() - relativedelta(months=1)).strftime("%Y-%m-%d")
+        recent_date = (FROZEN_NOW - relativedelta(months=1)).strftime("%Y-%m-%d")
         result = validate_date_format(recent_date)
 
         assert isinstance(result, datetime)
@@ -569,7 +549,7 @@ class TestDateValidation:
         from scripts.crawl_news import validate_date_format
 
         # 4개월 전 날짜
-        old_date = (datetime.now() - relativedelta(months=4)).strftime("%Y-%m-%d")
+        old_date = (FROZEN_NOW - relativedelta(months=4)).strftime("%Y-%m-%d")
 
         with pytest.raises(ValueError, match="너무 과거입니다"):
             validate_date_format(old_date)
@@ -579,7 +559,7 @@ class TestDateValidation:
         from scripts.crawl_news import validate_date_format
 
         # 내일 날짜
-        future_date = (datetime.now() + relativedelta(days=1)).strftime("%Y-%m-%d")
+        future_date = (FROZEN_NOW + relativedelta(days=1)).strftime("%Y-%m-%d")
 
         with pytest.raises(ValueError, match="미래 날짜입니다"):
             validate_date_format(future_date)
@@ -589,7 +569,7 @@ class TestDateValidation:
         from scripts.crawl_news import validate_date_format
 
         # 정확히 3개월 전 날짜 (허용되어야 함)
-        boundary_date = (datetime.now() - relativedelta(months=3)).strftime("%Y-%m-%d")
+        boundary_date = (FROZEN_NOW - relativedelta(months=3)).strftime("%Y-%m-%d")
         result = validate_date_format(boundary_date)
 
         assert isinstance(result, datetime)
@@ -599,7 +579,7 @@ class TestDateValidation:
         """오늘 날짜 테스트"""
         from scripts.crawl_news import validate_date_format
 
-        today = datetime.now().strftime("%Y-%m-%d")
+        today = FROZEN_NOW.strftime("%Y-%m-%d")
         result = validate_date_format(today)
 
         assert isinstance(result, datetime)
@@ -2,26 +2,76 @@
 데이터베이스 연산 테스트
 """
 
+import httpx
+import orjson
 import pytest
+from collections import namedtuple
 from unittest.mock import Mock, patch
 from datetime import datetime
+from typing import Optional
 
-from src.database.supabase_client import SupabaseClient
+from src.database.supabase_client import OrjsonHttpClient, SupabaseClient, get_supabase_client
 from src.database.operations import DatabaseOperations
 from src.models.article import Article
 
+# 기사 검증(100자 이상)을 통과하는 공용 테스트 본문
+LONG_CONTENT = "이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다."
+
+# 테스트 기사 공용 발행 시각
+PUBLISHED_AT = datetime(2024, 1, 1, 9, 0)
+
+
+# Supabase 쿼리 결과 대용 (Mock보다 생성 비용이 낮은 읽기 전용 튜플)
+Result = namedtuple("Result", "data")
+CountResult = namedtuple("CountResult", "data count")
+
+
+def make_result(data) -> Result:
+    """data 속성만 가진 Supabase 쿼리 결과 생성"""
+    return Result(data)
+
+
+# 호출 시 같은 쿼리 객체를 반환하는 PostgREST 빌더 메서드
+QUERY_BUILDER_METHODS = ("select", "insert", "update", "upsert", "eq", "gt", "in_", "is_", "like", "order", "limit")
+
+
+def make_query_chain(data) -> Mock:
+    """빌더 메서드가 자기 자신을 반환하고 execute()가 data를 돌려주는 쿼리 Mock 생성"""
+    query = Mock()
+    for method in QUERY_BUILDER_METHODS:
+        getattr(query, method).return_value = query
+    query.execute.return_value = make_result(data)
+    return query
+
+
+def make_article(title: str, naver_url: str, journalist_name: str = "홍길동", publisher: str = "조선일보") -> Article:
+    """공용 본문과 발행 시각으로 테스트용 Article 생성"""
+    return Article(
+        title=title,
+        content=LONG_CONTENT,
+        journalist_name=journalist_name,
+        publisher=publisher,
+        published_at=PUBLISHED_AT,
+        naver_url=naver_url,
+    )
+
 
 class TestSupabaseClient:
     """SupabaseClient 테스트"""
 
-    def test_client_initialization_with_env_vars(self):
+    @pytest.fixture(scope="class")
+    def supabase_env(self):
+        """Supabase 접속 환경변수 픽스처 (클래스 단위로 한 번만 패치)"""
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setenv("SUPABASE_URL", "https://test.supabase.co")
+            monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test-key")
+            yield
+
+    def test_client_initialization_with_env_vars(self, supabase_env):
         """환경변수로 클라이언트 초기화 테스트"""
-        with patch.dict(
-            "os.environ", {"SUPABASE_URL": "https://test.supabase.co", "SUPABASE_SERVICE_ROLE_KEY": "test-key"}
-        ):
-            client = SupabaseClient()
-            assert client.url == "https://test.supabase.co"
-            assert client.key == "test-key"
+        client = SupabaseClient()
+        assert client.url == "https://test.supabase.co"
+        assert client.key == "test-key"
 
     def test_client_initialization_with_params(self):
         """파라미터로 클라이언트 초기화 테스트"""
@@ -29,19 +79,19 @@ class TestSupabaseClient:
         assert client.url == "https://test.supabase.co"
         assert client.key == "test-key"
 
-    def test_client_initialization_missing_env_vars(self):
+    def test_client_initialization_missing_env_vars(self, monkeypatch):
         """환경변수 누락 시 오류 테스트"""
-        with (
-            patch.dict("os.environ", {}, clear=True),
-            patch("src.database.supabase_client.load_dotenv"),
-        ):  # load_dotenv() 호출 무효화
-            with pytest.raises(ValueError, match="SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY 환경변수가 필요합니다"):
-                SupabaseClient()
+        monkeypatch.delenv("SUPABASE_URL", raising=False)
+        monkeypatch.delenv("SUPABASE_SERVICE_ROLE_KEY", raising=False)
+
+        with pytest.raises(ValueError, match="SUPABASE_URL과 SUPABASE_SERVICE_ROLE_KEY 환경변수가 필요합니다"):
+            SupabaseClient()
 
     @patch("src.database.supabase_client.create_client")
     def test_client_property_lazy_initialization(self, mock_create_client):
         """클라이언트 지연 초기화 테스트"""
         mock_client = Mock()
+        mock_client.postgrest.session = httpx.Client(base_url="https://test.supabase.co/rest/v1/")
         mock_create_client.return_value = mock_client
 
         client = SupabaseClient(url="https://test.supabase.co", key="test-key")
@@ -50,6 +100,8 @@ class TestSupabaseClient:
         result1 = client.client
         assert result1 == mock_client
         mock_create_client.assert_called_once_with("https://test.supabase.co", "test-key")
+        # PostgREST 세션을 커넥션 풀을 조정한 HTTP 클라이언트로 교체
+        assert isinstance(mock_client.postgrest.session, OrjsonHttpClient)
 
         # 두 번째 접근 (캐시된 인스턴스 사용)
         result2 = client.client
@@ -57,43 +109,110 @@ class TestSupabaseClient:
         # create_client는 한 번만 호출되어야 함
         assert mock_create_client.call_count == 1
 
+    def test_pooled_http_client_scoped_to_postgrest(self):
+        """커넥션 풀 HTTP 클라이언트가 PostgREST에만 적용되고 storage/functions와 공유되지 않는지 테스트"""
+        client = SupabaseClient(url="https://test.supabase.co", key="test-key").client
+
+        session = client.postgrest.session
+        assert isinstance(session, OrjsonHttpClient)
+        assert session.base_url == "https://test.supabase.co/rest/v1/"
+        assert session.headers["apikey"] == "test-key"
+        assert client.storage.session is not session
+        assert client.functions._client is not session
+
+    @patch("src.database.supabase_client._supabase_client", None)
+    def test_get_supabase_client_singleton(self, supabase_env):
+        """get_supabase_client가 프로세스 전체에서 같은 인스턴스를 반환하는지 테스트"""
+        assert get_supabase_client() is get_supabase_client()
+
+    def test_http_client_serializes_json_with_orjson(self):
+        """HTTP 클라이언트 JSON 본문 orjson 직렬화 테스트 (httpx 요청 경로 그대로 전송)"""
+        rows = [{"title": "테스트 기사", "naver_url": "https://n.news.naver.com/article/023/0003123456"}]
+        sent_requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_requests.append(request)
+            return httpx.Response(201, json=rows)
+
+        with OrjsonHttpClient(transport=httpx.MockTransport(handler)) as http_client:
+            response = http_client.request("POST", "https://test.supabase.co/rest/v1/articles", json=rows)
+            http_client.request("GET", "https://test.supabase.co/rest/v1/articles")
+
+        assert response.status_code == 201
+        post_request, get_request = sent_requests
+        assert post_request.content == orjson.dumps(rows)
+        assert post_request.headers["Content-Type"] == "application/json"
+        assert get_request.content == b""
+
+    @pytest.mark.parametrize(
+        "table_side_effect, expected",
+        [(None, True), (Exception("Connection failed"), False)],
+        ids=["success", "failure"],
+    )
     @patch("src.database.supabase_client.create_client")
-    def test_connection_test_success(self, mock_create_client):
-        """연결 테스트 성공"""
+    def test_connection_test(self, mock_create_client, table_side_effect, expected):
+        """연결 테스트 성공/실패"""
         mock_client = Mock()
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_limit = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.limit.return_value = mock_limit
-        mock_limit.execute.return_value = Mock(data=[])
-
+        mock_client.postgrest.session = httpx.Client(base_url="https://test.supabase.co/rest/v1/")
+        mock_client.table.return_value = make_query_chain([])
+        mock_client.table.side_effect = table_side_effect
         mock_create_client.return_value = mock_client
 
         client = SupabaseClient(url="https://test.supabase.co", key="test-key")
 
-        assert client.test_connection() is True
+        assert client.test_connection() is expected
 
-    @patch("src.database.supabase_client.create_client")
-    def test_connection_test_failure(self, mock_create_client):
-        """연결 테스트 실패"""
-        mock_client = Mock()
-        mock_client.table.side_effect = Exception("Connection failed")
-        mock_create_client.return_value = mock_client
 
-        client = SupabaseClient(url="https://test.supabase.co", key="test-key")
+class SupabaseChain:
+    """table -> select -> eq -> eq -> execute 형태의 Mock 체인"""
+
+    def __init__(self, mock_client: Mock):
+        # 중간 단계 Mock은 return_value 접근으로 자동 생성된 것을 그대로 사용
+        self.table = mock_client.table.return_value
+        self.select = self.table.select.return_value
+        self.eq1 = self.select.eq.return_value
+        self.eq2 = self.eq1.eq.return_value
+        self.insert = self.table.insert.return_value
+
+    def set_select_result(self, data: list) -> None:
+        """select().eq().eq() 조회 결과 설정"""
+        self.eq2.execute.return_value = make_result(data)
+
+    def set_count_result(self, count: int) -> None:
+        """select().eq() 카운트 조회 결과 설정"""
+        self.eq1.execute.return_value = CountResult([], count)
 
-        assert client.test_connection() is False
+    def set_insert_result(self, data: list) -> None:
+        """insert() 결과 설정"""
+        self.insert.execute.return_value = make_result(data)
+
+
+def make_table_dispatch(tables: dict, default: Optional[Mock] = None):
+    """테이블 이름별 Mock을 반환하는 table() side_effect 생성 (없는 테이블은 default 또는 새 Mock)"""
+    return lambda table_name: tables.get(table_name) or default or Mock()
+
+
+def make_stats_table_router(journalists_data: list, articles_data: list):
+    """journalists/articles 조회 결과로 table() 분기 side_effect 생성"""
+    journalists_select = Mock()
+    journalists_select.execute.return_value = make_result(journalists_data)
+    articles_eq = Mock()
+    articles_eq.execute.return_value = make_result(articles_data)
+
+    return make_table_dispatch(
+        {
+            "journalists": Mock(select=Mock(return_value=journalists_select)),
+            "articles": Mock(select=Mock(return_value=Mock(eq=Mock(return_value=articles_eq)))),
+        }
+    )
 
 
 class TestDatabaseOperations:
     """DatabaseOperations 테스트"""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Mock Supabase 클라이언트 픽스처"""
+    @pytest.fixture(scope="class", autouse=True)
+    def patched_client(self):
+        """클래스 단위로 get_supabase_client를 한 번만 패치하는 픽스처"""
         with patch("src.database.operations.get_supabase_client") as mock_get_client:
             mock_supabase_client = Mock()
             mock_client = Mock()
@@ -101,220 +220,196 @@ class TestDatabaseOperations:
             mock_get_client.return_value = mock_supabase_client
             yield mock_client
 
-    def test_get_or_create_journalist_existing(self, mock_client):
-        """기존 기자 조회 테스트"""
-        # Mock 설정
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq1 = Mock()
-        mock_eq2 = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq1
-        mock_eq1.eq.return_value = mock_eq2
-        mock_eq2.execute.return_value = Mock(data=[{"id": "journalist-123", "name": "홍길동", "publisher": "조선일보"}])
-
-        db_ops = DatabaseOperations()
-        result = db_ops.get_or_create_journalist("홍길동", "조선일보")
-
-        assert result["id"] == "journalist-123"
-        assert result["name"] == "홍길동"
-        assert result["publisher"] == "조선일보"
-
-    def test_get_or_create_journalist_new(self, mock_client):
-        """새 기자 생성 테스트"""
-        # 기존 기자 조회 Mock (빈 결과)
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq1 = Mock()
-        mock_eq2 = Mock()
+    @pytest.fixture
+    def mock_client(self, patched_client):
+        """Mock Supabase 클라이언트 픽스처 (테스트마다 설정 초기화)"""
+        patched_client.reset_mock(return_value=True, side_effect=True)
+        return patched_client
 
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq1
-        mock_eq1.eq.return_value = mock_eq2
-        mock_eq2.execute.return_value = Mock(data=[])
+    @pytest.fixture
+    def supabase_chain(self, mock_client):
+        """mock_client에 연결된 공용 Mock 체인 픽스처"""
+        return SupabaseChain(mock_client)
 
-        # 새 기자 생성 Mock
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = Mock(
-            data=[{"id": "journalist-456", "name": "김철수", "publisher": "중앙일보"}]
+    @pytest.fixture
+    def db_ops(self, mock_client):
+        """Mock 클라이언트를 사용하는 DatabaseOperations 픽스처"""
+        return DatabaseOperations()
+
+    @pytest.mark.parametrize(
+        "select_result, insert_result, args, expected",
+        [
+            # 기존 기자 조회
+            (
+                [{"id": "journalist-123", "name": "홍길동", "publisher": "조선일보"}],
+                None,
+                ("홍길동", "조선일보"),
+                {"id": "journalist-123", "name": "홍길동", "publisher": "조선일보"},
+            ),
+            # 기존 기자 조회 결과 없음 -> 새 기자 생성
+            (
+                [],
+                [{"id": "journalist-456", "name": "김철수", "publisher": "중앙일보"}],
+                ("김철수", "중앙일보", "uuid123"),
+                {"id": "journalist-456", "name": "김철수", "publisher": "중앙일보"},
+            ),
+        ],
+        ids=["existing", "new"],
+    )
+    def test_get_or_create_journalist(
+        self, mock_client, supabase_chain, db_ops, select_result, insert_result, args, expected
+    ):
+        """기존 기자 조회 / 새 기자 생성 테스트"""
+        supabase_chain.set_select_result(select_result)
+        if insert_result is not None:
+            supabase_chain.set_insert_result(insert_result)
+
+        result = db_ops.get_or_create_journalist(*args)
+
+        assert {key: result[key] for key in ("id", "name", "publisher")} == expected
+        if insert_result is None:
+            supabase_chain.insert.execute.assert_not_called()
+
+    def test_get_or_create_journalist_cached(self, mock_client, supabase_chain, db_ops):
+        """같은 기자 재조회 시 캐시 사용 테스트"""
+        supabase_chain.set_select_result([{"id": "journalist-123", "name": "홍길동", "publisher": "조선일보"}])
+
+        first = db_ops.get_or_create_journalist("홍길동", "조선일보")
+        second = db_ops.get_or_create_journalist(" 홍길동 ", "조선일보")
+
+        assert first is second
+        supabase_chain.table.select.assert_called_once()
+
+    def test_get_or_create_journalist_anonymous(self, mock_client, supabase_chain, db_ops):
+        """익명 기자 생성 테스트"""
+        # 기존 기자 조회 결과 없음 -> 새 기자 생성
+        supabase_chain.set_select_result([])
+        supabase_chain.set_insert_result(
+            [{"id": "journalist-anonymous", "name": "익명기자_조선일보", "publisher": "조선일보"}]
         )
 
-        db_ops = DatabaseOperations()
-        result = db_ops.get_or_create_journalist("김철수", "중앙일보", "uuid123")
+        # 익명 기자 맵 로드 Mock (빈 결과)
+        supabase_chain.select.like.return_value.execute.return_value = make_result([])
 
-        assert result["id"] == "journalist-456"
-        assert result["name"] == "김철수"
-        assert result["publisher"] == "중앙일보"
-
-    def test_get_or_create_journalist_anonymous(self, mock_client):
-        """익명 기자 생성 테스트"""
-        # 기존 기자 조회 Mock (빈 결과)
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq1 = Mock()
-        mock_eq2 = Mock()
+        result = db_ops.get_or_create_journalist("익명", "조선일보")
 
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq1
-        mock_eq1.eq.return_value = mock_eq2
-        mock_eq2.execute.return_value = Mock(data=[])
+        # 익명 기자명이 언론사별로 정규화되는지 확인
+        assert result["id"] == "journalist-anonymous"
+        assert result["name"] == "익명기자_조선일보"
+        assert result["publisher"] == "조선일보"
 
-        # 새 기자 생성 Mock
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = Mock(
-            data=[{"id": "journalist-anonymous", "name": "익명기자_조선일보", "publisher": "조선일보"}]
+        # 새로 생성된 익명 기자는 맵에 캐시되어 재조회하지 않음
+        again = db_ops.get_or_create_journalist("기자", "조선일보")
+        assert again["id"] == "journalist-anonymous"
+        supabase_chain.select.like.assert_called_once_with("name", r"익명기자\_%")
+        supabase_chain.insert.execute.assert_called_once()
+
+    def test_get_or_create_journalist_anonymous_preloaded(self, mock_client, db_ops):
+        """미리 로드된 익명 기자 맵 사용 테스트 (익명 기자명과 정확히 일치하는 행만 사용)"""
+        mock_select = mock_client.table.return_value.select.return_value
+        mock_select.like.return_value.execute.return_value = make_result(
+            [
+                {"id": "journalist-anonymous", "name": "익명기자_조선일보", "publisher": "조선일보"},
+                {"id": "journalist-other", "name": "익명기자_조선일보_사회부", "publisher": "조선일보"},
+            ]
         )
 
-        db_ops = DatabaseOperations()
         result = db_ops.get_or_create_journalist("익명", "조선일보")
 
-        # 익명 기자명이 언론사별로 정규화되는지 확인
         assert result["id"] == "journalist-anonymous"
-        assert result["name"] == "익명기자_조선일보"
-        assert result["publisher"] == "조선일보"
+        mock_select.eq.assert_not_called()
+        mock_client.table.return_value.insert.assert_not_called()
 
-    def test_get_or_create_journalist_normalize_name(self, mock_client):
-        """기자명 정규화 테스트"""
-        test_cases = [
+    @pytest.mark.parametrize(
+        "input_name, expected_name",
+        [
             ("", "익명기자_중앙일보"),
             ("   ", "익명기자_중앙일보"),
             ("기자", "익명기자_중앙일보"),
             ("  홍길동  ", "홍길동"),  # 공백 제거
-        ]
-
-        # 기존 기자 조회 Mock (빈 결과)
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq1 = Mock()
-        mock_eq2 = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq1
-        mock_eq1.eq.return_value = mock_eq2
-        mock_eq2.execute.return_value = Mock(data=[])
-
-        # 새 기자 생성 Mock
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-
-        db_ops = DatabaseOperations()
-
-        for input_name, expected_name in test_cases:
-            mock_insert.execute.return_value = Mock(
-                data=[{"id": f"journalist-{expected_name}", "name": expected_name, "publisher": "중앙일보"}]
-            )
-
-            result = db_ops.get_or_create_journalist(input_name, "중앙일보")
-            assert result["name"] == expected_name
-
-    def test_check_duplicate_article_exists(self, mock_client):
-        """중복 기사 존재 테스트"""
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.execute.return_value = Mock(data=[{"id": "article-123"}])
-
-        db_ops = DatabaseOperations()
-        result = db_ops.check_duplicate_article("https://n.news.naver.com/article/023/0003123456")
+        ],
+    )
+    def test_get_or_create_journalist_normalize_name(
+        self, mock_client, supabase_chain, db_ops, input_name, expected_name
+    ):
+        """기자명 정규화 테스트"""
+        # 기존 기자 조회 결과 없음 -> 새 기자 생성
+        supabase_chain.set_select_result([])
+        supabase_chain.select.like.return_value.execute.return_value = make_result([])
+        supabase_chain.set_insert_result(
+            [{"id": f"journalist-{expected_name}", "name": expected_name, "publisher": "중앙일보"}]
+        )
 
-        assert result is True
+        result = db_ops.get_or_create_journalist(input_name, "중앙일보")
 
-    def test_check_duplicate_article_not_exists(self, mock_client):
-        """중복 기사 미존재 테스트"""
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq = Mock()
+        assert result["name"] == expected_name
 
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-        mock_eq.execute.return_value = Mock(data=[])
+    @pytest.mark.parametrize("count, expected", [(1, True), (0, False)], ids=["exists", "not_exists"])
+    def test_check_duplicate_article(self, mock_client, supabase_chain, db_ops, count, expected):
+        """중복 기사 존재/미존재 테스트"""
+        supabase_chain.set_count_result(count)
 
-        db_ops = DatabaseOperations()
         result = db_ops.check_duplicate_article("https://n.news.naver.com/article/023/0003123456")
 
-        assert result is False
+        assert result is expected
+        supabase_chain.table.select.assert_called_once_with("id", count="exact", head=True)
+
+    @pytest.mark.parametrize(
+        "urls, existing_urls",
+        [
+            # 일부 중복
+            (
+                [
+                    "https://n.news.naver.com/article/023/0003123456",
+                    "https://n.news.naver.com/article/421/0007123456",
+                    "https://n.news.naver.com/article/999/0001234567",
+                ],
+                ["https://n.news.naver.com/article/023/0003123456", "https://n.news.naver.com/article/421/0007123456"],
+            ),
+            # 모두 신규
+            (
+                ["https://n.news.naver.com/article/023/0003123456", "https://n.news.naver.com/article/421/0007123456"],
+                [],
+            ),
+        ],
+        ids=["mixed", "all_new"],
+    )
+    def test_check_duplicate_articles_batch(self, mock_client, db_ops, urls, existing_urls):
+        """배치 중복 체크 테스트"""
+        mock_client.table.return_value = make_query_chain([{"naver_url": url} for url in existing_urls])
 
-    def test_check_duplicate_articles_batch_mixed(self, mock_client):
-        """배치 중복 체크 테스트 - 일부 중복"""
-        # Mock 설정 - 기존 기사들
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_in = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.in_.return_value = mock_in
-        mock_in.execute.return_value = Mock(
-            data=[
-                {"naver_url": "https://n.news.naver.com/article/023/0003123456"},
-                {"naver_url": "https://n.news.naver.com/article/421/0007123456"},
-            ]
-        )
-
-        db_ops = DatabaseOperations()
-        urls = [
-            "https://n.news.naver.com/article/023/0003123456",  # 중복
-            "https://n.news.naver.com/article/421/0007123456",  # 중복
-            "https://n.news.naver.com/article/999/0001234567",  # 신규
-        ]
         result = db_ops.check_duplicate_articles_batch(urls)
 
-        expected = {
-            "https://n.news.naver.com/article/023/0003123456": True,  # 중복
-            "https://n.news.naver.com/article/421/0007123456": True,  # 중복
-            "https://n.news.naver.com/article/999/0001234567": False,  # 신규
-        }
-        assert result == expected
+        assert result == {url: url in existing_urls for url in urls}
 
-    def test_check_duplicate_articles_batch_all_new(self, mock_client):
-        """배치 중복 체크 테스트 - 모두 신규"""
-        # Mock 설정 - 기존 기사 없음
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_in = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.in_.return_value = mock_in
-        mock_in.execute.return_value = Mock(data=[])
-
-        db_ops = DatabaseOperations()
-        urls = [
-            "https://n.news.naver.com/article/023/0003123456",
-            "https://n.news.naver.com/article/421/0007123456",
+    def test_check_duplicate_articles_batch_chunked(self, mock_client, db_ops):
+        """배치 중복 체크 청크 분할 및 URL 정규화 테스트"""
+        mock_in = mock_client.table.return_value.select.return_value.in_
+        mock_in.return_value.execute.side_effect = [
+            make_result([{"naver_url": "https://n.news.naver.com/article/023/0000000000"}]),
+            make_result([]),
         ]
+
+        urls = [f"https://n.news.naver.com/article/023/{i:010d}" for i in range(150)]
+        urls[0] = "https://n.news.naver.com/mnews/article/023/0000000000?sid=100"
         result = db_ops.check_duplicate_articles_batch(urls)
 
-        expected = {
-            "https://n.news.naver.com/article/023/0003123456": False,
-            "https://n.news.naver.com/article/421/0007123456": False,
-        }
-        assert result == expected
+        assert mock_in.call_count == 2
+        assert len(mock_in.call_args_list[0][0][1]) == 100
+        assert len(mock_in.call_args_list[1][0][1]) == 50
+        assert result[urls[0]] is True
+        assert sum(result.values()) == 1
 
-    def test_check_duplicate_articles_batch_empty(self, mock_client):
+    def test_check_duplicate_articles_batch_empty(self, mock_client, db_ops):
         """배치 중복 체크 테스트 - 빈 리스트"""
-        db_ops = DatabaseOperations()
         result = db_ops.check_duplicate_articles_batch([])
         assert result == {}
 
-    def test_check_duplicate_articles_batch_error(self, mock_client):
+    def test_check_duplicate_articles_batch_error(self, mock_client, db_ops):
         """배치 중복 체크 에러 테스트"""
         # Mock 설정 - 에러 발생
         mock_client.table.side_effect = Exception("Database error")
 
-        db_ops = DatabaseOperations()
         urls = ["https://n.news.naver.com/article/023/0003123456"]
         result = db_ops.check_duplicate_articles_batch(urls)
 
@@ -322,167 +417,101 @@ class TestDatabaseOperations:
         expected = {"https://n.news.naver.com/article/023/0003123456": False}
         assert result == expected
 
-    def test_get_or_create_journalists_batch_mixed(self, mock_client):
-        """배치 기자 조회/생성 테스트 - 일부 기존, 일부 신규"""
-        # Mock 설정 - 기존 기자 조회
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq_name = Mock()
-        mock_eq_publisher = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq_name
-        mock_eq_name.eq.return_value = mock_eq_publisher
-
-        # 첫 번째 기자는 기존, 두 번째는 없음, 세 번째는 기존
-        mock_eq_publisher.execute.side_effect = [
-            Mock(data=[{"id": "journalist-1", "name": "기자A", "publisher": "언론사1"}]),  # 기존
-            Mock(data=[]),  # 없음
-            Mock(data=[{"id": "journalist-3", "name": "기자C", "publisher": "언론사2"}]),  # 기존
-        ]
-
-        # 새 기자 배치 생성 Mock
-        mock_insert = Mock()
-        mock_table.insert.return_value = mock_insert
-        mock_insert.execute.return_value = Mock(data=[{"id": "journalist-2", "name": "기자B", "publisher": "언론사1"}])
-
-        db_ops = DatabaseOperations()
-        journalist_specs = [
-            ("기자A", "언론사1"),  # 기존
-            ("기자B", "언론사1"),  # 신규
-            ("기자C", "언론사2"),  # 기존
-        ]
-
-        result = db_ops.get_or_create_journalists_batch(journalist_specs)
-
-        # 모든 기자가 결과에 포함되어야 함
-        assert len(result) == 3
-        assert "기자A_언론사1" in result
-        assert "기자B_언론사1" in result
-        assert "기자C_언론사2" in result
-
-        # 배치 생성이 한 번 호출되어야 함 (기자B만)
-        mock_table.insert.assert_called_once()
-
-    def test_get_or_create_journalists_batch_all_existing(self, mock_client):
-        """배치 기자 조회/생성 테스트 - 모두 기존"""
-        # Mock 설정 - 모든 기자가 기존에 존재
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq_name = Mock()
-        mock_eq_publisher = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq_name
-        mock_eq_name.eq.return_value = mock_eq_publisher
-
-        mock_eq_publisher.execute.side_effect = [
-            Mock(data=[{"id": "journalist-1", "name": "기자A", "publisher": "언론사1"}]),
-            Mock(data=[{"id": "journalist-2", "name": "기자B", "publisher": "언론사2"}]),
-        ]
-
-        db_ops = DatabaseOperations()
-        journalist_specs = [("기자A", "언론사1"), ("기자B", "언론사2")]
-
-        result = db_ops.get_or_create_journalists_batch(journalist_specs)
-
-        assert len(result) == 2
-        assert "기자A_언론사1" in result
-        assert "기자B_언론사2" in result
-
-        # 새 기자 생성이 호출되지 않아야 함
-        mock_table.insert.assert_not_called()
-
-    def test_get_or_create_journalists_batch_all_new(self, mock_client):
-        """배치 기자 조회/생성 테스트 - 모두 신규"""
-        # Mock 설정 - 기존 기자 없음
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq_name = Mock()
-        mock_eq_publisher = Mock()
-        mock_insert = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq_name
-        mock_eq_name.eq.return_value = mock_eq_publisher
-        mock_table.insert.return_value = mock_insert
-
-        # 기존 기자 조회 - 모두 없음
-        mock_eq_publisher.execute.return_value = Mock(data=[])
-
-        # 배치 생성 성공
-        mock_insert.execute.return_value = Mock(
-            data=[
-                {"id": "journalist-1", "name": "기자A", "publisher": "언론사1"},
-                {"id": "journalist-2", "name": "기자B", "publisher": "언론사2"},
+    @pytest.mark.parametrize(
+        "specs, existing_results, insert_data, expected_keys, insert_called",
+        [
+            # 일부 기존, 일부 신규 (기자B만 배치 생성)
+            (
+                [("기자A", "언론사1"), ("기자B", "언론사1"), ("기자C", "언론사2")],
+                [
+                    [{"id": "journalist-1", "name": "기자A", "publisher": "언론사1"}],
+                    [],
+                    [{"id": "journalist-3", "name": "기자C", "publisher": "언론사2"}],
+                ],
+                [{"id": "journalist-2", "name": "기자B", "publisher": "언론사1"}],
+                {("기자A", "언론사1"), ("기자B", "언론사1"), ("기자C", "언론사2")},
+                True,
+            ),
+            # 모두 기존 (새 기자 생성 없음)
+            (
+                [("기자A", "언론사1"), ("기자B", "언론사2")],
+                [
+                    [{"id": "journalist-1", "name": "기자A", "publisher": "언론사1"}],
+                    [{"id": "journalist-2", "name": "기자B", "publisher": "언론사2"}],
+                ],
+                None,
+                {("기자A", "언론사1"), ("기자B", "언론사2")},
+                False,
+            ),
+            # 모두 신규
+            (
+                [("기자A", "언론사1"), ("기자B", "언론사2")],
+                [[], []],
+                [
+                    {"id": "journalist-1", "name": "기자A", "publisher": "언론사1"},
+                    {"id": "journalist-2", "name": "기자B", "publisher": "언론사2"},
+                ],
+                {("기자A", "언론사1"), ("기자B", "언론사2")},
+                True,
+            ),
+            # 익명 기자 정규화 (익명/빈 문자열 -> 익명기자_언론사)
+            (
+                [("익명", "언론사1"), ("", "언론사2")],
+                [[], []],
+                [
+                    {"id": "journalist-1", "name": "익명기자_언론사1", "publisher": "언론사1"},
+                    {"id": "journalist-2", "name": "익명기자_언론사2", "publisher": "언론사2"},
+                ],
+                {("익명기자_언론사1", "언론사1"), ("익명기자_언론사2", "언론사2")},
+                True,
+            ),
+        ],
+        ids=["mixed", "all_existing", "all_new", "anonymous_normalization"],
+    )
+    def test_get_or_create_journalists_batch(
+        self, mock_client, supabase_chain, db_ops, specs, existing_results, insert_data, expected_keys, insert_called
+    ):
+        """배치 기자 조회/생성 테스트 (RPC 미적용 시 조회 후 생성 폴백)"""
+        mock_client.rpc.side_effect = Exception("function not found")
+        supabase_chain.eq2.execute.side_effect = [make_result(data) for data in existing_results]
+        if insert_data is not None:
+            supabase_chain.set_insert_result(insert_data)
+
+        result = db_ops.get_or_create_journalists_batch(specs)
+
+        assert set(result) == expected_keys
+        assert supabase_chain.table.insert.called is insert_called
+
+    def test_get_or_create_journalists_batch_rpc(self, mock_client, db_ops):
+        """get_or_create_journalists RPC 한 번으로 기자 일괄 조회/생성 테스트"""
+        specs = [(f"기자{i}", f"언론사{i % 5}") for i in range(20)]
+        mock_client.rpc.return_value.execute.return_value = make_result(
+            [
+                {"id": f"journalist-{i}", "name": name, "publisher": publisher}
+                for i, (name, publisher) in enumerate(specs)
             ]
         )
 
-        db_ops = DatabaseOperations()
-        journalist_specs = [("기자A", "언론사1"), ("기자B", "언론사2")]
-
-        result = db_ops.get_or_create_journalists_batch(journalist_specs)
+        result = db_ops.get_or_create_journalists_batch(specs)
 
-        assert len(result) == 2
-        assert "기자A_언론사1" in result
-        assert "기자B_언론사2" in result
-
-        # 배치 생성이 한 번 호출되어야 함
-        mock_table.insert.assert_called_once()
-
-    def test_get_or_create_journalists_batch_anonymous_normalization(self, mock_client):
-        """배치 기자 조회/생성 테스트 - 익명 기자 정규화"""
-        # Mock 설정
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_eq_name = Mock()
-        mock_eq_publisher = Mock()
-        mock_insert = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq_name
-        mock_eq_name.eq.return_value = mock_eq_publisher
-        mock_table.insert.return_value = mock_insert
-
-        # 기존 기자 없음
-        mock_eq_publisher.execute.return_value = Mock(data=[])
-
-        # 배치 생성 성공
-        mock_insert.execute.return_value = Mock(
-            data=[
-                {"id": "journalist-1", "name": "익명기자_언론사1", "publisher": "언론사1"},
-                {"id": "journalist-2", "name": "익명기자_언론사2", "publisher": "언론사2"},
-            ]
-        )
-
-        db_ops = DatabaseOperations()
-        journalist_specs = [
-            ("익명", "언론사1"),  # 익명 -> 익명기자_언론사1
-            ("", "언론사2"),  # 빈 문자열 -> 익명기자_언론사2
-        ]
-
-        result = db_ops.get_or_create_journalists_batch(journalist_specs)
-
-        assert len(result) == 2
-        assert "익명기자_언론사1_언론사1" in result
-        assert "익명기자_언론사2_언론사2" in result
+        assert set(result) == set(specs)
+        mock_client.rpc.assert_called_once()
+        rpc_name, rpc_params = mock_client.rpc.call_args[0]
+        assert rpc_name == "get_or_create_journalists"
+        assert [(row["name"], row["publisher"]) for row in rpc_params["p_journalists"]] == specs
+        mock_client.table.assert_not_called()
 
-    def test_get_or_create_journalists_batch_empty(self, mock_client):
+    def test_get_or_create_journalists_batch_empty(self, mock_client, db_ops):
         """배치 기자 조회/생성 테스트 - 빈 리스트"""
-        db_ops = DatabaseOperations()
         result = db_ops.get_or_create_journalists_batch([])
         assert result == {}
 
-    def test_get_or_create_journalists_batch_error_handling(self, mock_client):
+    def test_get_or_create_journalists_batch_error_handling(self, mock_client, db_ops):
         """배치 기자 조회/생성 에러 테스트"""
         # Mock 설정 - 에러 발생
+        mock_client.rpc.side_effect = Exception("Database error")
         mock_client.table.side_effect = Exception("Database error")
 
-        db_ops = DatabaseOperations()
         journalist_specs = [("기자A", "언론사1")]
 
         result = db_ops.get_or_create_journalists_batch(journalist_specs)
@@ -490,221 +519,234 @@ class TestDatabaseOperations:
         # 에러 시 빈 딕셔너리 반환
         assert result == {}
 
-    def test_insert_article_success(self, mock_client):
+    def test_insert_article_success(self, mock_client, supabase_chain, db_ops):
         """기사 삽입 성공 테스트"""
         # get_or_create_journalist Mock
-        with patch.object(DatabaseOperations, "get_or_create_journalist") as mock_get_journalist:
+        with patch.object(DatabaseOperations, "get_or_create_journalist", autospec=True) as mock_get_journalist:
             mock_get_journalist.return_value = {"id": "journalist-123"}
+            supabase_chain.set_insert_result([{"id": "article-123", "title": "테스트 기사 제목입니다"}])
 
-            # insert Mock
-            mock_table = Mock()
-            mock_insert = Mock()
-
-            mock_client.table.return_value = mock_table
-            mock_table.insert.return_value = mock_insert
-            mock_insert.execute.return_value = Mock(data=[{"id": "article-123", "title": "테스트 기사 제목입니다"}])
-
-            db_ops = DatabaseOperations()
-
-            article = Article(
-                title="테스트 기사 제목입니다",
-                content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 넘겼을 것입니다.",
-                journalist_name="홍길동",
-                publisher="조선일보",
-                published_at=datetime.now(),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
-            )
+            article = make_article("테스트 기사 제목입니다", "https://n.news.naver.com/article/023/0003123456")
 
             result = db_ops.insert_article(article)
 
             assert result["id"] == "article-123"
             assert result["title"] == "테스트 기사 제목입니다"
 
-    def test_get_unprocessed_articles(self, mock_client):
+    def test_get_unprocessed_articles(self, mock_client, db_ops):
         """미처리 기사 조회 테스트"""
-        mock_table = Mock()
-        mock_select = Mock()
-        mock_is = Mock()
-        mock_limit = Mock()
-
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.is_.return_value = mock_is
-        mock_is.limit.return_value = mock_limit
-        mock_limit.execute.return_value = Mock(
-            data=[{"id": "article-1", "title": "기사 1"}, {"id": "article-2", "title": "기사 2"}]
+        mock_client.table.return_value = make_query_chain(
+            [{"id": "article-1", "title": "기사 1"}, {"id": "article-2", "title": "기사 2"}]
         )
 
-        db_ops = DatabaseOperations()
         result = db_ops.get_unprocessed_articles(limit=100)
 
         assert len(result) == 2
         assert result[0]["id"] == "article-1"
         assert result[1]["id"] == "article-2"
+        mock_client.table.return_value.order.assert_called_once_with("id")
+        mock_client.table.return_value.gt.assert_not_called()
 
-    def test_update_article_score_success(self, mock_client):
-        """기사 점수 업데이트 성공 테스트"""
-        mock_table = Mock()
-        mock_update = Mock()
-        mock_eq = Mock()
+    def test_get_unprocessed_articles_after_id(self, mock_client, db_ops):
+        """미처리 기사 키셋 페이지 조회 테스트 (after_id 다음 기사부터)"""
+        query = make_query_chain([])
+        mock_client.table.return_value = query
+
+        result = db_ops.get_unprocessed_articles(limit=2, after_id="article-2")
+
+        assert result == []
+        query.gt.assert_called_once_with("id", "article-2")
+        query.limit.assert_called_once_with(2)
+
+    def test_iter_unprocessed_articles_keyset_pagination(self, mock_client, db_ops):
+        """미처리 기사 키셋 페이지네이션 순회 테스트"""
+        mock_limit = mock_client.table.return_value.select.return_value.is_.return_value.order.return_value.limit
+        first_page = mock_limit.return_value
+        second_page = first_page.gt.return_value
+
+        first_page.execute.return_value = make_result([{"id": "article-1"}, {"id": "article-2"}])
+        second_page.execute.return_value = make_result([{"id": "article-3"}])
 
-        mock_client.table.return_value = mock_table
-        mock_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_eq
-        mock_eq.execute.return_value = Mock(data=[{"id": "article-123"}])
+        result = list(db_ops.iter_unprocessed_articles(batch_size=2))
+
+        assert [row["id"] for row in result] == ["article-1", "article-2", "article-3"]
+        first_page.gt.assert_called_once_with("id", "article-2")
+        mock_client.table.return_value.select.assert_called_with("id, title, content")
+
+    def test_update_article_score_success(self, mock_client, db_ops):
+        """기사 점수 업데이트 성공 테스트"""
+        query = make_query_chain([{"id": "article-123"}])
+        mock_client.table.return_value = query
 
-        db_ops = DatabaseOperations()
         result = db_ops.update_article_score("article-123", 75, "중간 수준의 낚시성 제목")
 
         assert result is True
+        query.eq.assert_called_once_with("id", "article-123")
 
-    def test_bulk_insert_articles_with_caching(self, mock_client):
+    def test_bulk_insert_articles_with_caching(self, mock_client, db_ops):
         """기자 캐싱이 포함된 배치 삽입 테스트"""
         # get_or_create_journalists_batch Mock
-        with patch.object(DatabaseOperations, "get_or_create_journalists_batch") as mock_batch_journalist:
+        with patch.object(
+            DatabaseOperations, "get_or_create_journalists_batch", autospec=True
+        ) as mock_batch_journalist:
             # 배치 기자 처리 결과
             mock_batch_journalist.return_value = {
-                "홍길동_조선일보": {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"},
-                "김철수_중앙일보": {"id": "journalist-2", "name": "김철수", "publisher": "중앙일보"},
+                ("홍길동", "조선일보"): {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"},
+                ("김철수", "중앙일보"): {"id": "journalist-2", "name": "김철수", "publisher": "중앙일보"},
             }
 
             # 배치 삽입 Mock 설정 (한 번의 호출로 모든 기사 삽입)
-            mock_table = Mock()
-            mock_insert = Mock()
-
-            mock_client.table.return_value = mock_table
-            mock_table.insert.return_value = mock_insert
-            mock_insert.execute.return_value = Mock(
-                data=[
+            mock_table = mock_client.table.return_value
+            mock_insert = mock_table.upsert.return_value
+            mock_insert.execute.return_value = make_result(
+                [
                     {"id": "article-1", "title": "기사 1", "journalist_id": "journalist-1"},
                     {"id": "article-2", "title": "기사 2", "journalist_id": "journalist-2"},
                     {"id": "article-3", "title": "기사 3", "journalist_id": "journalist-1"},
                 ]
             )
 
-            db_ops = DatabaseOperations()
-
             articles = [
-                Article(
-                    title="테스트 기사 제목1입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
-                    journalist_name="홍길동",
-                    publisher="조선일보",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/023/0003123456",
-                ),
-                Article(
-                    title="테스트 기사 제목2입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
+                make_article("테스트 기사 제목1입니다", "https://n.news.naver.com/article/023/0003123456"),
+                make_article(
+                    "테스트 기사 제목2입니다",
+                    "https://n.news.naver.com/article/001/0014123456",
                     journalist_name="김철수",
                     publisher="중앙일보",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/001/0014123456",
-                ),
-                Article(
-                    title="테스트 기사 제목3입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
-                    journalist_name="홍길동",  # 같은 기자 (캐시 활용)
-                    publisher="조선일보",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/023/0003123457",
                 ),
+                # 같은 기자 (캐시 활용)
+                make_article("테스트 기사 제목3입니다", "https://n.news.naver.com/article/023/0003123457"),
             ]
 
             result = db_ops.bulk_insert_articles(articles)
 
             # 결과 검증
-            assert len(result) == 3
-            assert result[0]["id"] == "article-1"
-            assert result[1]["id"] == "article-2"
-            assert result[2]["id"] == "article-3"
+            assert [row["id"] for row in result] == ["article-1", "article-2", "article-3"]
 
             # 배치 기자 처리가 한 번만 호출되었는지 확인
             mock_batch_journalist.assert_called_once()
 
             # 배치 기자 처리에 전달된 고유 기자 조합 확인
-            batch_call_args = mock_batch_journalist.call_args[0][0]  # 첫 번째 인수
+            batch_call_args = mock_batch_journalist.call_args[0][1]  # self 다음 첫 번째 인수
             assert len(batch_call_args) == 2  # 고유 기자 조합 수: 홍길동+조선일보, 김철수+중앙일보
             assert ("홍길동", "조선일보") in batch_call_args
             assert ("김철수", "중앙일보") in batch_call_args
 
-            # 배치 삽입이 한 번만 호출되었는지 확인
-            mock_table.insert.assert_called_once()
+            # 배치 삽입이 한 번만 호출되었는지 확인 (기존 URL은 ON CONFLICT DO NOTHING)
+            mock_table.upsert.assert_called_once()
+            assert mock_table.upsert.call_args[1] == {"on_conflict": "naver_url", "ignore_duplicates": True}
 
             # 배치 삽입에 전달된 데이터 검증
-            insert_call_args = mock_table.insert.call_args[0][0]  # 첫 번째 인수
-            assert len(insert_call_args) == 3  # 3개 기사 데이터
+            inserted_rows = mock_table.upsert.call_args.args[0]
+
+            # 각 기사에 올바른 기자 ID가 설정되었는지 확인 (홍길동, 김철수, 홍길동)
+            assert [row["journalist_id"] for row in inserted_rows] == ["journalist-1", "journalist-2", "journalist-1"]
+
+    def test_bulk_insert_articles_chunked(self, mock_client, db_ops):
+        """대량 기사 배치 삽입 시 청크 분할 테스트"""
+        with patch.object(
+            DatabaseOperations, "get_or_create_journalists_batch", autospec=True
+        ) as mock_batch_journalist:
+            mock_batch_journalist.return_value = {
+                ("홍길동", "조선일보"): {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"}
+            }
+
+            mock_insert = mock_client.table.return_value.upsert
+            mock_insert.return_value.execute.side_effect = lambda: make_result(
+                [{"id": "article"}] * len(mock_insert.call_args[0][0])
+            )
+
+            articles = [
+                make_article("테스트 기사 제목입니다", f"https://n.news.naver.com/article/023/{i:010d}")
+                for i in range(501)
+            ]
 
-            # 각 기사에 올바른 기자 ID가 설정되었는지 확인
-            assert insert_call_args[0]["journalist_id"] == "journalist-1"  # 홍길동
-            assert insert_call_args[1]["journalist_id"] == "journalist-2"  # 김철수
-            assert insert_call_args[2]["journalist_id"] == "journalist-1"  # 홍길동 (배치 처리로 동일 ID)
+            result = db_ops.bulk_insert_articles(articles)
 
-    def test_bulk_insert_articles_empty_list(self, mock_client):
+            assert len(result) == 501
+            assert mock_insert.call_count == 2
+            assert len(mock_insert.call_args_list[0][0][0]) == 500
+            assert len(mock_insert.call_args_list[1][0][0]) == 1
+
+    def test_bulk_insert_articles_skips_duplicates(self, mock_client, db_ops):
+        """배치 내 중복 URL 제외 및 기존 기사 충돌 무시 테스트"""
+        with patch.object(
+            DatabaseOperations, "get_or_create_journalists_batch", autospec=True
+        ) as mock_batch_journalist:
+            mock_batch_journalist.return_value = {
+                ("홍길동", "조선일보"): {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"}
+            }
+
+            mock_table = mock_client.table.return_value
+            # DB에 이미 존재하는 기사는 충돌로 무시되어 반환되지 않음
+            mock_table.upsert.return_value.execute.return_value = make_result([{"id": "article-1"}])
+
+            articles = [
+                make_article("테스트 기사 제목입니다", url)
+                for url in [
+                    "https://n.news.naver.com/article/023/0003123456",
+                    "https://n.news.naver.com/mnews/article/023/0003123456",  # 배치 내 중복
+                    "https://n.news.naver.com/article/023/0003123457",  # DB에 이미 존재
+                ]
+            ]
+
+            result = db_ops.bulk_insert_articles(articles)
+
+            assert len(result) == 1
+            mock_table.select.assert_not_called()
+            inserted = mock_table.upsert.call_args[0][0]
+            assert [row["naver_url"] for row in inserted] == [
+                "https://n.news.naver.com/article/023/0003123456",
+                "https://n.news.naver.com/article/023/0003123457",
+            ]
+
+    def test_bulk_insert_articles_empty_list(self, mock_client, db_ops):
         """빈 기사 리스트 배치 삽입 테스트"""
-        db_ops = DatabaseOperations()
         result = db_ops.bulk_insert_articles([])
 
         assert result == []
 
-    def test_bulk_insert_articles_partial_failure(self, mock_client):
+    def test_bulk_insert_articles_partial_failure(self, mock_client, db_ops):
         """배치 삽입 실패 시 개별 삽입 폴백 테스트"""
         # get_or_create_journalists_batch Mock
-        with patch.object(DatabaseOperations, "get_or_create_journalists_batch") as mock_batch_journalist:
+        with patch.object(
+            DatabaseOperations, "get_or_create_journalists_batch", autospec=True
+        ) as mock_batch_journalist:
             mock_batch_journalist.return_value = {
-                "홍길동_조선일보": {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"}
+                ("홍길동", "조선일보"): {"id": "journalist-1", "name": "홍길동", "publisher": "조선일보"}
             }
 
             # 배치 삽입 Mock 설정 - 첫 번째 시도는 실패
-            mock_table = Mock()
-            mock_insert = Mock()
-
-            mock_client.table.return_value = mock_table
-            mock_table.insert.return_value = mock_insert
+            mock_table = mock_client.table.return_value
 
             # 배치 삽입은 실패하고, 폴백에서 개별 처리
-            mock_insert.execute.side_effect = [
-                Exception("배치 삽입 실패"),  # 첫 번째 배치 삽입 실패
-                Mock(data=[{"id": "article-1", "title": "기사 1"}]),  # 개별 삽입 1번째 성공
-                Exception("개별 삽입 실패"),  # 개별 삽입 2번째 실패
-                Mock(data=[{"id": "article-3", "title": "기사 3"}]),  # 개별 삽입 3번째 성공
-            ]
+            mock_table.upsert.return_value.execute.side_effect = Exception("배치 삽입 실패")
+
+            # 개별 삽입은 동시에 실행되므로 호출 순서 대신 기사 URL로 결과 지정
+            insert_results = {
+                "0003123456": make_result([{"id": "article-1", "title": "기사 1"}]),  # 개별 삽입 1번째 성공
+                "0003123457": Exception("개별 삽입 실패"),  # 개별 삽입 2번째 실패
+                "0003123458": make_result([{"id": "article-3", "title": "기사 3"}]),  # 개별 삽입 3번째 성공
+            }
+            mock_table.insert.side_effect = lambda row: Mock(
+                execute=Mock(side_effect=[insert_results[row["naver_url"].rsplit("/", 1)[-1]]])
+            )
 
             # 폴백에서 사용할 개별 기자 조회/생성 Mock (이제는 호출되지 않아야 함)
-            with patch.object(DatabaseOperations, "get_or_create_journalist") as mock_individual_journalist:
+            with patch.object(
+                DatabaseOperations, "get_or_create_journalist", autospec=True
+            ) as mock_individual_journalist:
                 mock_individual_journalist.return_value = {
                     "id": "journalist-1",
                     "name": "홍길동",
                     "publisher": "조선일보",
                 }
 
-                db_ops = DatabaseOperations()
-
                 articles = [
-                    Article(
-                        title="테스트 기사 제목1입니다",
-                        content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
-                        journalist_name="홍길동",
-                        publisher="조선일보",
-                        published_at=datetime.now(),
-                        naver_url="https://n.news.naver.com/article/023/0003123456",
-                    ),
-                    Article(
-                        title="테스트 기사 제목2입니다",
-                        content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
-                        journalist_name="홍길동",
-                        publisher="조선일보",
-                        published_at=datetime.now(),
-                        naver_url="https://n.news.naver.com/article/023/0003123457",
-                    ),
-                    Article(
-                        title="테스트 기사 제목3입니다",
-                        content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다. 더 추가해보겠습니다.",
-                        journalist_name="홍길동",
-                        publisher="조선일보",
-                        published_at=datetime.now(),
-                        naver_url="https://n.news.naver.com/article/023/0003123458",
-                    ),
+                    make_article(
+                        f"테스트 기사 제목{i}입니다", f"https://n.news.naver.com/article/023/{article_id:010d}"
+                    )
+                    for i, article_id in enumerate(range(3123456, 3123459), start=1)
                 ]
 
                 result = db_ops.bulk_insert_articles(articles)
@@ -720,30 +762,11 @@ class TestDatabaseOperations:
                 # 개별 기자 조회가 호출되지 않았는지 확인 (캐시 재사용으로 인해)
                 assert mock_individual_journalist.call_count == 0, "기자 캐시 재사용으로 개별 조회가 발생하지 않아야 함"
 
-    def test_fix_inconsistent_stats_no_issues(self, mock_client):
+    def test_fix_inconsistent_stats_no_issues(self, mock_client, db_ops):
         """통계 불일치가 없는 경우 테스트"""
-        # Mock 설정
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-
-        # 기자 조회 Mock
-        mock_journalists_select = Mock()
-        mock_articles_select = Mock()
-        mock_eq = Mock()
-
-        # table() 호출에 따른 분기
-        def table_side_effect(table_name):
-            if table_name == "journalists":
-                return Mock(select=Mock(return_value=mock_journalists_select))
-            elif table_name == "articles":
-                return Mock(select=Mock(return_value=Mock(eq=Mock(return_value=mock_eq))))
-            return mock_table
-
-        mock_client.table.side_effect = table_side_effect
-
-        # 기자 데이터
-        mock_journalists_select.execute.return_value = Mock(
-            data=[
+        # 기자 데이터와 해당 기자의 기사 데이터 (평균 50, 최대 75)
+        mock_client.table.side_effect = make_stats_table_router(
+            [
                 {
                     "id": "journalist-1",
                     "name": "홍길동",
@@ -752,43 +775,21 @@ class TestDatabaseOperations:
                     "avg_clickbait_score": 50.0,
                     "max_score": 75,
                 }
-            ]
+            ],
+            [{"clickbait_score": 25}, {"clickbait_score": 75}],
         )
 
-        # 해당 기자의 기사 데이터 (평균 50, 최대 75)
-        mock_eq.execute.return_value = Mock(data=[{"clickbait_score": 25}, {"clickbait_score": 75}])
-
-        db_ops = DatabaseOperations()
         result = db_ops.fix_inconsistent_stats()
 
         assert result["fixed"] == 0
         assert result["total_checked"] == 1
         assert result["total_inconsistent"] == 0
 
-    def test_fix_inconsistent_stats_with_issues(self, mock_client):
+    def test_fix_inconsistent_stats_with_issues(self, mock_client, db_ops):
         """통계 불일치가 있는 경우 테스트"""
-        # Mock 설정
-        mock_table = Mock()
-        mock_client.table.return_value = mock_table
-
-        # 기자 조회 Mock
-        mock_journalists_select = Mock()
-        mock_articles_select = Mock()
-        mock_eq = Mock()
-
-        # table() 호출에 따른 분기
-        def table_side_effect(table_name):
-            if table_name == "journalists":
-                return Mock(select=Mock(return_value=mock_journalists_select))
-            elif table_name == "articles":
-                return Mock(select=Mock(return_value=Mock(eq=Mock(return_value=mock_eq))))
-            return mock_table
-
-        mock_client.table.side_effect = table_side_effect
-
-        # 기자 데이터 (잘못된 통계)
-        mock_journalists_select.execute.return_value = Mock(
-            data=[
+        # 기자 데이터 (잘못된 통계)와 해당 기자의 실제 기사 데이터
+        mock_client.table.side_effect = make_stats_table_router(
+            [
                 {
                     "id": "journalist-1",
                     "name": "홍길동",
@@ -797,319 +798,266 @@ class TestDatabaseOperations:
                     "avg_clickbait_score": 30.0,  # 실제는 50.0
                     "max_score": 50,  # 실제는 75
                 }
-            ]
+            ],
+            [{"clickbait_score": 25}, {"clickbait_score": 75}],
         )
 
-        # 해당 기자의 실제 기사 데이터
-        mock_eq.execute.return_value = Mock(data=[{"clickbait_score": 25}, {"clickbait_score": 75}])
-
         # update_journalist_stats_manual Mock
-        with patch.object(DatabaseOperations, "update_journalist_stats_manual") as mock_update:
+        with patch.object(DatabaseOperations, "update_journalist_stats_manual", autospec=True) as mock_update:
             mock_update.return_value = True
 
-            db_ops = DatabaseOperations()
             result = db_ops.fix_inconsistent_stats()
 
             assert result["fixed"] == 1
             assert result["total_checked"] == 1
             assert result["total_inconsistent"] == 1
-            mock_update.assert_called_once_with("journalist-1")
+            mock_update.assert_called_once()
+            assert mock_update.call_args[0][1] == "journalist-1"
 
-    def test_fix_inconsistent_stats_empty_database(self, mock_client):
-        """기자가 없는 경우 테스트"""
-        # Mock 설정
-        mock_table = Mock()
-        mock_select = Mock()
+    def test_fix_inconsistent_stats_uses_stats_view(self, mock_client, db_ops):
+        """기자별 통계 뷰 일괄 조회로 불일치 감지 테스트"""
+        mock_journalists_table = Mock()
+        mock_stats_table = Mock()
+        mock_articles_table = Mock()
+        mock_journalists_select = mock_journalists_table.select.return_value
+        mock_stats_select = mock_stats_table.select.return_value
 
-        mock_client.table.return_value = mock_table
-        mock_table.select.return_value = mock_select
-        mock_select.execute.return_value = Mock(data=[])
+        mock_client.table.side_effect = make_table_dispatch(
+            {"journalists": mock_journalists_table, "journalist_article_stats": mock_stats_table},
+            default=mock_articles_table,
+        )
 
-        db_ops = DatabaseOperations()
-        result = db_ops.fix_inconsistent_stats()
+        mock_journalists_select.execute.return_value = make_result(
+            [
+                {
+                    "id": "journalist-1",
+                    "name": "홍길동",
+                    "publisher": "조선일보",
+                    "article_count": 12,
+                    "avg_clickbait_score": 80.5,
+                    "max_score": 95,
+                },
+                {
+                    "id": "journalist-2",
+                    "name": "김철수",
+                    "publisher": "중앙일보",
+                    "article_count": 3,
+                    "avg_clickbait_score": 0.0,
+                    "max_score": 0,
+                },
+            ]
+        )
+        mock_stats_select.execute.return_value = make_result(
+            [
+                {"journalist_id": "journalist-1", "article_count": 12, "avg_clickbait_score": 80.5, "max_score": 95},
+            ]
+        )
 
-        assert result["fixed"] == 0
-        assert result["total_checked"] == 0
+        with patch.object(DatabaseOperations, "update_journalist_stats_manual", autospec=True) as mock_update:
+            mock_update.return_value = True
 
-    def test_avg_clickbait_score_calculation_less_than_10_articles(self, mock_client):
-        """기사 수가 10개 미만일 때 avg_clickbait_score 계산 테스트"""
-        # Mock 설정
-        mock_articles_table = Mock()
-        mock_journalists_table = Mock()
-        mock_select = Mock()
-        mock_eq = Mock()
-        mock_update = Mock()
-        mock_update_eq = Mock()
+            result = db_ops.fix_inconsistent_stats()
 
-        # table() 호출에 따른 분기
-        def table_side_effect(table_name):
-            if table_name == "articles":
-                return mock_articles_table
-            elif table_name == "journalists":
-                return mock_journalists_table
-            return Mock()
+            assert result["total_checked"] == 2
+            assert result["total_inconsistent"] == 1
+            assert mock_update.call_args[0][1] == "journalist-2"
+            mock_articles_table.select.assert_not_called()
 
-        mock_client.table.side_effect = table_side_effect
+            # 불일치 점검에 필요한 컬럼만 조회
+            mock_journalists_table.select.assert_called_once_with(
+                "id, name, publisher, article_count, avg_clickbait_score, max_score"
+            )
+            mock_stats_table.select.assert_called_once_with(
+                "journalist_id, article_count, avg_clickbait_score, max_score"
+            )
 
-        # Articles 테이블 Mock (기사 조회)
-        mock_articles_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-
-        # Journalists 테이블 Mock (기자 업데이트)
-        mock_journalists_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update_eq
-
-        # 5개 기사의 clickbait_score: [90, 80, 70, 60, 50]
-        # 모든 기사의 평균: (90+80+70+60+50)/5 = 70.0
-        mock_articles_result = Mock()
-        mock_articles_result.data = [
-            {"clickbait_score": 90},
-            {"clickbait_score": 80},
-            {"clickbait_score": 70},
-            {"clickbait_score": 60},
-            {"clickbait_score": 50},
-        ]
-        mock_eq.execute.return_value = mock_articles_result
+    def test_compute_journalist_stats_top_10_average(self):
+        """상위 10개 기사 평균 기준 통계 계산 테스트"""
+        scores = [None, 5] + list(range(10, 130, 10))
 
-        mock_update_result = Mock()
-        mock_update_result.data = [{"id": "test-journalist"}]
-        mock_update_eq.execute.return_value = mock_update_result
+        count, avg, max_score = DatabaseOperations._compute_journalist_stats(scores)
 
-        db_ops = DatabaseOperations()
-        result = db_ops.update_journalist_stats_manual("test-journalist")
+        assert count == 14
+        assert avg == 75.0  # 120 ~ 30 상위 10개 평균
+        assert max_score == 120
+        assert DatabaseOperations._compute_journalist_stats([None]) == (1, 0.0, 0)
 
-        assert result is True
+    def test_fix_inconsistent_stats_empty_database(self, mock_client, db_ops):
+        """기자가 없는 경우 테스트"""
+        # Mock 설정
+        mock_client.table.return_value.select.return_value.execute.return_value = make_result([])
 
-        # update 호출 인자 확인
-        call_args = mock_journalists_table.update.call_args[0][0]
-        assert call_args["article_count"] == 5
-        assert call_args["avg_clickbait_score"] == 70.0  # 모든 5개 기사의 평균
-        assert call_args["max_score"] == 90
+        result = db_ops.fix_inconsistent_stats()
 
-    def test_avg_clickbait_score_calculation_more_than_10_articles(self, mock_client):
-        """기사 수가 10개 이상일 때 avg_clickbait_score 계산 테스트 (상위 10개 평균)"""
-        # Mock 설정
-        mock_articles_table = Mock()
-        mock_journalists_table = Mock()
-        mock_select = Mock()
-        mock_eq = Mock()
-        mock_update = Mock()
-        mock_update_eq = Mock()
+        assert result["fixed"] == 0
+        assert result["total_checked"] == 0
 
-        # table() 호출에 따른 분기
-        def table_side_effect(table_name):
-            if table_name == "articles":
-                return mock_articles_table
-            elif table_name == "journalists":
-                return mock_journalists_table
-            return Mock()
+    def test_get_journalist_stats_summary_rpc(self, mock_client, db_ops):
+        """통계 요약 RPC 단일 호출 테스트"""
+        mock_client.rpc.return_value.execute.return_value = make_result(
+            {
+                "total_journalists": 10,
+                "active_journalists": 8,
+                "scored_journalists": 5,
+                "total_articles": 100,
+                "scored_articles": 70,
+            }
+        )
 
-        mock_client.table.side_effect = table_side_effect
+        result = db_ops.get_journalist_stats_summary()
 
-        # Articles 테이블 Mock (기사 조회)
-        mock_articles_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-
-        # Journalists 테이블 Mock (기자 업데이트)
-        mock_journalists_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update_eq
-
-        # 15개 기사의 clickbait_score: [95,90,85,80,75,70,65,60,55,50,45,40,35,30,25]
-        # 상위 10개의 평균: (95+90+85+80+75+70+65+60+55+50)/10 = 72.5
-        mock_articles_result = Mock()
-        mock_articles_result.data = [
-            {"clickbait_score": 95},
-            {"clickbait_score": 90},
-            {"clickbait_score": 85},
-            {"clickbait_score": 80},
-            {"clickbait_score": 75},
-            {"clickbait_score": 70},
-            {"clickbait_score": 65},
-            {"clickbait_score": 60},
-            {"clickbait_score": 55},
-            {"clickbait_score": 50},
-            {"clickbait_score": 45},
-            {"clickbait_score": 40},
-            {"clickbait_score": 35},
-            {"clickbait_score": 30},
-            {"clickbait_score": 25},
-        ]
-        mock_eq.execute.return_value = mock_articles_result
+        mock_client.rpc.assert_called_once_with("journalist_stats_summary")
+        mock_client.table.assert_not_called()
+        assert result["total_journalists"] == 10
+        assert result["pending_articles"] == 30
 
-        mock_update_result = Mock()
-        mock_update_result.data = [{"id": "test-journalist"}]
-        mock_update_eq.execute.return_value = mock_update_result
+    def test_get_journalist_stats_summary_rpc_fallback(self, mock_client, db_ops):
+        """RPC 실패 시 개별 카운트 쿼리 폴백 테스트"""
+        mock_client.rpc.side_effect = Exception("function not found")
 
-        db_ops = DatabaseOperations()
-        result = db_ops.update_journalist_stats_manual("test-journalist")
+        count_result = CountResult([], 4)
+        mock_select = mock_client.table.return_value.select.return_value
+        mock_select.execute.return_value = count_result
+        mock_select.gt.return_value.execute.return_value = count_result
+        mock_select.not_.is_.return_value.execute.return_value = CountResult([], 3)
 
-        assert result is True
+        result = db_ops.get_journalist_stats_summary()
 
-        # update 호출 인자 확인
-        call_args = mock_journalists_table.update.call_args[0][0]
-        assert call_args["article_count"] == 15
-        assert call_args["avg_clickbait_score"] == 72.5  # 상위 10개 기사의 평균
-        assert call_args["max_score"] == 95
+        assert result["total_journalists"] == 4
+        assert result["scored_articles"] == 3
+        assert result["pending_articles"] == 1
 
-    def test_avg_clickbait_score_calculation_with_null_scores(self, mock_client):
-        """null clickbait_score가 포함된 경우 테스트"""
-        # Mock 설정
+    @pytest.fixture
+    def stats_tables(self, mock_client):
+        """update_journalist_stats_manual용 articles/journalists 테이블 Mock 픽스처"""
         mock_articles_table = Mock()
         mock_journalists_table = Mock()
-        mock_select = Mock()
-        mock_eq = Mock()
-        mock_update = Mock()
-        mock_update_eq = Mock()
 
-        # table() 호출에 따른 분기
-        def table_side_effect(table_name):
-            if table_name == "articles":
-                return mock_articles_table
-            elif table_name == "journalists":
-                return mock_journalists_table
-            return Mock()
-
-        mock_client.table.side_effect = table_side_effect
-
-        # Articles 테이블 Mock (기사 조회)
-        mock_articles_table.select.return_value = mock_select
-        mock_select.eq.return_value = mock_eq
-
-        # Journalists 테이블 Mock (기자 업데이트)
-        mock_journalists_table.update.return_value = mock_update
-        mock_update.eq.return_value = mock_update_eq
-
-        # 12개 기사 중 3개는 null, 9개는 점수 있음
-        # 점수 있는 9개: [95,90,85,80,75,70,65,60,55] - 모든 점수 사용 (10개 미만)
-        # 평균: (95+90+85+80+75+70+65+60+55)/9 = 75.0
-        mock_articles_result = Mock()
-        mock_articles_result.data = [
-            {"clickbait_score": 95},
-            {"clickbait_score": 90},
-            {"clickbait_score": 85},
-            {"clickbait_score": 80},
-            {"clickbait_score": 75},
-            {"clickbait_score": 70},
-            {"clickbait_score": 65},
-            {"clickbait_score": 60},
-            {"clickbait_score": 55},
-            {"clickbait_score": None},
-            {"clickbait_score": None},
-            {"clickbait_score": None},
-        ]
-        mock_eq.execute.return_value = mock_articles_result
-
-        mock_update_result = Mock()
-        mock_update_result.data = [{"id": "test-journalist"}]
-        mock_update_eq.execute.return_value = mock_update_result
+        mock_client.table.side_effect = make_table_dispatch(
+            {"articles": mock_articles_table, "journalists": mock_journalists_table}
+        )
+        mock_journalists_table.update.return_value.eq.return_value.execute.return_value = make_result(
+            [{"id": "test-journalist"}]
+        )
+        return mock_articles_table, mock_journalists_table
+
+    @pytest.mark.parametrize(
+        "scores, expected_count, expected_avg, expected_max",
+        [
+            # 10개 미만: 모든 기사의 평균 (90+80+70+60+50)/5 = 70.0
+            ([90, 80, 70, 60, 50], 5, 70.0, 90),
+            # 10개 이상: 상위 10개의 평균 (95+90+...+50)/10 = 72.5
+            (list(range(95, 20, -5)), 15, 72.5, 95),
+            # null 포함: 기사 수는 null 포함 12개, 평균은 점수 있는 9개 (95+...+55)/9 = 75.0
+            (list(range(95, 50, -5)) + [None, None, None], 12, 75.0, 95),
+        ],
+        ids=["less_than_10_articles", "more_than_10_articles", "with_null_scores"],
+    )
+    def test_avg_clickbait_score_calculation(
+        self, stats_tables, db_ops, scores, expected_count, expected_avg, expected_max
+    ):
+        """update_journalist_stats_manual의 avg_clickbait_score 계산 테스트 (상위 10개 평균)"""
+        mock_articles_table, mock_journalists_table = stats_tables
+        mock_articles_table.select.return_value.eq.return_value.execute.return_value = make_result(
+            [{"clickbait_score": score} for score in scores]
+        )
 
-        db_ops = DatabaseOperations()
         result = db_ops.update_journalist_stats_manual("test-journalist")
 
         assert result is True
 
+        # 통계 계산에 필요한 점수 컬럼만 조회
+        mock_articles_table.select.assert_called_once_with("clickbait_score")
+
         # update 호출 인자 확인
         call_args = mock_journalists_table.update.call_args[0][0]
-        assert call_args["article_count"] == 12  # 전체 기사 수 (null 포함)
-        assert call_args["avg_clickbait_score"] == 75.0  # 점수 있는 9개 기사의 평균
-        assert call_args["max_score"] == 95
+        assert call_args["article_count"] == expected_count
+        assert call_args["avg_clickbait_score"] == expected_avg
+        assert call_args["max_score"] == expected_max
 
-    def test_bulk_insert_articles_with_anonymous_journalist_normalization(self, mock_client):
+    def test_bulk_insert_articles_with_anonymous_journalist_normalization(self, mock_client, db_ops):
         """익명 기자 정규화가 포함된 배치 삽입 테스트"""
         # get_or_create_journalists_batch Mock
-        with patch.object(DatabaseOperations, "get_or_create_journalists_batch") as mock_batch_journalist:
+        with patch.object(
+            DatabaseOperations, "get_or_create_journalists_batch", autospec=True
+        ) as mock_batch_journalist:
             # 배치 기자 처리 결과 - 정규화된 이름으로 저장
             mock_batch_journalist.return_value = {
-                "익명기자_조선일보_조선일보": {
+                ("익명기자_조선일보", "조선일보"): {
                     "id": "journalist-anon-1",
                     "name": "익명기자_조선일보",
                     "publisher": "조선일보",
                 },
-                "익명기자_중앙일보_중앙일보": {
+                ("익명기자_중앙일보", "중앙일보"): {
                     "id": "journalist-anon-2",
                     "name": "익명기자_중앙일보",
                     "publisher": "중앙일보",
                 },
-                "홍길동_한겨레": {"id": "journalist-3", "name": "홍길동", "publisher": "한겨레"},
+                ("홍길동", "한겨레"): {"id": "journalist-3", "name": "홍길동", "publisher": "한겨레"},
             }
 
             # 배치 삽입 Mock 설정
-            mock_table = Mock()
-            mock_insert = Mock()
-
-            mock_client.table.return_value = mock_table
-            mock_table.insert.return_value = mock_insert
-            mock_insert.execute.return_value = Mock(
-                data=[
+            mock_table = mock_client.table.return_value
+            mock_insert = mock_table.upsert.return_value
+            mock_insert.execute.return_value = make_result(
+                [
                     {"id": "article-1", "title": "기사 1", "journalist_id": "journalist-anon-1"},
                     {"id": "article-2", "title": "기사 2", "journalist_id": "journalist-anon-2"},
                     {"id": "article-3", "title": "기사 3", "journalist_id": "journalist-3"},
                 ]
             )
 
-            db_ops = DatabaseOperations()
-
             # 다양한 익명 기자 케이스 테스트
             articles = [
-                Article(
-                    title="테스트 기사 제목1입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다.",
-                    journalist_name="",  # 빈 문자열 -> 익명기자_조선일보로 정규화
-                    publisher="조선일보",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/023/0003123456",
+                # 빈 문자열 -> 익명기자_조선일보로 정규화
+                make_article(
+                    "테스트 기사 제목1입니다", "https://n.news.naver.com/article/023/0003123456", journalist_name=""
                 ),
-                Article(
-                    title="테스트 기사 제목2입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다.",
-                    journalist_name="익명",  # 익명 -> 익명기자_중앙일보로 정규화
+                # 익명 -> 익명기자_중앙일보로 정규화
+                make_article(
+                    "테스트 기사 제목2입니다",
+                    "https://n.news.naver.com/article/001/0014123456",
+                    journalist_name="익명",
                     publisher="중앙일보",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/001/0014123456",
                 ),
-                Article(
-                    title="테스트 기사 제목3입니다",
-                    content="이것은 테스트 기사 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자를 충분히 넘겼을 것입니다.",
-                    journalist_name="홍길동",  # 정상 기자명
-                    publisher="한겨레",
-                    published_at=datetime.now(),
-                    naver_url="https://n.news.naver.com/article/028/0002123456",
+                # 정상 기자명
+                make_article(
+                    "테스트 기사 제목3입니다", "https://n.news.naver.com/article/028/0002123456", publisher="한겨레"
                 ),
             ]
 
             result = db_ops.bulk_insert_articles(articles)
 
             # 결과 검증
-            assert len(result) == 3
-            assert result[0]["id"] == "article-1"
-            assert result[1]["id"] == "article-2"
-            assert result[2]["id"] == "article-3"
+            assert [row["id"] for row in result] == ["article-1", "article-2", "article-3"]
 
             # 배치 기자 처리가 한 번만 호출되었는지 확인
             mock_batch_journalist.assert_called_once()
 
             # 배치 기자 처리에 전달된 고유 기자 조합 확인
-            batch_call_args = mock_batch_journalist.call_args[0][0]  # 첫 번째 인수
+            batch_call_args = mock_batch_journalist.call_args[0][1]  # self 다음 첫 번째 인수
             assert len(batch_call_args) == 3
             assert ("", "조선일보") in batch_call_args  # 빈 문자열 그대로 전달
             assert ("익명", "중앙일보") in batch_call_args  # 익명 그대로 전달
             assert ("홍길동", "한겨레") in batch_call_args
 
             # 배치 삽입이 한 번만 호출되었는지 확인
-            mock_table.insert.assert_called_once()
+            mock_table.upsert.assert_called_once()
 
             # 배치 삽입에 전달된 데이터 검증
-            insert_call_args = mock_table.insert.call_args[0][0]  # 첫 번째 인수
-            assert len(insert_call_args) == 3
+            inserted_rows = mock_table.upsert.call_args.args[0]
 
-            # 각 기사에 올바른 기자 ID가 설정되었는지 확인
-            assert insert_call_args[0]["journalist_id"] == "journalist-anon-1"  # 익명기자_조선일보
-            assert insert_call_args[1]["journalist_id"] == "journalist-anon-2"  # 익명기자_중앙일보
-            assert insert_call_args[2]["journalist_id"] == "journalist-3"  # 홍길동
+            # 각 기사에 올바른 기자 ID가 설정되었는지 확인 (익명기자_조선일보, 익명기자_중앙일보, 홍길동)
+            assert [row["journalist_id"] for row in inserted_rows] == [
+                "journalist-anon-1",
+                "journalist-anon-2",
+                "journalist-3",
+            ]
 
-    def test_get_or_create_journalists_batch_large_dataset_chunking(self, mock_client):
-        """대량 데이터셋에서 청크 처리 테스트"""
+    def test_get_or_create_journalists_batch_large_dataset_chunking(self, mock_client, db_ops):
+        """대량 데이터셋에서 청크 처리 테스트 (RPC 미적용 시 조회 후 생성 폴백)"""
         # Mock 설정
+        mock_client.rpc.side_effect = Exception("function not found")
         mock_table = Mock()
         mock_insert = Mock()
 
@@ -1128,7 +1076,7 @@ class TestDatabaseOperations:
             # 체인 설정: table().select().in_().in_().execute()
             mock_select.in_.return_value = mock_in_name
             mock_in_name.in_.return_value = mock_in_publisher
-            mock_in_publisher.execute.return_value = Mock(data=[])  # 빈 결과 (모두 신규)
+            mock_in_publisher.execute.return_value = make_result([])  # 빈 결과 (모두 신규)
 
             chunk_query_results.append(mock_select)
 
@@ -1161,11 +1109,10 @@ class TestDatabaseOperations:
                 {"id": f"journalist-{j}", "name": f"기자{j}", "publisher": f"언론사{j % 10}"}
                 for j in range(chunk_start, chunk_end)
             ]
-            created_data.append(Mock(data=chunk_data))
+            created_data.append(make_result(chunk_data))
 
         mock_insert.execute.side_effect = created_data
 
-        db_ops = DatabaseOperations()
         result = db_ops.get_or_create_journalists_batch(journalist_specs)
 
         # 모든 기자가 결과에 포함되어야 함
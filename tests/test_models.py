@@ -10,89 +10,79 @@ from src.models.article import Article, Journalist
 class TestArticle:
     """Article 모델 테스트"""
 
-    def test_valid_article_creation(self):
+    @pytest.fixture(scope="class")
+    def valid_article_kwargs(self):
+        """검증을 통과하는 Article 생성 인자 (테스트마다 필요한 필드만 덮어씀)"""
+        return {
+            "title": "이것은 유효한 제목입니다",
+            "content": "이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
+            "journalist_name": "홍길동",
+            "publisher": "조선일보",
+            "published_at": datetime(2024, 1, 1, 9, 0),
+            "naver_url": "https://n.news.naver.com/article/023/0003123456",
+        }
+
+    def test_valid_article_creation(self, valid_article_kwargs):
         """유효한 기사 생성 테스트"""
-        article = Article(
-            title="이것은 유효한 제목입니다",
-            content="이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
-            journalist_name="홍길동",
-            publisher="조선일보",
-            published_at=datetime.now(),
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-        )
+        article = Article(**valid_article_kwargs)
 
         assert article.title == "이것은 유효한 제목입니다"
         assert article.journalist_name == "홍길동"
         assert article.publisher == "조선일보"
 
-    def test_short_title_validation(self):
+    def test_short_title_validation(self, valid_article_kwargs):
         """짧은 제목 검증 테스트"""
         with pytest.raises(ValueError, match="제목은 최소 9자 이상이어야 합니다"):
-            Article(
-                title="짧은제목",
-                content="이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
-                journalist_name="홍길동",
-                publisher="조선일보",
-                published_at=datetime.now(),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
-            )
+            Article(**{**valid_article_kwargs, "title": "짧은제목"})
 
-    def test_short_content_validation(self):
+    def test_short_content_validation(self, valid_article_kwargs):
         """짧은 내용 검증 테스트"""
         with pytest.raises(ValueError, match="내용은 최소 100자 이상이어야 합니다"):
-            Article(
-                title="이것은 유효한 제목입니다",
-                content="짧은내용",
-                journalist_name="홍길동",
-                publisher="조선일보",
-                published_at=datetime.now(),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
-            )
+            Article(**{**valid_article_kwargs, "content": "짧은내용"})
 
-    def test_invalid_url_validation(self):
+    def test_invalid_url_validation(self, valid_article_kwargs):
         """유효하지 않은 URL 검증 테스트"""
         with pytest.raises(ValueError, match="유효하지 않은 네이버 뉴스 URL입니다"):
-            Article(
-                title="이것은 유효한 제목입니다",
-                content="이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
-                journalist_name="홍길동",
-                publisher="조선일보",
-                published_at=datetime.now(),
-                naver_url="https://invalid-url.com",
-            )
+            Article(**{**valid_article_kwargs, "naver_url": "https://invalid-url.com"})
 
-    def test_clickbait_score_validation(self):
+    def test_clickbait_score_validation(self, valid_article_kwargs):
         """낚시 점수 검증 테스트"""
         with pytest.raises(ValueError, match="낚시 점수는 0-100 사이의 값이어야 합니다"):
-            Article(
-                title="이것은 유효한 제목입니다",
-                content="이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
-                journalist_name="홍길동",
-                publisher="조선일보",
-                published_at=datetime.now(),
-                naver_url="https://n.news.naver.com/article/023/0003123456",
-                clickbait_score=101,
-            )
+            Article(**valid_article_kwargs, clickbait_score=101)
 
-    def test_to_dict_conversion(self):
+    def test_to_dict_conversion(self, valid_article_kwargs):
         """딕셔너리 변환 테스트"""
-        published_at = datetime.now()
-        article = Article(
-            title="이것은 유효한 제목입니다",
-            content="이것은 유효한 내용입니다. 최소 100자 이상이어야 하므로 더 길게 작성해보겠습니다. 테스트용 내용입니다. 충분히 긴 내용이 되도록 추가 텍스트를 넣어보겠습니다. 이제 100자가 넘었을 것입니다.",
-            journalist_name="홍길동",
-            publisher="조선일보",
-            published_at=published_at,
-            naver_url="https://n.news.naver.com/article/023/0003123456",
-            clickbait_score=75,
-        )
+        article = Article(**valid_article_kwargs, clickbait_score=75)
 
         result = article.to_dict()
 
         assert result["title"] == "이것은 유효한 제목입니다"
         assert result["publisher"] == "조선일보"
         assert result["clickbait_score"] == 75
-        assert result["published_at"] == published_at.isoformat()
+        assert result["published_at"] == valid_article_kwargs["published_at"].isoformat()
+
+    def test_dedupe_by_url_and_content(self, valid_article_kwargs):
+        """URL 또는 내용 기준 중복 제거 테스트"""
+
+        def make_article(title: str, url_suffix: str) -> Article:
+            return Article(
+                **{
+                    **valid_article_kwargs,
+                    "title": title,
+                    "naver_url": f"https://n.news.naver.com/article/023/{url_suffix}",
+                }
+            )
+
+        first = make_article("이것은 유효한 제목입니다", "0003123456")
+        same_url = make_article("이것은 다른 제목입니다", "0003123456")
+        same_content = make_article("이것은 유효한 제목입니다", "0003123457")
+        unique = make_article("이것은 새로운 제목입니다", "0003123458")
+
+        result = Article.dedupe([first, same_url, same_content, unique])
+
+        assert result == [first, unique]
+        assert result[0] is first
+        assert hash(first) == hash(same_url)
 
 
 class TestJournalist: